@@ -0,0 +1,186 @@
+"""
+Measure MatillionClient throughput and tail latency against a local mock server.
+
+Each scenario issues the same number of calls serially, from a thread pool and,
+when aiohttp is installed, from AsyncMatillionClient. Results are printed as a
+table, or as JSON lines with --json for comparison between commits.
+
+Usage:
+    python benchmarks/bench_client.py --requests 2000 --concurrency 16 --latency 5
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from mock_server import MockMatillionServer
+
+from pymatillion.matillion import MatillionClient
+
+GROUP = "Sample_Project_Group_1"
+PROJECT = "Sample_Project_1"
+SCENARIOS = {
+    "run_job": lambda client: client.run_job("Sample_Job_1"),
+    "get_task_details": lambda client: client.get_task_details(1),
+    "list_jobs": lambda client: client.list_jobs(),
+    "list_projects": lambda client: client.list_projects(),
+}
+
+
+def percentile(ordered, value):
+    return ordered[max(0, math.ceil(value / 100 * len(ordered)) - 1)]
+
+
+def timed(call, client):
+    started_at = time.perf_counter()
+    try:
+        call(client)
+        return time.perf_counter() - started_at, False
+    except Exception:
+        return time.perf_counter() - started_at, True
+
+
+async def timed_async(call, client):
+    started_at = time.perf_counter()
+    try:
+        await call(client)
+        return time.perf_counter() - started_at, False
+    except Exception:
+        return time.perf_counter() - started_at, True
+
+
+def run_serial(client, call, requests, concurrency):
+    return [timed(call, client) for _ in range(requests)]
+
+
+def run_threaded(client, call, requests, concurrency):
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        return list(executor.map(lambda _: timed(call, client), range(requests)))
+
+
+def run_async(base_url, call, requests, concurrency):
+    from pymatillion.async_matillion import AsyncMatillionClient
+
+    async def main():
+        async with AsyncMatillionClient(
+            base_url,
+            "user",
+            "password",
+            GROUP,
+            PROJECT,
+            pool_maxsize=concurrency,
+            max_concurrency=concurrency,
+        ) as client:
+            # Queue outside the timed call so latencies match the thread pool's.
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def bounded_call():
+                async with semaphore:
+                    return await timed_async(call, client)
+
+            return await asyncio.gather(*(bounded_call() for _ in range(requests)))
+
+    return asyncio.run(main())
+
+
+def report(scenario, mode, samples, elapsed, as_json):
+    ordered = sorted(latency for latency, _ in samples)
+    result = {
+        "scenario": scenario,
+        "mode": mode,
+        "requests": len(samples),
+        "errors": sum(error for _, error in samples),
+        "throughput": len(samples) / elapsed,
+        "p50_ms": percentile(ordered, 50) * 1000,
+        "p95_ms": percentile(ordered, 95) * 1000,
+        "p99_ms": percentile(ordered, 99) * 1000,
+    }
+    if as_json:
+        print(json.dumps(result))
+    else:
+        print(
+            f"{scenario:<18} {mode:<9} {result['requests']:>8} {result['errors']:>7}"
+            f" {result['throughput']:>10.0f} {result['p50_ms']:>8.2f}"
+            f" {result['p95_ms']:>8.2f} {result['p99_ms']:>8.2f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--latency", type=float, default=0, help="milliseconds")
+    parser.add_argument("--latency-jitter", type=float, default=0, help="milliseconds")
+    parser.add_argument("--error-rate", type=float, default=0)
+    parser.add_argument("--jobs", type=int, default=100)
+    parser.add_argument("--components", type=int, default=10)
+    parser.add_argument(
+        "--scenario", action="append", choices=sorted(SCENARIOS), dest="scenarios"
+    )
+    parser.add_argument(
+        "--mode",
+        action="append",
+        choices=["serial", "threaded", "async"],
+        dest="modes",
+    )
+    parser.add_argument(
+        "--no-keep-alive",
+        action="store_true",
+        help="Open a new connection per request, for comparison with pooling.",
+    )
+    parser.add_argument("--json", action="store_true", help="Print JSON lines.")
+    args = parser.parse_args()
+    # Injected errors are counted in the report rather than logged.
+    logging.getLogger("pymatillion").setLevel(logging.CRITICAL)
+
+    modes = args.modes or ["serial", "threaded", "async"]
+    if "async" in modes:
+        try:
+            import aiohttp  # noqa: F401
+        except ImportError:
+            print("aiohttp is not installed, skipping async runs")
+            modes.remove("async")
+
+    with MockMatillionServer(
+        latency=args.latency,
+        latency_jitter=args.latency_jitter,
+        error_rate=args.error_rate,
+        jobs=args.jobs,
+        components=args.components,
+    ) as server:
+        client = MatillionClient(
+            server.base_url,
+            "user",
+            "password",
+            GROUP,
+            PROJECT,
+            pool_maxsize=args.concurrency,
+            keep_alive=not args.no_keep_alive,
+        )
+        if not args.json:
+            print(
+                f"{'scenario':<18} {'mode':<9} {'requests':>8} {'errors':>7}"
+                f" {'req/s':>10} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}"
+            )
+        for scenario in args.scenarios or list(SCENARIOS):
+            call = SCENARIOS[scenario]
+            for mode in modes:
+                started_at = time.perf_counter()
+                if mode == "async":
+                    samples = run_async(
+                        server.base_url, call, args.requests, args.concurrency
+                    )
+                else:
+                    runner = run_serial if mode == "serial" else run_threaded
+                    samples = runner(client, call, args.requests, args.concurrency)
+                elapsed = time.perf_counter() - started_at
+                report(scenario, mode, samples, elapsed, args.json)
+        client.close()
+
+
+if __name__ == "__main__":
+    main()
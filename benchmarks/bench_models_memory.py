@@ -0,0 +1,111 @@
+"""
+Compare the memory held by raw task detail dictionaries and `TaskDetails` models.
+
+Usage:
+    python benchmarks/bench_models_memory.py --tasks 20000 --components 5
+"""
+
+import argparse
+import gc
+import json
+import tracemalloc
+
+from pymatillion.models import TaskDetails
+
+STATES = ["SUCCESS", "FAILED", "RUNNING", "QUEUED"]
+
+
+def synthetic_task_payloads(tasks: int, components: int):
+    """Serialized task details, decoded one by one as a client would."""
+    for task_id in range(tasks):
+        yield json.dumps(
+            {
+                "id": task_id,
+                "type": "RUN_ORCHESTRATION",
+                "customerID": 793,
+                "groupName": "Sample_Project_Group_1",
+                "projectID": 795,
+                "projectName": "Sample_Project_1",
+                "versionID": 796,
+                "versionName": "default",
+                "jobID": 827 + task_id % 50,
+                "jobName": f"Sample_Job_{task_id % 50}",
+                "environmentID": 799,
+                "environmentName": "test",
+                "state": STATES[task_id % len(STATES)],
+                "enqueuedTime": 1594729190954 + task_id,
+                "startTime": 1594729190955 + task_id,
+                "endTime": 1594729201024 + task_id,
+                "message": None,
+                "originatorID": f"ws_61498_{task_id}",
+                "rowCount": 0,
+                "tasks": [
+                    {
+                        "taskID": component_id,
+                        "parentID": -1,
+                        "type": "VALIDATE_ORCHESTRATION",
+                        "jobID": 827,
+                        "jobName": f"Sample_Job_{task_id % 50}",
+                        "jobRevision": 2,
+                        "jobTimestamp": 1594714500345,
+                        "componentID": 828 + component_id,
+                        "componentName": f"Component {component_id}",
+                        "state": "SUCCESS",
+                        "rowCount": -1,
+                        "startTime": 1594729190956,
+                        "endTime": 1594729190958,
+                        "message": "",
+                    }
+                    for component_id in range(components)
+                ],
+                "hasHistoricJobs": True,
+                "jobNames": [f"Sample_Job_{task_id % 50}"],
+            }
+        )
+
+
+def measure(label, build, payloads):
+    gc.collect()
+    tracemalloc.start()
+    held = [build(json.loads(payload)) for payload in payloads]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{label:<32} {current / 1024 / 1024:>9.1f} MiB {current / len(held):>9.0f} B/task"
+    )
+    return current
+
+
+def parsed_components(task):
+    task = TaskDetails.from_dict(task)
+    task.components
+    return task
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=20000)
+    parser.add_argument("--components", type=int, default=5)
+    parser.add_argument(
+        "--drop-components",
+        action="store_true",
+        help="Discard component results, as a task state monitor would.",
+    )
+    args = parser.parse_args()
+
+    payloads = list(synthetic_task_payloads(args.tasks, args.components))
+    if args.drop_components:
+        payloads = [json.dumps({**json.loads(p), "tasks": []}) for p in payloads]
+
+    print(f"{args.tasks} tasks with {args.components} components each")
+    baseline = measure("dict", lambda task: task, payloads)
+    for label, build in [
+        ("TaskDetails (lazy components)", TaskDetails.from_dict),
+        ("TaskDetails (parsed components)", parsed_components),
+    ]:
+        used = measure(label, build, payloads)
+        print(f"{'':<32} {used / baseline:>9.0%} of dict")
+
+
+if __name__ == "__main__":
+    main()
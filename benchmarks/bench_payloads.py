@@ -0,0 +1,139 @@
+"""
+Compare ways of sending large grid variables with run_job.
+
+Each mode encodes the request body of a job run whose grid has --rows rows, then
+sends it --requests times to a local mock server:
+
+    requests      the previous path, a dictionary passed as `json=` to requests
+    encoded       `run_job` with a dictionary, encoded by `pymatillion.payloads`
+    pre-encoded   `run_job` with `GridVariables` built once for every run
+    gzip          pre-encoded, with request bodies gzipped
+
+Results are printed as a table, or as JSON lines with --json for comparison between
+commits.
+
+Usage:
+    python benchmarks/bench_payloads.py --rows 10000 --columns 8 --requests 200
+"""
+
+import argparse
+import json
+import time
+
+from mock_server import MockMatillionServer
+
+from pymatillion import payloads
+from pymatillion.constants import DEFAULT_VERSION
+from pymatillion.endpoints import RUN_JOB
+from pymatillion.matillion import MatillionClient
+from pymatillion.payloads import GridVariables, gzip_body, run_job_body
+
+GROUP = "Sample_Project_Group_1"
+PROJECT = "Sample_Project_1"
+JOB = "Sample_Job_1"
+
+
+def synthetic_grid(rows: int, columns: int):
+    return {
+        "rows": [
+            [
+                f"value_{row}_{column}" if column % 2 else row
+                for column in range(columns)
+            ]
+            for row in range(rows)
+        ]
+    }
+
+
+def send_with_requests(client, grid):
+    body = {"scalarVariables": {"run": "1"}, "gridVariables": grid}
+    client._api_request(
+        RUN_JOB, version=DEFAULT_VERSION, path={"job": JOB}, json=body
+    ).json()
+
+
+def body_size(mode, grid, encoded_grid):
+    if mode == "requests":
+        body = json.dumps({"scalarVariables": {"run": "1"}, "gridVariables": grid})
+        return len(body.encode("utf-8"))
+    body = run_job_body({"run": "1"}, encoded_grid)
+    return len(gzip_body(body)) if mode == "gzip" else len(body)
+
+
+def run_mode(mode, base_url, grid, requests):
+    client = MatillionClient(
+        base_url,
+        "user",
+        "password",
+        GROUP,
+        PROJECT,
+        compress_threshold=0 if mode == "gzip" else None,
+    )
+    started_at = time.perf_counter()
+    encoded_grid = GridVariables(grid) if mode in ("pre-encoded", "gzip") else grid
+    for _ in range(requests):
+        if mode == "requests":
+            send_with_requests(client, grid)
+        else:
+            client.run_job(JOB, {"run": "1"}, encoded_grid)
+    elapsed = time.perf_counter() - started_at
+    client.close()
+    return elapsed, body_size(mode, grid, encoded_grid)
+
+
+def report(mode, requests, elapsed, size, as_json):
+    result = {
+        "mode": mode,
+        "requests": requests,
+        "throughput": requests / elapsed,
+        "ms_per_run": elapsed / requests * 1000,
+        "body_bytes": size,
+    }
+    if as_json:
+        print(json.dumps(result))
+    else:
+        print(
+            f"{mode:<12} {requests:>8} {result['throughput']:>10.1f}"
+            f" {result['ms_per_run']:>10.2f} {size:>12}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--columns", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0, help="milliseconds")
+    parser.add_argument(
+        "--mode",
+        action="append",
+        choices=["requests", "encoded", "pre-encoded", "gzip"],
+        dest="modes",
+    )
+    parser.add_argument(
+        "--no-orjson",
+        action="store_true",
+        help="Encode with the standard library even if orjson is installed.",
+    )
+    parser.add_argument("--json", action="store_true", help="Print JSON lines.")
+    args = parser.parse_args()
+    if args.no_orjson:
+        payloads.orjson = None
+    if not args.json:
+        encoder = "orjson" if payloads.orjson is not None else "json"
+        print(f"encoder: {encoder}")
+
+    grid = synthetic_grid(args.rows, args.columns)
+    with MockMatillionServer(latency=args.latency) as server:
+        if not args.json:
+            print(
+                f"{'mode':<12} {'requests':>8} {'runs/s':>10} {'ms/run':>10}"
+                f" {'body bytes':>12}"
+            )
+        for mode in args.modes or ["requests", "encoded", "pre-encoded", "gzip"]:
+            elapsed, size = run_mode(mode, server.base_url, grid, args.requests)
+            report(mode, args.requests, elapsed, size, args.json)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Compare streaming a large JSON array with `iter_json_array` against `json.loads`.
+
+The document is a list of job names, decoded from chunks of each --chunk-size so
+the cost of large chunks holding many items shows up. Results are printed as a
+table, or as JSON lines with --json for comparison between commits.
+
+Usage:
+    python benchmarks/bench_streaming.py --items 200000 --chunk-size 8192 65536
+"""
+
+import argparse
+import json
+import time
+
+from pymatillion.streaming import iter_json_array
+
+
+def chunked(data: bytes, size: int):
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+def report(decoder, chunk_size, items, elapsed, as_json):
+    result = {
+        "decoder": decoder,
+        "chunk_size": chunk_size,
+        "items": items,
+        "seconds": elapsed,
+    }
+    if as_json:
+        print(json.dumps(result))
+    else:
+        print(f"{decoder:<16} {chunk_size or '-':>10} {items:>10} {elapsed:>10.3f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", type=int, default=200000)
+    parser.add_argument(
+        "--chunk-size", type=int, nargs="+", default=[8192, 65536, 262144]
+    )
+    parser.add_argument("--json", action="store_true", help="Print JSON lines.")
+    args = parser.parse_args()
+
+    data = json.dumps([f"Sample_Job_{i}" for i in range(args.items)]).encode()
+    if not args.json:
+        print(f"document: {len(data)} bytes")
+        print(f"{'decoder':<16} {'chunk size':>10} {'items':>10} {'seconds':>10}")
+
+    started_at = time.perf_counter()
+    items = len(json.loads(data))
+    report("json.loads", None, items, time.perf_counter() - started_at, args.json)
+
+    for chunk_size in args.chunk_size:
+        chunks = chunked(data, chunk_size)
+        started_at = time.perf_counter()
+        items = sum(1 for _ in iter_json_array(chunks))
+        elapsed = time.perf_counter() - started_at
+        report("iter_json_array", chunk_size, items, elapsed, args.json)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+"""
+Local stand-in for the Matillion REST API, used by the benchmarks.
+
+Usage:
+    python benchmarks/mock_server.py --port 8080 --latency 20 --error-rate 0.01
+"""
+
+import argparse
+import itertools
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+PREFIX = "/rest/v1/"
+PROJECT = r"group/name/(?P<group>[^/]+)/project/name/(?P<project>[^/]+)"
+VERSION = PROJECT + r"/version/name/(?P<version>[^/]+)"
+ROUTES = [
+    ("GET", re.compile(r"group"), "list_project_groups"),
+    ("GET", re.compile(r"group/name/(?P<group>[^/]+)/project"), "list_projects"),
+    ("GET", re.compile(VERSION + r"/job"), "list_jobs"),
+    ("POST", re.compile(VERSION + r"/job/name/(?P<job>[^/]+)/run"), "run_job"),
+    ("GET", re.compile(PROJECT + r"/task/id/(?P<task_id>\d+)"), "get_task_details"),
+    ("POST", re.compile(VERSION + r"/job/name/(?P<job>[^/]+)/delete"), "delete"),
+    ("POST", re.compile(VERSION + r"/delete"), "delete"),
+]
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024
+
+
+class MockMatillionServer:
+    """
+    Threaded HTTP/1.1 server answering the Matillion REST endpoints.
+
+    Args:
+        host (str): Interface to bind.
+        port (int): Port to bind, 0 picks a free port.
+        latency (float): Mean added response latency in milliseconds.
+        latency_jitter (float): Maximum random deviation from `latency` in
+            milliseconds.
+        error_rate (float): Fraction of requests answered with HTTP 503.
+        jobs (int): Number of jobs returned by the job listing.
+        components (int): Number of component results in task details.
+        polls_until_done (int): Task detail polls reporting RUNNING before a task
+            reports SUCCESS.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0,
+        latency_jitter: float = 0,
+        error_rate: float = 0,
+        jobs: int = 100,
+        components: int = 10,
+        polls_until_done: int = 0,
+    ):
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.error_rate = error_rate
+        self.jobs = jobs
+        self.components = components
+        self.polls_until_done = polls_until_done
+        self.requests = 0
+        self._task_ids = itertools.count(1)
+        self._polls = {}
+        self._lock = threading.Lock()
+        self._server = _Server((host, port), self._handler_class())
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "MockMatillionServer":
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="mock-matillion", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "MockMatillionServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                server._handle(self, "GET")
+
+            def do_POST(self):
+                server._handle(self, "POST")
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def _handle(self, request: BaseHTTPRequestHandler, method: str):
+        content_length = int(request.headers.get("Content-Length") or 0)
+        if content_length:
+            request.rfile.read(content_length)
+        with self._lock:
+            self.requests += 1
+        if self.latency or self.latency_jitter:
+            delay = self.latency + random.uniform(
+                -self.latency_jitter, self.latency_jitter
+            )
+            time.sleep(max(0.0, delay) / 1000)
+
+        status, payload = 404, {"success": False, "msg": "Not found", "id": -1}
+        if self.error_rate and random.random() < self.error_rate:
+            status = 503
+            payload = {"success": False, "msg": "Service Unavailable", "id": -1}
+        elif request.path.startswith(PREFIX):
+            path = request.path[len(PREFIX) :]
+            for route_method, pattern, handler in ROUTES:
+                match = pattern.fullmatch(path)
+                if route_method == method and match:
+                    status, payload = 200, getattr(self, handler)(**match.groupdict())
+                    break
+
+        body = json.dumps(payload).encode("utf-8")
+        request.send_response(status)
+        request.send_header("Content-Type", "application/json")
+        request.send_header("Content-Length", str(len(body)))
+        request.end_headers()
+        request.wfile.write(body)
+
+    def list_project_groups(self):
+        return ["Sample_Project_Group_1", "Sample_Project_Group_2"]
+
+    def list_projects(self, group):
+        return ["Sample_Project_1", "Sample_Project_2"]
+
+    def list_jobs(self, group, project, version):
+        return [f"Sample_Job_{i}" for i in range(self.jobs)]
+
+    def run_job(self, group, project, version, job):
+        task_id = next(self._task_ids)
+        return {"success": True, "msg": f"Successfully queued job {job}", "id": task_id}
+
+    def get_task_details(self, group, project, task_id):
+        with self._lock:
+            polls = self._polls.get(task_id, 0) + 1
+            self._polls[task_id] = polls
+        done = polls > self.polls_until_done
+        return {
+            "id": int(task_id),
+            "type": "RUN_ORCHESTRATION",
+            "groupName": group,
+            "projectName": project,
+            "versionName": "default",
+            "jobName": "Sample_Job_1",
+            "environmentName": "test",
+            "state": "SUCCESS" if done else "RUNNING",
+            "enqueuedTime": 1594729190954,
+            "startTime": 1594729190955,
+            "endTime": 1594729201024 if done else None,
+            "message": None,
+            "rowCount": 0,
+            "tasks": [
+                {
+                    "taskID": i,
+                    "parentID": -1,
+                    "type": "VALIDATE_ORCHESTRATION",
+                    "jobName": "Sample_Job_1",
+                    "componentID": 828 + i,
+                    "componentName": f"Component {i}",
+                    "state": "SUCCESS",
+                    "rowCount": -1,
+                    "startTime": 1594729190956,
+                    "endTime": 1594729190958,
+                    "message": "",
+                }
+                for i in range(self.components)
+            ],
+            "hasHistoricJobs": True,
+            "jobNames": ["Sample_Job_1"],
+        }
+
+    def delete(self, group, project, version, job=None):
+        return {"success": True, "msg": "Successfully deleted", "id": 1}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mock Matillion REST API server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0, help="milliseconds")
+    parser.add_argument("--latency-jitter", type=float, default=0, help="milliseconds")
+    parser.add_argument("--error-rate", type=float, default=0)
+    parser.add_argument("--jobs", type=int, default=100)
+    parser.add_argument("--components", type=int, default=10)
+    parser.add_argument("--polls-until-done", type=int, default=0)
+    args = parser.parse_args()
+    server = MockMatillionServer(**vars(args))
+    print(f"Serving mock Matillion API on {server.base_url}")
+    try:
+        server._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,362 @@
+import asyncio
+import json as jsonlib
+import logging
+from base64 import b64encode
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from pymatillion.backoff import Backoff
+from pymatillion.constants import (
+    API_GET,
+    BASE_URL,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_POOL_MAXSIZE,
+    DEFAULT_VERSION,
+    PASSWORD,
+    PROJECT_GROUP_NAME,
+    PROJECT_NAME,
+    USERNAME,
+)
+from pymatillion.endpoints import (
+    DELETE_JOB,
+    DELETE_VERSION,
+    GET_TASK_DETAILS,
+    LIST_JOBS,
+    LIST_PROJECT_GROUPS,
+    LIST_PROJECTS,
+    LIST_RUNNING_TASKS,
+    RUN_JOB,
+    Route,
+    ScopedClient,
+)
+from pymatillion.models import RunResponse, TaskDetails
+from pymatillion.payloads import GridVariables, run_job_body
+from pymatillion.singleflight import AsyncSingleFlight
+from pymatillion.watcher import TaskWatcher
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncMatillionClient(ScopedClient):
+    """
+    Asyncio counterpart of `pymatillion.matillion.MatillionClient`.
+
+    Requires the optional `aiohttp` dependency (`pip install pymatillion[async]`)
+    unless an existing `aiohttp.ClientSession` is supplied. Passing the same
+    session to several clients lets them share one connection pool.
+    """
+
+    def __init__(
+        self,
+        base_url,
+        username,
+        password,
+        project_group_name=None,
+        project_name=None,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        session=None,
+        single_flight: Optional[AsyncSingleFlight] = None,
+    ):
+        self.base_url = base_url
+        self.username = username
+        self.password = password
+        self.project_group_name = project_group_name
+        self.project_name = project_name
+        self.pool_maxsize = pool_maxsize
+        self.max_concurrency = max_concurrency
+        self.single_flight = single_flight
+        self._headers = None
+        self._session = session
+        self._owns_session = session is None
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def __aenter__(self) -> "AsyncMatillionClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    @property
+    def session(self):
+        """
+        HTTP session shared by every API request made by this client.
+
+        Returns:
+            aiohttp.ClientSession : Session object.
+        """
+        if self._session is None:
+            self._session = self._create_session()
+        return self._session
+
+    def _create_session(self):
+        try:
+            import aiohttp
+        except ImportError as e:
+            raise ImportError(
+                "AsyncMatillionClient requires aiohttp. "
+                "Install it with `pip install pymatillion[async]`."
+            ) from e
+        connector = aiohttp.TCPConnector(
+            limit=self.pool_maxsize, limit_per_host=self.pool_maxsize
+        )
+        return aiohttp.ClientSession(connector=connector)
+
+    async def close(self):
+        """
+        Close the HTTP session if it was created by this client.
+        """
+        if self._session is not None and self._owns_session:
+            await self._session.close()
+            self._session = None
+
+    def _reset_scope(self):
+        super()._reset_scope()
+        # Credentials are part of the scope, rebuild them as well.
+        self._auth_headers = None
+
+    def _request_headers(self) -> Dict[str, str]:
+        if self._auth_headers is None:
+            credentials = b64encode(f"{self.username}:{self.password}".encode("utf-8"))
+            headers = dict(self._headers) if self._headers else {}
+            headers["Authorization"] = f'Basic {credentials.decode("ascii")}'
+            self._auth_headers = headers
+        return self._auth_headers
+
+    async def _api_request(
+        self,
+        route: Route,
+        project_name: str = None,
+        version: str = None,
+        path: Optional[Dict] = None,
+        json=None,
+        data: Optional[bytes] = None,
+    ) -> Any:
+        """
+        Make an API Request and decode the JSON response.
+
+        Args:
+            route (Route) : Endpoint to call, from `pymatillion.endpoints`.
+            project_name (str) : Project of project and version scoped routes.
+                Defaults to the client's project.
+            version (str) : Version of version scoped routes.
+            path (dict) : Values of the fields of the route path, e.g. `job`.
+            json (dict) : Request payload.
+            data (bytes) : Request payload already encoded as JSON, sent instead of
+                `json`.
+
+        Returns:
+            Any : Decoded JSON response. With `single_flight` set, concurrent
+            identical GET requests share one HTTP call but decode its content
+            separately.
+        """
+        api_path = self.endpoints.url(
+            route, project_name or self.project_name, version, **(path or {})
+        )
+
+        headers = self._request_headers()
+        if data is not None:
+            headers = {**headers, "Content-Type": "application/json"}
+
+        async def request() -> bytes:
+            async with self._semaphore:
+                async with self.session.request(
+                    route.method.upper(),
+                    api_path,
+                    headers=headers,
+                    json=json,
+                    data=data,
+                ) as response:
+                    content = await response.read()
+                    try:
+                        response.raise_for_status()
+                    except Exception:
+                        logger.error(f"Response content:\n{content}")
+                        raise
+                    return content
+
+        if (
+            self.single_flight is None
+            or route.method != API_GET
+            or json is not None
+            or data is not None
+        ):
+            content = await request()
+        else:
+            key = (self.username, route.method, api_path)
+            content = await self.single_flight.do(key, request)
+        return jsonlib.loads(content)
+
+    async def list_project_groups(self) -> List[str]:
+        """
+        Retrieve Project Groups within the Matillion instance.
+
+        Returns:
+            Project Groups (list) : A list of strings with names of Project Groups.
+        """
+        self._ensure_attributes(BASE_URL, USERNAME, PASSWORD)
+        return await self._api_request(LIST_PROJECT_GROUPS)
+
+    async def list_projects(self) -> List[str]:
+        """
+        Retreive Projects within the specified Project Group of Matillion instance.
+
+        Returns:
+            Project Names (list) : A list of strings with names of Projects.
+        """
+        self._ensure_attributes(BASE_URL, USERNAME, PASSWORD, PROJECT_GROUP_NAME)
+        return await self._api_request(LIST_PROJECTS)
+
+    async def list_jobs(
+        self, project_name: str = None, version: str = DEFAULT_VERSION
+    ) -> List[str]:
+        """
+        Retrieve jobs within the specified version of the Matillion project.
+
+        Args:
+            project_name (str): Name of the Matillion project.
+            version: (str), optional. Default value : default.
+        Returns:
+            Matillion Jobs (list): A list of of strings with names of the Matillion jobs.
+        """
+        self._ensure_attributes(
+            BASE_URL, USERNAME, PASSWORD, PROJECT_GROUP_NAME, PROJECT_NAME
+        )
+        return await self._api_request(LIST_JOBS, project_name, version)
+
+    async def run_job(
+        self,
+        job_name: str,
+        job_variables: dict = {},
+        grid_variables: Union[dict, GridVariables] = {},
+        project_name: str = None,
+        version: str = DEFAULT_VERSION,
+        as_model: bool = False,
+    ) -> Union[Dict, RunResponse]:
+        """
+        Run Matillion job within the specified project, for the specified version.
+
+        Args:
+            job_name (str): Name of the Matillion job intended to run.
+            job_variables (dict): Dictionary of Matillion job variables.
+            grid_variables (dict | GridVariables): Dictionary of Matillion grid
+                variables, or `GridVariables` serialized once for many runs.
+            project_name (str): Name of the Matillion project.
+            version: (str), optional. Default value : default.
+            as_model (bool): Return a `RunResponse` instead of a dictionary.
+        Returns:
+            dict : Sample response can be found at https://documentation.matillion.com/docs/2475544#server-response
+        """
+        self._ensure_attributes(
+            BASE_URL, USERNAME, PASSWORD, PROJECT_GROUP_NAME, PROJECT_NAME
+        )
+        body = run_job_body(job_variables, grid_variables)
+        response = await self._api_request(
+            RUN_JOB, project_name, version, path={"job": job_name}, data=body
+        )
+        return RunResponse.from_dict(response) if as_model else response
+
+    async def get_task_details(
+        self, task_id: int, project_name: str = None, as_model: bool = False
+    ) -> Union[Dict, TaskDetails]:
+        """
+        Retrieve details for the specified executed task id.
+        Args:
+            task_id (int): ID of the executed Matillion task.
+            project_name (str): Name of the Matillion project.
+            as_model (bool): Return a `TaskDetails` instead of a dictionary.
+        Returns:
+            dict : Sample response can be found at https://documentation.matillion.com/docs/2972278
+        """
+        self._ensure_attributes(
+            BASE_URL, USERNAME, PASSWORD, PROJECT_GROUP_NAME, PROJECT_NAME
+        )
+        response = await self._api_request(
+            GET_TASK_DETAILS, project_name, path={"id": task_id}
+        )
+        return TaskDetails.from_dict(response) if as_model else response
+
+    async def list_running_tasks(self, project_name: str = None) -> List[Dict]:
+        """
+        Retrieve the tasks currently running within the Matillion project.
+
+        Args:
+            project_name (str): Name of the Matillion project.
+        Returns:
+            list : Task details of the running tasks.
+        """
+        self._ensure_attributes(
+            BASE_URL, USERNAME, PASSWORD, PROJECT_GROUP_NAME, PROJECT_NAME
+        )
+        return await self._api_request(LIST_RUNNING_TASKS, project_name)
+
+    def watch_tasks(
+        self,
+        task_ids: Optional[Iterable[int]] = None,
+        project_name: str = None,
+        cursor: Optional[Dict] = None,
+        backoff: Optional[Backoff] = None,
+        timeout: Optional[float] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> TaskWatcher:
+        """
+        Stream state transitions of tasks, or of every task of the project.
+
+        Iterate over the result with `async for`; see `TaskWatcher`.
+
+        Args:
+            task_ids (iterable): IDs of the tasks to watch until they finish. Watches
+                every task of the project when omitted.
+            project_name (str): Name of the Matillion project.
+            cursor (dict): `cursor` of a previous watcher to resume from.
+            backoff (Backoff): Delay schedule between polling rounds.
+            timeout (float): Stop after this many seconds, or None to run until done.
+            max_concurrency (int): Maximum number of task detail polls in flight.
+        Returns:
+            TaskWatcher : Iterable of `TaskEvent`.
+        """
+        return TaskWatcher(
+            self,
+            task_ids,
+            project_name=project_name,
+            cursor=cursor,
+            backoff=backoff,
+            timeout=timeout,
+            max_concurrency=max_concurrency,
+        )
+
+    async def delete_project(
+        self, project_name: str, version: str = DEFAULT_VERSION
+    ) -> Dict:
+        """
+        Delete Matillion project. If version is specified then delete specified project version.
+
+        Args:
+            project_name (str): Name of the Matillion project.
+            version: (str), optional. Default value : default.
+        Returns:
+            dict : Sample response can be found at https://documentation.matillion.com/docs/2949951#deleting-resources
+        """
+        self._ensure_attributes(
+            BASE_URL, USERNAME, PASSWORD, PROJECT_GROUP_NAME, PROJECT_NAME
+        )
+        return await self._api_request(DELETE_VERSION, project_name, version)
+
+    async def delete_job(
+        self, job_name: str, project_name: str = None, version: str = DEFAULT_VERSION
+    ) -> Dict:
+        """
+        Delete Matillion job within the specified version of the project.
+
+        Args:
+            job_name: (str), required. Name of the Matillion job to delete.
+            project_name: (str), optional. Name of the Matillion project.
+            version: (str), optional. Default value : default.
+        Returns:
+            Dict[Any, Any] : Sample response can be found at https://documentation.matillion.com/docs/2949951#deleting-resources
+        """
+        self._ensure_attributes(
+            BASE_URL, USERNAME, PASSWORD, PROJECT_GROUP_NAME, PROJECT_NAME
+        )
+        return await self._api_request(
+            DELETE_JOB, project_name, version, path={"job": job_name}
+        )
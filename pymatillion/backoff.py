@@ -0,0 +1,39 @@
+import random
+
+from pymatillion.constants import (
+    DEFAULT_MAX_POLL_INTERVAL,
+    DEFAULT_POLL_INTERVAL,
+    DEFAULT_POLL_JITTER,
+    DEFAULT_POLL_MULTIPLIER,
+)
+
+
+class Backoff:
+    """
+    Exponential backoff schedule with jitter.
+
+    The delay for attempt `n` is `initial * multiplier ** n`, capped at `maximum`
+    and reduced by a random fraction of up to `jitter` (0 disables jitter, 1 gives
+    "full jitter").
+    """
+
+    def __init__(
+        self,
+        initial: float = DEFAULT_POLL_INTERVAL,
+        maximum: float = DEFAULT_MAX_POLL_INTERVAL,
+        multiplier: float = DEFAULT_POLL_MULTIPLIER,
+        jitter: float = DEFAULT_POLL_JITTER,
+    ):
+        if not 0 <= jitter <= 1:
+            raise ValueError("jitter must be between 0 and 1")
+        self.initial = initial
+        self.maximum = maximum
+        self.multiplier = multiplier
+        self.jitter = jitter
+
+    def delay(self, attempt: int) -> float:
+        """
+        Seconds to wait before the given (zero based) attempt.
+        """
+        delay = min(self.maximum, self.initial * self.multiplier**attempt)
+        return delay * (1 - self.jitter * random.random())
@@ -0,0 +1,263 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from pymatillion.constants import (
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_VERSION,
+    DELETE_DELETED,
+    DELETE_FAILED,
+    DELETE_MISSING,
+    DELETE_PLANNED,
+    DELETE_SKIPPED,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class JobSpec(NamedTuple):
+    """
+    Arguments for a single `MatillionClient.run_job` call.
+    """
+
+    job_name: str
+    job_variables: Dict = {}
+    grid_variables: Dict = {}
+    project_name: Optional[str] = None
+    version: str = DEFAULT_VERSION
+
+
+@dataclass
+class JobRunResult:
+    """
+    Outcome of launching one `JobSpec`.
+
+    Exactly one of `response` and `error` is set.
+    """
+
+    index: int
+    spec: JobSpec
+    response: Optional[Dict] = None
+    error: Optional[BaseException] = field(default=None, repr=False)
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def as_job_spec(spec: Union[JobSpec, tuple, Dict[str, Any]]) -> JobSpec:
+    """
+    Normalise a job spec given as a `JobSpec`, tuple or dictionary.
+    """
+    if isinstance(spec, JobSpec):
+        return spec
+    if isinstance(spec, dict):
+        return JobSpec(**spec)
+    return JobSpec(*spec)
+
+
+def run_jobs(
+    client,
+    specs: Iterable[Union[JobSpec, tuple, Dict[str, Any]]],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> Iterator[JobRunResult]:
+    """
+    Launch several Matillion jobs in parallel using a pool of worker threads.
+
+    Args:
+        client (MatillionClient): Client used to launch the jobs.
+        specs (iterable): Job specs as `JobSpec`, tuples or dictionaries.
+        max_concurrency (int): Maximum number of launches in flight.
+    Returns:
+        Iterator[JobRunResult] : Results in completion order. Failed launches are
+        reported through `JobRunResult.error` and do not stop the remaining ones.
+    """
+    specs = [as_job_spec(spec) for spec in specs]
+    if not specs:
+        return
+    executor = ThreadPoolExecutor(
+        max_workers=min(max_concurrency, len(specs)),
+        thread_name_prefix="pymatillion-run",
+    )
+    try:
+        futures = {
+            executor.submit(client.run_job, *spec): index
+            for index, spec in enumerate(specs)
+        }
+        for future in as_completed(futures):
+            index = futures[future]
+            try:
+                yield JobRunResult(index, specs[index], response=future.result())
+            except Exception as e:
+                logger.error(f"Failed to run job {specs[index].job_name}: {e}")
+                yield JobRunResult(index, specs[index], error=e)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+@dataclass
+class DeletionResult:
+    """
+    Outcome of deleting one job or project version.
+
+    `status` is one of `PLANNED` (dry run), `DELETED`, `FAILED`, `MISSING`
+    (requested but absent from the listing) or `SKIPPED` (selected but protected,
+    with the explanation in `reason`).
+    """
+
+    name: str
+    status: str
+    response: Optional[Dict] = None
+    error: Optional[BaseException] = field(default=None, repr=False)
+    reason: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.status != DELETE_FAILED
+
+
+@dataclass
+class DeletionReport:
+    """
+    Per-item outcomes of a batch deletion, in plan order.
+    """
+
+    results: List[DeletionResult]
+    dry_run: bool = False
+
+    def _names(self, status: str) -> List[str]:
+        return [result.name for result in self.results if result.status == status]
+
+    @property
+    def planned(self) -> List[str]:
+        return [
+            result.name
+            for result in self.results
+            if result.status not in (DELETE_MISSING, DELETE_SKIPPED)
+        ]
+
+    @property
+    def deleted(self) -> List[str]:
+        return self._names(DELETE_DELETED)
+
+    @property
+    def failed(self) -> List[str]:
+        return self._names(DELETE_FAILED)
+
+    @property
+    def missing(self) -> List[str]:
+        return self._names(DELETE_MISSING)
+
+    @property
+    def skipped(self) -> List[str]:
+        return self._names(DELETE_SKIPPED)
+
+    @property
+    def ok(self) -> bool:
+        return all(result.ok for result in self.results)
+
+
+def plan_deletions(
+    listing: Iterable[str],
+    names: Optional[Iterable[str]] = None,
+    match: Optional[Callable[[str], bool]] = None,
+    protected: Iterable[str] = (),
+) -> Tuple[List[str], List[str], List[str]]:
+    """
+    Select the listed items to delete.
+
+    Args:
+        listing (iterable): Names returned by the listing endpoint.
+        names (iterable): Names to delete.
+        match (callable): Predicate selecting names to delete. Combined with
+            `names`, an item must satisfy both.
+        protected (iterable): Names that are never deleted.
+    Returns:
+        tuple : Names to delete in listing order, requested names missing from
+            the listing, and protected names that were selected but left out of
+            the plan, in listing order.
+    Raises:
+        ValueError : If neither `names` nor `match` is given.
+    """
+    if names is None and match is None:
+        raise ValueError("Either names or match is required")
+    requested = None if names is None else set(names)
+    protected = set(protected)
+    listing = list(listing)
+    plan, selected_protected = [], []
+    for name in listing:
+        if requested is not None and name not in requested:
+            continue
+        if match is not None and not match(name):
+            continue
+        if name in protected:
+            selected_protected.append(name)
+        else:
+            plan.append(name)
+    missing = sorted(requested.difference(listing)) if requested else []
+    return plan, missing, selected_protected
+
+
+def delete_all(
+    plan: List[str],
+    delete: Callable[[str], Dict],
+    missing: Iterable[str] = (),
+    dry_run: bool = False,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    skipped: Optional[Dict[str, str]] = None,
+) -> DeletionReport:
+    """
+    Execute a deletion plan using a pool of worker threads.
+
+    Failures, including responses with `success` set to false, are recorded in the
+    report rather than raised.
+
+    Args:
+        plan (list): Names to delete.
+        delete (callable): Deletes one name and returns the API response.
+        missing (iterable): Requested names absent from the listing.
+        dry_run (bool): Report the plan without deleting anything.
+        max_concurrency (int): Maximum number of deletions in flight.
+        skipped (dict): Reasons by name for selected items that are not deleted,
+            e.g. protected ones.
+    Returns:
+        DeletionReport : Per-item outcomes.
+    """
+
+    def run(name: str) -> DeletionResult:
+        try:
+            response = delete(name)
+        except Exception as e:
+            logger.error(f"Failed to delete {name}: {e}")
+            return DeletionResult(name, DELETE_FAILED, error=e)
+        if isinstance(response, dict) and response.get("success") is False:
+            logger.error(f"Failed to delete {name}: {response.get('msg')}")
+            return DeletionResult(name, DELETE_FAILED, response=response)
+        return DeletionResult(name, DELETE_DELETED, response=response)
+
+    if dry_run or not plan:
+        results = [DeletionResult(name, DELETE_PLANNED) for name in plan]
+    else:
+        with ThreadPoolExecutor(
+            max_workers=min(max_concurrency, len(plan)),
+            thread_name_prefix="pymatillion-delete",
+        ) as executor:
+            results = list(executor.map(run, plan))
+    results.extend(DeletionResult(name, DELETE_MISSING) for name in missing)
+    results.extend(
+        DeletionResult(name, DELETE_SKIPPED, reason=reason)
+        for name, reason in (skipped or {}).items()
+    )
+    return DeletionReport(results, dry_run=dry_run)
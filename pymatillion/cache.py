@@ -0,0 +1,355 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from pymatillion.constants import (
+    DEFAULT_CACHE_MAXSIZE,
+    DEFAULT_CACHE_TTL,
+    DEFAULT_PERSISTENT_CACHE_BUSY_TIMEOUT,
+    DEFAULT_PERSISTENT_CACHE_MAXSIZE,
+    PERSISTENT_CACHE_FILE_NAME,
+)
+
+_MISSING = object()
+
+
+class MetadataCache:
+    """
+    Thread-safe in-memory cache with a time-to-live and a least recently used bound.
+
+    `MatillionClient` stores listing responses under keys of the form
+    `(base_url, group, project, version, resource)`, so a single cache can be
+    shared by clients pointing at different instances or projects.
+
+    Args:
+        ttl (float): Seconds an entry stays valid.
+        maxsize (int): Maximum number of entries before the least recently used
+            ones are evicted.
+    """
+
+    def __init__(
+        self, ttl: float = DEFAULT_CACHE_TTL, maxsize: int = DEFAULT_CACHE_MAXSIZE
+    ):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def get_or_fetch(self, key: Hashable, fetch: Callable[[], Any]) -> Any:
+        """
+        Return the cached value for `key`, calling `fetch` and storing its result on
+        a miss.
+        """
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = fetch()
+            self.set(key, value)
+        return value
+
+    def invalidate(self, *scope: Optional[str]) -> int:
+        """
+        Remove every entry whose key starts with `scope`.
+
+        For example `invalidate(base_url, group)` drops all cached listings of that
+        project group, and `invalidate()` clears the cache.
+
+        Returns:
+            int : Number of removed entries.
+        """
+        with self._lock:
+            keys = [key for key in self._entries if key[: len(scope)] == scope]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def clear(self):
+        self.invalidate()
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """
+        Cache hit and miss counters and current size.
+        """
+        return {"hits": self.hits, "misses": self.misses, "size": len(self)}
+
+
+class Validators(NamedTuple):
+    """
+    HTTP validators of a cached response, used for conditional requests.
+    """
+
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    @classmethod
+    def from_headers(cls, headers: Mapping[str, str]) -> Optional["Validators"]:
+        validators = cls(headers.get("ETag"), headers.get("Last-Modified"))
+        return validators if any(validators) else None
+
+    def request_headers(self) -> Dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def default_cache_directory() -> Path:
+    """
+    `$XDG_CACHE_HOME/pymatillion`, defaulting to `~/.cache/pymatillion`.
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "pymatillion"
+
+
+def _encode_key(key: Tuple) -> str:
+    # Encoding each part separately keeps key prefixes string prefixes, so scopes
+    # can be invalidated with a single range query.
+    return "".join(json.dumps(part) + "\x1f" for part in key)
+
+
+class PersistentCache:
+    """
+    Listing cache stored in SQLite, shared by every process on the machine.
+
+    Entries are valid for `ttl` seconds. Expired entries whose response carried an
+    `ETag` or `Last-Modified` header are revalidated with a conditional request,
+    and reused without downloading the listing again when the server answers
+    `304 Not Modified`; other expired entries are fetched again.
+
+    The database runs in WAL mode, so readers never block each other or the
+    writer, and writers wait up to `busy_timeout` seconds for the write lock. Each
+    thread and process opens its own connection. Values must be JSON serializable.
+
+    Args:
+        directory (str): Directory of the database file, created if missing.
+            Defaults to `default_cache_directory()`.
+        ttl (float): Seconds an entry stays valid without revalidation.
+        maxsize (int): Maximum number of entries before those expiring first are
+            evicted.
+        busy_timeout (float): Seconds to wait for a lock held by another process.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[Union[str, os.PathLike]] = None,
+        ttl: float = DEFAULT_CACHE_TTL,
+        maxsize: int = DEFAULT_PERSISTENT_CACHE_MAXSIZE,
+        busy_timeout: float = DEFAULT_PERSISTENT_CACHE_BUSY_TIMEOUT,
+    ):
+        directory = Path(directory) if directory else default_cache_directory()
+        directory.mkdir(parents=True, exist_ok=True)
+        self.path = directory / PERSISTENT_CACHE_FILE_NAME
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.busy_timeout = busy_timeout
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        # Guards the counters, which are updated by every thread using the cache.
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        with self._connection() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL,"
+                " etag TEXT, last_modified TEXT)"
+            )
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        # Connections must not be shared with a forked child.
+        if connection is None or self._local.pid != os.getpid():
+            connection = sqlite3.connect(
+                self.path, timeout=self.busy_timeout, isolation_level=None
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+
+    def close(self):
+        """
+        Close the calling thread's database connection.
+        """
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    def __len__(self) -> int:
+        return self._connection().execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def _lookup(self, key: Tuple) -> Optional[Tuple[Any, float, Optional[Validators]]]:
+        row = (
+            self._connection()
+            .execute(
+                "SELECT value, expires_at, etag, last_modified FROM entries"
+                " WHERE key = ?",
+                (_encode_key(key),),
+            )
+            .fetchone()
+        )
+        if row is None:
+            return None
+        value, expires_at, etag, last_modified = row
+        validators = Validators(etag, last_modified) if etag or last_modified else None
+        return json.loads(value), expires_at, validators
+
+    def get(self, key: Tuple, default: Any = None) -> Any:
+        entry = self._lookup(key)
+        if entry is None or entry[1] <= time.time():
+            with self._lock:
+                self.misses += 1
+            return default
+        with self._lock:
+            self.hits += 1
+        return entry[0]
+
+    def set(self, key: Tuple, value: Any, validators: Optional[Validators] = None):
+        validators = validators or Validators()
+        connection = self._connection()
+        connection.execute(
+            "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+            (
+                _encode_key(key),
+                json.dumps(value),
+                time.time() + self.ttl,
+                validators.etag,
+                validators.last_modified,
+            ),
+        )
+        connection.execute(
+            "DELETE FROM entries WHERE key IN (SELECT key FROM entries"
+            " ORDER BY expires_at DESC LIMIT -1 OFFSET ?)",
+            (self.maxsize,),
+        )
+
+    def get_or_fetch(self, key: Tuple, fetch: Callable[[], Any]) -> Any:
+        """
+        Return the cached value for `key`, calling `fetch` and storing its result on
+        a miss.
+        """
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = fetch()
+            self.set(key, value)
+        return value
+
+    def get_or_revalidate(
+        self,
+        key: Tuple,
+        fetch: Callable[
+            [Optional[Validators]], Optional[Tuple[Any, Optional[Validators]]]
+        ],
+    ) -> Any:
+        """
+        Return the cached value for `key`, revalidating it once expired.
+
+        Args:
+            key (tuple): Cache key.
+            fetch (callable): Called with the validators of the expired entry, or
+                None if there are none. Returns None if the entry is still valid
+                (HTTP 304), otherwise a `(value, validators)` pair.
+        Returns:
+            Any : Cached or fetched value.
+        Raises:
+            ValueError : If `fetch` returns None although there is no cached entry
+                to keep.
+        """
+        entry = self._lookup(key)
+        if entry is not None and entry[1] > time.time():
+            with self._lock:
+                self.hits += 1
+            return entry[0]
+        validators = entry[2] if entry is not None else None
+        result = fetch(validators)
+        if result is None:
+            if entry is None:
+                raise ValueError(
+                    f"No value fetched for {key}, and no cached entry to revalidate"
+                )
+            with self._lock:
+                self.revalidations += 1
+            self._connection().execute(
+                "UPDATE entries SET expires_at = ? WHERE key = ?",
+                (time.time() + self.ttl, _encode_key(key)),
+            )
+            return entry[0]
+        with self._lock:
+            self.misses += 1
+        value, validators = result
+        self.set(key, value, validators)
+        return value
+
+    def invalidate(self, *scope: Optional[str]) -> int:
+        """
+        Remove every entry whose key starts with `scope`, in every process.
+
+        Returns:
+            int : Number of removed entries.
+        """
+        prefix = _encode_key(scope)
+        return (
+            self._connection()
+            .execute(
+                "DELETE FROM entries WHERE substr(key, 1, ?) = ?", (len(prefix), prefix)
+            )
+            .rowcount
+        )
+
+    def clear(self):
+        self.invalidate()
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """
+        Hit, miss and revalidation counters of this instance and current size.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidations": self.revalidations,
+            "size": len(self),
+        }
@@ -0,0 +1,457 @@
+"""
+Command line interface for batch operations against a Matillion instance.
+
+Connection settings are read from options or from the `MATILLION_URL`,
+`MATILLION_USERNAME`, `MATILLION_PASSWORD`, `MATILLION_GROUP` and
+`MATILLION_PROJECT` environment variables. Commands read JSON lines from a file
+or stdin and write one JSON object per line to stdout as each operation finishes,
+so commands can be piped into each other:
+
+    pymatillion run jobs.jsonl | pymatillion wait
+
+Input lines that are not valid JSON are read as plain strings, so a list of job
+names or task IDs works as well.
+
+The client and its dependencies are only imported once a command runs, which
+keeps `--help` and argument errors fast.
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+from fnmatch import fnmatchcase
+from functools import partial
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+from pymatillion.constants import (
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_MAX_POLL_INTERVAL,
+    DEFAULT_VERSION,
+    TASK_STATE_SUCCESS,
+)
+
+ENV_PREFIX = "MATILLION_"
+
+# Exit codes
+EXIT_OK = 0
+EXIT_FAILED = 1
+
+LISTINGS = ("groups", "projects", "jobs", "versions", "running")
+
+# Keys of `run` output copied to the results of waiting for its tasks, so they
+# can be matched back to the input lines.
+LABEL_KEYS = ("index", "job_name", "project_name")
+
+# Serializes output lines written by the threads waiting on each project.
+_emit_lock = threading.Lock()
+
+
+def _emit(record: Dict[str, Any]):
+    line = json.dumps(record, default=str) + "\n"
+    with _emit_lock:
+        sys.stdout.write(line)
+        sys.stdout.flush()
+
+
+def _read_records(path: Optional[str]) -> Iterator[Any]:
+    stream = sys.stdin if path in (None, "-") else open(path)
+    try:
+        for line in stream:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                yield line
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+
+def _client(args):
+    from pymatillion.matillion import MatillionClient
+
+    return MatillionClient(
+        args.url,
+        args.username,
+        args.password,
+        args.group,
+        args.project,
+        pool_connections=args.concurrency,
+        pool_maxsize=args.concurrency,
+    )
+
+
+def _task_record(task_id: int, task: Dict, details: bool) -> Dict[str, Any]:
+    if not details:
+        task = {key: value for key, value in task.items() if key != "tasks"}
+    return {
+        "task_id": task_id,
+        "ok": task.get("state") == TASK_STATE_SUCCESS,
+        "state": task.get("state"),
+        "task": task,
+    }
+
+
+def _labels(record: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: record[key] for key in LABEL_KEYS if key in record}
+
+
+def _wait(
+    client,
+    project_name: Optional[str],
+    args,
+    concurrency: int,
+    labels: Dict[int, Dict[str, Any]],
+    new_tasks,
+) -> bool:
+    from pymatillion.backoff import Backoff
+    from pymatillion.exceptions import TaskWaitTimeout
+    from pymatillion.waiter import iter_finished_tasks
+
+    ok = True
+    try:
+        for task_id, task in iter_finished_tasks(
+            client,
+            [],
+            project_name=project_name,
+            timeout=args.timeout,
+            backoff=Backoff(maximum=args.max_poll_interval),
+            max_concurrency=concurrency,
+            new_tasks=new_tasks,
+        ):
+            record = {
+                **labels.get(task_id, {}),
+                **_task_record(task_id, task, args.details),
+            }
+            ok = ok and record["ok"]
+            _emit(record)
+    except TaskWaitTimeout as e:
+        for task_id in e.pending:
+            _emit(
+                {
+                    **labels.get(task_id, {}),
+                    "task_id": task_id,
+                    "ok": False,
+                    "error": "timeout",
+                }
+            )
+        ok = False
+    return ok
+
+
+class _ProjectWaits:
+    """
+    Wait for the tasks of several projects at the same time, one thread per
+    project, sharing the poll concurrency between projects. Tasks are polled from
+    the moment they are added, while more can still be added.
+    """
+
+    def __init__(self, client, args, project_names: Iterable[Optional[str]]):
+        from concurrent.futures import ThreadPoolExecutor
+        from queue import Queue
+
+        project_names = list(dict.fromkeys(project_names))
+        concurrency = max(1, args.concurrency // max(1, len(project_names)))
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, len(project_names)),
+            thread_name_prefix="pymatillion-wait",
+        )
+        self._waits = {}
+        for project_name in project_names:
+            new_tasks, labels = Queue(), {}
+            future = self._executor.submit(
+                _wait, client, project_name, args, concurrency, labels, new_tasks
+            )
+            self._waits[project_name] = (new_tasks, labels, future)
+
+    def add(self, project_name: Optional[str], task_id: int, labels: Dict[str, Any]):
+        new_tasks, task_labels, _ = self._waits[project_name]
+        task_labels[task_id] = labels
+        new_tasks.put(task_id)
+
+    def close(self) -> bool:
+        """
+        Wait for every added task, returning whether all of them succeeded.
+        """
+        for new_tasks, _, _ in self._waits.values():
+            new_tasks.put(None)
+        try:
+            return all([future.result() for _, _, future in self._waits.values()])
+        finally:
+            self._executor.shutdown()
+
+
+def _as_job_spec(record):
+    from pymatillion.bulk import as_job_spec
+
+    if isinstance(record, str):
+        record = [record]
+    if not isinstance(record, (dict, list)):
+        raise ValueError(f"expected a job name, list or object, got {record!r}")
+    spec = as_job_spec(record)
+    if not isinstance(spec.job_name, str) or not spec.job_name:
+        raise ValueError(f"job_name must be a non-empty string, got {record!r}")
+    return spec
+
+
+def run_command(args) -> int:
+    client = _client(args)
+    ok = True
+    # Input line index of each valid spec.
+    indices, specs = [], []
+    for index, record in enumerate(_read_records(args.file)):
+        try:
+            specs.append(_as_job_spec(record))
+        except (TypeError, ValueError) as e:
+            ok = False
+            _emit({"index": index, "ok": False, "error": f"Invalid job spec: {e}"})
+            continue
+        indices.append(index)
+    waits = None
+    if args.wait:
+        waits = _ProjectWaits(client, args, [spec.project_name for spec in specs])
+    try:
+        for result in client.run_jobs(specs, max_concurrency=args.concurrency):
+            record = {"index": indices[result.index], "job_name": result.spec.job_name}
+            if result.spec.project_name:
+                record["project_name"] = result.spec.project_name
+            if result.ok and result.response.get("success", True):
+                record.update(ok=True, task_id=result.response.get("id"))
+                if waits is not None:
+                    # Reported with the task's final details instead.
+                    waits.add(
+                        result.spec.project_name, record["task_id"], _labels(record)
+                    )
+                    continue
+            else:
+                record["ok"] = ok = False
+                record["error"] = str(result.error or result.response.get("msg"))
+            if waits is None:
+                record["response"] = result.response
+            _emit(record)
+    finally:
+        if waits is not None:
+            ok = waits.close() and ok
+    return EXIT_OK if ok else EXIT_FAILED
+
+
+def _task_id(record) -> int:
+    if isinstance(record, dict):
+        record = record.get("task_id", record.get("id"))
+        if record is None:
+            raise ValueError("no task_id or id")
+    if isinstance(record, bool) or not isinstance(record, (int, str)):
+        raise ValueError(f"expected a task ID, got {record!r}")
+    return int(record)
+
+
+def wait_command(args) -> int:
+    client = _client(args)
+    ok = True
+    tasks = []
+    for record in _read_records(args.file):
+        # Launch failures piped from `run` have no task to wait for.
+        if isinstance(record, dict) and not record.get("ok", True):
+            continue
+        try:
+            task_id = _task_id(record)
+        except ValueError as e:
+            ok = False
+            _emit({"record": record, "ok": False, "error": f"Invalid task: {e}"})
+            continue
+        project_name = args.project
+        labels = {}
+        if isinstance(record, dict):
+            project_name = record.get("project_name") or project_name
+            labels = _labels(record)
+        tasks.append((project_name, task_id, labels))
+    waits = _ProjectWaits(client, args, [project_name for project_name, _, _ in tasks])
+    for task in tasks:
+        waits.add(*task)
+    ok = waits.close() and ok
+    return EXIT_OK if ok else EXIT_FAILED
+
+
+def list_command(args) -> int:
+    client = _client(args)
+    if args.resource == "groups":
+        items = client.list_project_groups()
+    elif args.resource == "projects":
+        items = client.list_projects()
+    elif args.resource == "jobs":
+        items = client.iter_jobs(version=args.version)
+    elif args.resource == "versions":
+        items = client.list_versions()
+    else:
+        items = client.list_running_tasks()
+    for item in items:
+        _emit(item if isinstance(item, dict) else {"name": item})
+    return EXIT_OK
+
+
+def _name(record) -> str:
+    if isinstance(record, dict):
+        record = record.get("name", record.get("job_name"))
+        if record is None:
+            raise ValueError("no name or job_name")
+    if not isinstance(record, (str, int)) or isinstance(record, bool):
+        raise ValueError(f"expected a name, got {record!r}")
+    return str(record)
+
+
+def delete_command(args) -> int:
+    client = _client(args)
+    ok = True
+    names = None
+    if args.file is not None or args.match is None:
+        names = []
+        for record in _read_records(args.file):
+            try:
+                names.append(_name(record))
+            except ValueError as e:
+                ok = False
+                _emit({"record": record, "ok": False, "error": f"Invalid name: {e}"})
+    match = None
+    if args.match is not None:
+        match = partial(fnmatchcase, pat=args.match)
+    if args.resource == "jobs":
+        report = client.delete_jobs(
+            names,
+            version=args.version,
+            match=match,
+            dry_run=args.dry_run,
+            max_concurrency=args.concurrency,
+        )
+    else:
+        report = client.delete_project_versions(
+            names, match=match, dry_run=args.dry_run, max_concurrency=args.concurrency
+        )
+    for result in report.results:
+        record = {"name": result.name, "ok": result.ok, "status": result.status}
+        if result.reason is not None:
+            record["reason"] = result.reason
+        if result.error is not None:
+            record["error"] = str(result.error)
+        _emit(record)
+    return EXIT_OK if ok and report.ok else EXIT_FAILED
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="pymatillion",
+        description=__doc__.strip().splitlines()[0],
+    )
+
+    def env_option(name, env, help):
+        default = os.environ.get(ENV_PREFIX + env)
+        parser.add_argument(name, default=default, help=f"{help} [${ENV_PREFIX}{env}]")
+
+    env_option("--url", "URL", "URL of the Matillion instance.")
+    env_option("--username", "USERNAME", "Matillion user name.")
+    env_option("--password", "PASSWORD", "Matillion password.")
+    env_option("--group", "GROUP", "Project group name.")
+    env_option("--project", "PROJECT", "Project name.")
+    parser.add_argument(
+        "-c",
+        "--concurrency",
+        type=int,
+        default=DEFAULT_MAX_CONCURRENCY,
+        help="Maximum number of requests in flight.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    def add_wait_options(command):
+        command.add_argument(
+            "--timeout", type=float, help="Give up waiting after this many seconds."
+        )
+        command.add_argument(
+            "--max-poll-interval",
+            type=float,
+            default=DEFAULT_MAX_POLL_INTERVAL,
+            help="Upper bound of the delay between polls of a task, in seconds.",
+        )
+        command.add_argument(
+            "--details",
+            action="store_true",
+            help="Include component results in the task details.",
+        )
+
+    run = commands.add_parser(
+        "run",
+        help="Run jobs from JSON lines.",
+        description="Run jobs from JSON lines of job names, `JobSpec` argument "
+        "lists or objects with job_name, job_variables, grid_variables, "
+        "project_name and version keys.",
+    )
+    run.add_argument("file", nargs="?", help="JSON lines file, stdin by default.")
+    run.add_argument(
+        "--wait",
+        action="store_true",
+        help="Wait for each task as soon as it is launched and print its final "
+        "details, with the index and job_name of its input line.",
+    )
+    add_wait_options(run)
+    run.set_defaults(handler=run_command)
+
+    wait = commands.add_parser(
+        "wait",
+        help="Wait for tasks to finish.",
+        description="Wait for tasks given as JSON lines of task IDs or objects "
+        "with a task_id key and an optional project_name key, such as the output "
+        "of `run`. Tasks of different projects are waited for at the same time.",
+    )
+    wait.add_argument("file", nargs="?", help="JSON lines file, stdin by default.")
+    add_wait_options(wait)
+    wait.set_defaults(handler=wait_command)
+
+    listing = commands.add_parser("list", help="List groups, projects, jobs, etc.")
+    listing.add_argument("resource", choices=LISTINGS)
+    listing.add_argument("--version", default=DEFAULT_VERSION)
+    listing.set_defaults(handler=list_command)
+
+    delete = commands.add_parser(
+        "delete",
+        help="Delete jobs or project versions.",
+        description="Delete the jobs or versions named in JSON lines, or those "
+        "matching --match.",
+    )
+    delete.add_argument("resource", choices=("jobs", "versions"))
+    delete.add_argument("file", nargs="?", help="JSON lines file, stdin by default.")
+    delete.add_argument("--match", help="Shell-style pattern of names to delete.")
+    delete.add_argument("--version", default=DEFAULT_VERSION)
+    delete.add_argument(
+        "--dry-run", action="store_true", help="Only print what would be deleted."
+    )
+    delete.set_defaults(handler=delete_command)
+    return parser
+
+
+def main(argv: Optional[Iterable[str]] = None) -> int:
+    """
+    Entry point of the `pymatillion` command.
+
+    Returns:
+        int : 0 if every operation succeeded, 1 otherwise.
+    """
+    args = build_parser().parse_args(argv)
+    # Imported here rather than at the top so `--help` does not load requests.
+    from requests import RequestException
+
+    try:
+        return args.handler(args)
+    except BrokenPipeError:
+        # The consumer of stdout went away, e.g. `pymatillion list jobs | head`.
+        # Point stdout at devnull so flushing it on exit does not fail again.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return EXIT_FAILED
+    except (RequestException, ValueError, TypeError, KeyError) as e:
+        print(f"pymatillion: error: {e}", file=sys.stderr)
+        return EXIT_FAILED
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,205 @@
+import math
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Deque, Dict, Iterator, Optional, Tuple
+
+from pymatillion.constants import (
+    DEFAULT_ADAPTIVE_BACKOFF_RATIO,
+    DEFAULT_ADAPTIVE_INITIAL_LIMIT,
+    DEFAULT_ADAPTIVE_LATENCY_TOLERANCE,
+    DEFAULT_ADAPTIVE_MAX_LIMIT,
+    DEFAULT_LIMIT_HISTORY,
+)
+
+# Weight of each new sample in the smoothed latency.
+_LATENCY_SMOOTHING = 0.2
+# Rate at which the baseline latency follows latencies above it, so a lasting
+# change in server latency eventually becomes the new normal.
+_BASELINE_DRIFT = 0.01
+# Latencies below this many seconds are treated as equal, so jitter on very fast
+# responses is not mistaken for congestion.
+_MIN_LATENCY = 0.001
+
+
+class Outcome:
+    """
+    Result of a request made within `AdaptiveLimiter.slot`, set by the caller.
+    """
+
+    __slots__ = ("failed",)
+
+    def __init__(self):
+        self.failed = False
+
+
+class AdaptiveLimiter:
+    """
+    Additive increase, multiplicative decrease (AIMD) limit on requests in flight.
+
+    While the smoothed latency stays within `latency_tolerance` times the lowest
+    latency seen, each request that completes raises the limit by `1 / limit`, i.e.
+    by one per round of `limit` requests, as long as the current limit has been
+    fully used. A failed request, or latency above that tolerance, multiplies the
+    limit by `backoff_ratio`, at most once per round: requests started before the
+    last decrease no longer change the limit.
+
+    Give a limiter to `MatillionClient(concurrency_limiter=...)` to apply it to
+    every request of the client, including those of bulk operations such as
+    `run_jobs` or `delete_jobs`. Their `max_concurrency` then only bounds the
+    worker threads and should be at least `maximum`.
+
+    Args:
+        initial (int): Starting limit.
+        minimum (int): Lowest limit.
+        maximum (int): Highest limit.
+        backoff_ratio (float): Factor applied to the limit on congestion, between
+            0 and 1.
+        latency_tolerance (float): Smoothed latency, as a multiple of the baseline
+            latency, above which the server is considered congested.
+        history_size (int): Number of limit changes kept in `history`.
+    """
+
+    def __init__(
+        self,
+        initial: int = DEFAULT_ADAPTIVE_INITIAL_LIMIT,
+        minimum: int = 1,
+        maximum: int = DEFAULT_ADAPTIVE_MAX_LIMIT,
+        backoff_ratio: float = DEFAULT_ADAPTIVE_BACKOFF_RATIO,
+        latency_tolerance: float = DEFAULT_ADAPTIVE_LATENCY_TOLERANCE,
+        history_size: int = DEFAULT_LIMIT_HISTORY,
+    ):
+        if not 1 <= minimum <= initial <= maximum:
+            raise ValueError("limits must satisfy 1 <= minimum <= initial <= maximum")
+        if not 0 < backoff_ratio < 1:
+            raise ValueError("backoff_ratio must be between 0 and 1")
+        if latency_tolerance <= 1:
+            raise ValueError("latency_tolerance must be greater than 1")
+        self.minimum = minimum
+        self.maximum = maximum
+        self.backoff_ratio = backoff_ratio
+        self.latency_tolerance = latency_tolerance
+        self.increases = 0
+        self.decreases = 0
+        self._limit = float(initial)
+        self._in_flight = 0
+        # Most requests in flight since the limit last changed.
+        self._peak_in_flight = 0
+        self._latency: Optional[float] = None
+        self._baseline: Optional[float] = None
+        self._decreased_at = -math.inf
+        self._condition = threading.Condition()
+        self.history: Deque[Tuple[float, int]] = deque(
+            [(time.time(), initial)], maxlen=history_size
+        )
+
+    @property
+    def limit(self) -> int:
+        """
+        Current number of requests allowed in flight.
+        """
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def acquire(self, timeout: Optional[float] = None) -> Optional[float]:
+        """
+        Wait for a free slot.
+
+        Returns:
+            float : Start time to pass to `release`, or None if `timeout` seconds
+                passed first.
+        """
+        with self._condition:
+            if not self._condition.wait_for(
+                lambda: self._in_flight < int(self._limit), timeout
+            ):
+                return None
+            self._in_flight += 1
+            self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+            return time.monotonic()
+
+    def release(self, started_at: float, failed: bool = False):
+        """
+        Free a slot and adjust the limit from the request's latency and outcome.
+
+        Args:
+            started_at (float): Value returned by `acquire`.
+            failed (bool): Whether the request failed in a way that indicates an
+                overloaded server, e.g. a connection error or HTTP 5xx.
+        """
+        now = time.monotonic()
+        with self._condition:
+            self._in_flight -= 1
+            if not failed:
+                self._observe(now - started_at)
+            congested = failed or (
+                self._latency
+                > max(self._baseline, _MIN_LATENCY) * self.latency_tolerance
+            )
+            if started_at < self._decreased_at:
+                # Started before the last decrease, which already accounted for it.
+                pass
+            elif congested:
+                self._decreased_at = now
+                self.decreases += 1
+                self._set_limit(max(self.minimum, self._limit * self.backoff_ratio))
+            elif (
+                self._peak_in_flight >= int(self._limit) and self._limit < self.maximum
+            ):
+                self.increases += 1
+                self._set_limit(min(self.maximum, self._limit + 1 / self._limit))
+            self._condition.notify_all()
+
+    def _observe(self, latency: float):
+        if self._latency is None:
+            self._latency = self._baseline = latency
+            return
+        self._latency += (latency - self._latency) * _LATENCY_SMOOTHING
+        if latency < self._baseline:
+            self._baseline = latency
+        else:
+            self._baseline += (latency - self._baseline) * _BASELINE_DRIFT
+
+    def _set_limit(self, limit: float):
+        previous = int(self._limit)
+        self._limit = limit
+        if int(limit) != previous:
+            self._peak_in_flight = self._in_flight
+            self.history.append((time.time(), int(limit)))
+
+    @contextmanager
+    def slot(self) -> Iterator[Outcome]:
+        """
+        Hold a slot for the duration of a request.
+
+        An exception raised within the block counts as a failure; set
+        `failed` on the yielded `Outcome` to report other failures.
+        """
+        started_at = self.acquire()
+        outcome = Outcome()
+        try:
+            yield outcome
+        except Exception:
+            outcome.failed = True
+            raise
+        finally:
+            self.release(started_at, failed=outcome.failed)
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        """
+        Current limit and load, latency estimates in seconds and number of
+        adjustments made in each direction.
+        """
+        return {
+            "limit": self.limit,
+            "in_flight": self._in_flight,
+            "latency": self._latency,
+            "baseline_latency": self._baseline,
+            "increases": self.increases,
+            "decreases": self.decreases,
+        }
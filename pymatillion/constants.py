@@ -11,3 +11,95 @@ API_DELETE = "delete"
 API_GET = "get"
 API_POST = "post"
 API_PUT = "put"
+
+# HTTP Connection Pool
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+
+# Concurrency
+DEFAULT_MAX_CONCURRENCY = 10
+
+# Task States
+TASK_STATE_SUCCESS = "SUCCESS"
+TASK_STATE_FAILED = "FAILED"
+TASK_STATE_CANCELLED = "CANCELLED"
+TERMINAL_TASK_STATES = frozenset(
+    [TASK_STATE_SUCCESS, TASK_STATE_FAILED, TASK_STATE_CANCELLED]
+)
+
+# Task Polling
+DEFAULT_POLL_INTERVAL = 1.0
+DEFAULT_MAX_POLL_INTERVAL = 30.0
+DEFAULT_POLL_MULTIPLIER = 2.0
+DEFAULT_POLL_JITTER = 0.2
+
+# Metadata Cache
+DEFAULT_CACHE_TTL = 300.0
+DEFAULT_CACHE_MAXSIZE = 256
+
+# Persistent Cache
+PERSISTENT_CACHE_FILE_NAME = "cache.sqlite3"
+DEFAULT_PERSISTENT_CACHE_MAXSIZE = 4096
+DEFAULT_PERSISTENT_CACHE_BUSY_TIMEOUT = 5.0
+
+# Run History
+HISTORY_FILE_NAME = "history.sqlite3"
+DEFAULT_HISTORY_BATCH_SIZE = 500
+DEFAULT_HISTORY_PERCENTILES = (50, 90, 99)
+
+# Retries
+DEFAULT_RETRY_ATTEMPTS = 3
+DEFAULT_RETRY_INTERVAL = 0.5
+DEFAULT_MAX_RETRY_INTERVAL = 30.0
+RETRY_STATUS_CODES = frozenset([429, 500, 502, 503, 504])
+
+# Circuit Breaker
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_RECOVERY_TIMEOUT = 30.0
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+
+# Adaptive Concurrency
+DEFAULT_ADAPTIVE_INITIAL_LIMIT = 4
+DEFAULT_ADAPTIVE_MAX_LIMIT = 64
+DEFAULT_ADAPTIVE_BACKOFF_RATIO = 0.5
+DEFAULT_ADAPTIVE_LATENCY_TOLERANCE = 2.0
+DEFAULT_LIMIT_HISTORY = 1024
+
+# Rate Limiting (lower values are served first)
+DEFAULT_PRIORITY = 1
+DEFAULT_METHOD_PRIORITIES = {API_POST: 0, API_GET: 1}
+
+# Instrumentation
+DEFAULT_LATENCY_SAMPLES = 1024
+
+# Streaming
+DEFAULT_STREAM_CHUNK_SIZE = 64 * 1024
+
+# Request Payloads
+DEFAULT_GZIP_LEVEL = 1
+HTTP_UNSUPPORTED_MEDIA_TYPE = 415
+
+# Export / import
+MANIFEST_FILE_NAME = "manifest.json"
+EXPORT_FILE_SUFFIX = ".json"
+TRANSFER_EXPORTED = "EXPORTED"
+TRANSFER_IMPORTED = "IMPORTED"
+TRANSFER_UNCHANGED = "UNCHANGED"
+TRANSFER_FAILED = "FAILED"
+
+# Batch deletion
+DELETE_PLANNED = "PLANNED"
+DELETE_DELETED = "DELETED"
+DELETE_FAILED = "FAILED"
+DELETE_MISSING = "MISSING"
+DELETE_SKIPPED = "SKIPPED"
+
+# Job DAGs
+DAG_FAIL_FAST = "fail_fast"
+DAG_CONTINUE = "continue"
+NODE_SUCCEEDED = "SUCCEEDED"
+NODE_FAILED = "FAILED"
+NODE_SKIPPED = "SKIPPED"
+NODE_RESUMED = "RESUMED"
@@ -0,0 +1,327 @@
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from pymatillion.backoff import Backoff
+from pymatillion.constants import (
+    DAG_CONTINUE,
+    DAG_FAIL_FAST,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_VERSION,
+    NODE_FAILED,
+    NODE_RESUMED,
+    NODE_SKIPPED,
+    NODE_SUCCEEDED,
+    TASK_STATE_SUCCESS,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class DagNode:
+    """
+    A Matillion job run within a `JobDag`.
+
+    `name` identifies the node within the DAG and defaults to `job_name`, so the
+    same job can appear several times under different names.
+    """
+
+    job_name: str
+    depends_on: Tuple[str, ...] = ()
+    job_variables: Dict = field(default_factory=dict, hash=False)
+    grid_variables: Dict = field(default_factory=dict, hash=False)
+    project_name: Optional[str] = None
+    version: str = DEFAULT_VERSION
+    name: Optional[str] = None
+
+    def __post_init__(self):
+        if self.name is None:
+            object.__setattr__(self, "name", self.job_name)
+        if isinstance(self.depends_on, str):
+            object.__setattr__(self, "depends_on", (self.depends_on,))
+        else:
+            object.__setattr__(self, "depends_on", tuple(self.depends_on))
+
+
+class JobDag:
+    """
+    Validated dependency graph of Matillion jobs.
+
+    Args:
+        nodes (iterable): `DagNode` objects or dictionaries of their fields.
+    Raises:
+        ValueError : If node names repeat, a dependency is unknown or the
+            dependencies form a cycle.
+    """
+
+    def __init__(self, nodes: Iterable):
+        self.nodes: Dict[str, DagNode] = {}
+        for node in nodes:
+            if isinstance(node, dict):
+                node = DagNode(**node)
+            if node.name in self.nodes:
+                raise ValueError(f"Duplicate DAG node: {node.name}")
+            self.nodes[node.name] = node
+        self.children: Dict[str, List[str]] = {name: [] for name in self.nodes}
+        for node in self.nodes.values():
+            for parent in node.depends_on:
+                if parent not in self.nodes:
+                    raise ValueError(f"{node.name} depends on unknown node {parent}")
+                self.children[parent].append(node.name)
+        self.order = self._topological_order()
+
+    def _topological_order(self) -> List[str]:
+        indegree = {name: len(node.depends_on) for name, node in self.nodes.items()}
+        order = [name for name, degree in indegree.items() if degree == 0]
+        for name in order:
+            for child in self.children[name]:
+                indegree[child] -= 1
+                if indegree[child] == 0:
+                    order.append(child)
+        if len(order) != len(self.nodes):
+            cycle = sorted(name for name, degree in indegree.items() if degree)
+            raise ValueError(f"DAG contains a cycle through: {cycle}")
+        return order
+
+    def descendants(self, name: str) -> List[str]:
+        """
+        Names of the nodes that directly or indirectly depend on `name`.
+        """
+        seen = {}
+        stack = list(self.children[name])
+        while stack:
+            child = stack.pop()
+            if child not in seen:
+                seen[child] = None
+                stack.extend(self.children[child])
+        return list(seen)
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+
+@dataclass
+class NodeResult:
+    """
+    Outcome of one DAG node.
+
+    `started_at` and `finished_at` are seconds since the start of the DAG run and
+    are None for nodes that did not run.
+    """
+
+    name: str
+    status: str
+    task_id: Optional[int] = None
+    task: Optional[Dict] = field(default=None, repr=False)
+    error: Optional[BaseException] = field(default=None, repr=False)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.status in (NODE_SUCCEEDED, NODE_RESUMED)
+
+    @property
+    def duration(self) -> float:
+        if self.started_at is None or self.finished_at is None:
+            return 0.0
+        return self.finished_at - self.started_at
+
+
+@dataclass
+class DagRunReport:
+    """
+    Outcome of `run_dag`, with per-node results in topological order.
+    """
+
+    results: Dict[str, NodeResult]
+    elapsed: float
+    critical_path: List[str]
+    critical_path_duration: float
+
+    @property
+    def ok(self) -> bool:
+        return all(result.ok for result in self.results.values())
+
+    @property
+    def succeeded(self) -> List[str]:
+        """
+        Nodes that succeeded in this or a resumed run. Pass as `completed` to
+        `run_dag` to resume from the failure.
+        """
+        return [name for name, result in self.results.items() if result.ok]
+
+    @property
+    def failed(self) -> List[str]:
+        return self._with_status(NODE_FAILED)
+
+    @property
+    def skipped(self) -> List[str]:
+        return self._with_status(NODE_SKIPPED)
+
+    def _with_status(self, status: str) -> List[str]:
+        return [
+            name for name, result in self.results.items() if result.status == status
+        ]
+
+
+def critical_path(
+    dag: JobDag, results: Dict[str, NodeResult]
+) -> Tuple[List[str], float]:
+    """
+    Longest chain of dependent nodes, weighted by node duration.
+
+    Returns:
+        tuple : (node names from root to leaf, total duration in seconds).
+    """
+    # Longest path ending at each node, as (duration, predecessor).
+    best: Dict[str, Tuple[float, Optional[str]]] = {}
+    for name in dag.order:
+        parent = max(dag.nodes[name].depends_on, key=lambda p: best[p][0], default=None)
+        start = best[parent][0] if parent is not None else 0.0
+        best[name] = (start + results[name].duration, parent)
+    if not best:
+        return [], 0.0
+    name = max(best, key=lambda n: best[n][0])
+    total = best[name][0]
+    path = []
+    while name is not None:
+        path.append(name)
+        name = best[name][1]
+    return path[::-1], total
+
+
+def _run_node(
+    client,
+    node: DagNode,
+    started: float,
+    backoff: Optional[Backoff],
+    task_timeout: Optional[float],
+) -> NodeResult:
+    result = NodeResult(node.name, NODE_FAILED, started_at=time.monotonic() - started)
+    try:
+        response = client.run_job(
+            node.job_name,
+            node.job_variables,
+            node.grid_variables,
+            node.project_name,
+            node.version,
+        )
+        if not response.get("success", True):
+            raise RuntimeError(response.get("msg") or "Job launch was rejected")
+        result.task_id = response["id"]
+        result.task = client.wait_for_task(
+            result.task_id,
+            project_name=node.project_name,
+            timeout=task_timeout,
+            backoff=backoff,
+        )
+        if result.task.get("state") == TASK_STATE_SUCCESS:
+            result.status = NODE_SUCCEEDED
+    except Exception as e:
+        logger.error(f"DAG node {node.name} failed: {e}")
+        result.error = e
+    result.finished_at = time.monotonic() - started
+    return result
+
+
+def run_dag(
+    client,
+    dag,
+    policy: str = DAG_FAIL_FAST,
+    completed: Iterable[str] = (),
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    backoff: Optional[Backoff] = None,
+    task_timeout: Optional[float] = None,
+) -> DagRunReport:
+    """
+    Run a DAG of Matillion jobs, starting each job as soon as its parents succeed.
+
+    Each running node launches its job and then polls the task until it finishes,
+    so independent branches progress concurrently up to `max_concurrency` nodes.
+
+    With the `fail_fast` policy, no new node starts after a failure; nodes already
+    running are waited for, since Matillion tasks cannot be cancelled through the
+    API. With the `continue` policy, only the descendants of a failed node are
+    skipped. Either way, skipped nodes are reported as `SKIPPED`.
+
+    Args:
+        client (MatillionClient): Client used to run and poll the jobs.
+        dag (JobDag or iterable): The DAG, or its nodes.
+        policy (str): `fail_fast` or `continue`.
+        completed (iterable): Names of nodes that already succeeded, e.g.
+            `DagRunReport.succeeded` of a previous run. They are reported as
+            `RESUMED` and not run again.
+        max_concurrency (int): Maximum number of nodes running at once.
+        backoff (Backoff): Task poll interval schedule.
+        task_timeout (float): Seconds to wait for each task, or None to wait
+            forever. A task still running after that counts as failed.
+    Returns:
+        DagRunReport : Results of every node and critical path timing.
+    Raises:
+        ValueError : If the policy is unknown or `completed` names unknown nodes.
+    """
+    if policy not in (DAG_FAIL_FAST, DAG_CONTINUE):
+        raise ValueError(f"Unknown DAG failure policy: {policy}")
+    if not isinstance(dag, JobDag):
+        dag = JobDag(dag)
+    completed = set(completed)
+    unknown = completed.difference(dag.nodes)
+    if unknown:
+        raise ValueError(f"Unknown completed nodes: {sorted(unknown)}")
+
+    started = time.monotonic()
+    results = {name: NodeResult(name, NODE_RESUMED) for name in completed}
+    waiting = {
+        name: sum(parent not in completed for parent in node.depends_on)
+        for name, node in dag.nodes.items()
+        if name not in completed
+    }
+    ready = [name for name in dag.order if waiting.get(name) == 0]
+    stopped = False
+    executor = ThreadPoolExecutor(
+        max_workers=max(1, min(max_concurrency, len(dag))),
+        thread_name_prefix="pymatillion-dag",
+    )
+    running = {}
+
+    def skip(names):
+        for name in names:
+            if name not in results:
+                results[name] = NodeResult(name, NODE_SKIPPED)
+                waiting.pop(name, None)
+
+    try:
+        while ready or running:
+            while ready and not stopped and len(running) < max_concurrency:
+                name = ready.pop(0)
+                future = executor.submit(
+                    _run_node, client, dag.nodes[name], started, backoff, task_timeout
+                )
+                running[future] = name
+            if not running:
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                result = results[name] = future.result()
+                if result.ok:
+                    for child in dag.children[name]:
+                        if child in waiting:
+                            waiting[child] -= 1
+                            if waiting[child] == 0:
+                                ready.append(child)
+                    continue
+                skip(dag.descendants(name))
+                if policy == DAG_FAIL_FAST:
+                    stopped = True
+        skip(dag.order)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+    ordered = {name: results[name] for name in dag.order}
+    path, duration = critical_path(dag, ordered)
+    return DagRunReport(ordered, time.monotonic() - started, path, duration)
@@ -0,0 +1,180 @@
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from pymatillion.constants import (
+    API_GET,
+    API_POST,
+    BASE_URL,
+    PASSWORD,
+    PROJECT_GROUP_NAME,
+    PROJECT_NAME,
+    USERNAME,
+)
+
+# Route scopes, each extending the path prefix of the previous one.
+SCOPE_ROOT = 0
+SCOPE_GROUP = 1
+SCOPE_PROJECT = 2
+SCOPE_VERSION = 3
+
+_SCOPE_TEMPLATES = (
+    "",
+    "/group/name/{group}",
+    "/group/name/{group}/project/name/{project}",
+    "/group/name/{group}/project/name/{project}/version/name/{version}",
+)
+
+# Upper bound on the (project, version) prefixes cached per client.
+MAX_CACHED_PREFIXES = 256
+
+# Attributes defining the scope of a client's requests.
+SCOPE_ATTRIBUTES = frozenset(
+    [BASE_URL, USERNAME, PASSWORD, PROJECT_GROUP_NAME, PROJECT_NAME]
+)
+
+
+class Route(NamedTuple):
+    """
+    A Matillion REST endpoint.
+
+    `path` is appended to the prefix of `scope` and may contain `{job}` or `{id}`
+    fields. `endpoint` is the full template reported to instrumentation hooks.
+    """
+
+    method: str
+    scope: int
+    path: str
+    endpoint: str
+
+
+def route(method: str, scope: int, path: str) -> Route:
+    return Route(method, scope, path, f"{_SCOPE_TEMPLATES[scope]}{path}"[1:])
+
+
+LIST_PROJECT_GROUPS = route(API_GET, SCOPE_ROOT, "/group")
+LIST_PROJECTS = route(API_GET, SCOPE_GROUP, "/project")
+LIST_VERSIONS = route(API_GET, SCOPE_PROJECT, "/version")
+LIST_JOBS = route(API_GET, SCOPE_VERSION, "/job")
+RUN_JOB = route(API_POST, SCOPE_VERSION, "/job/name/{job}/run")
+EXPORT_JOB = route(API_GET, SCOPE_VERSION, "/job/name/{job}/export")
+IMPORT_JOB = route(API_POST, SCOPE_VERSION, "/job/import")
+GET_TASK_DETAILS = route(API_GET, SCOPE_PROJECT, "/task/id/{id}")
+LIST_RUNNING_TASKS = route(API_GET, SCOPE_PROJECT, "/task/running")
+DELETE_VERSION = route(API_POST, SCOPE_VERSION, "/delete")
+DELETE_JOB = route(API_POST, SCOPE_VERSION, "/job/name/{job}/delete")
+
+
+class Endpoints:
+    """
+    Resolve routes to URLs for one client scope.
+
+    The root and group prefixes are built once, and project and version prefixes
+    the first time they are used, so resolving a route costs a dictionary lookup
+    plus, for routes with fields, a single `str.format` call. Build a new instance
+    when the base URL or project group changes.
+
+    Args:
+        base_url (str): URL of the Matillion instance.
+        project_group_name (str): Name of the project group.
+    """
+
+    def __init__(self, base_url: str, project_group_name: Optional[str]):
+        self._root = f"{base_url}/rest/v1"
+        self._group = f"{self._root}/group/name/{project_group_name}"
+        self._prefixes: Dict[Tuple[str, Optional[str]], str] = {}
+
+    def prefix(self, scope: int, project_name: str = None, version: str = None) -> str:
+        """
+        URL prefix of a scope.
+
+        Raises:
+            ValueError : If a project or version scoped prefix is missing its
+                project or version. Dropping the segment would widen the scope,
+                e.g. turn deleting a version into deleting the whole project.
+        """
+        if scope == SCOPE_ROOT:
+            return self._root
+        if scope == SCOPE_GROUP:
+            return self._group
+        if project_name is None:
+            raise ValueError("A project name is required for this endpoint")
+        if scope == SCOPE_PROJECT:
+            version = None
+        elif version is None:
+            raise ValueError("A version is required for this endpoint")
+        key = (project_name, version)
+        prefix = self._prefixes.get(key)
+        if prefix is None:
+            prefix = f"{self._group}/project/name/{project_name}"
+            if version is not None:
+                prefix = f"{prefix}/version/name/{version}"
+            if len(self._prefixes) >= MAX_CACHED_PREFIXES:
+                self._prefixes.clear()
+            self._prefixes[key] = prefix
+        return prefix
+
+    def url(
+        self,
+        route: Route,
+        project_name: str = None,
+        version: str = None,
+        **fields,
+    ) -> str:
+        """
+        URL of a route.
+
+        Args:
+            route (Route): Endpoint to resolve.
+            project_name (str): Project of project and version scoped routes.
+            version (str): Version of version scoped routes.
+            fields : Values of the fields of `route.path`, e.g. `job` or `id`.
+        """
+        prefix = self.prefix(route.scope, project_name, version)
+        if fields:
+            return prefix + route.path.format_map(fields)
+        return prefix + route.path
+
+
+class ScopedClient:
+    """
+    Scope handling shared by `MatillionClient` and `AsyncMatillionClient`.
+
+    Assigning any of the scope attributes (base URL, credentials, project group
+    or project) resets the attribute checks of `_ensure_attributes` and the
+    `endpoints` resolver, so both follow the client's current scope.
+    """
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in SCOPE_ATTRIBUTES:
+            self._reset_scope()
+
+    def _reset_scope(self):
+        # Validate again and rebuild endpoint prefixes for the new scope.
+        super().__setattr__("_valid_attributes", set())
+        super().__setattr__("_endpoints", None)
+
+    def _ensure_attributes(self, *args):
+        # Each combination of attributes is only checked once per scope.
+        if args in self._valid_attributes:
+            return
+        attributes_to_check = set(args)
+        invalid_attributes = []
+        for attr in attributes_to_check:
+            if (getattr(self, attr) is None) or (not getattr(self, attr)):
+                invalid_attributes.append(attr)
+        if invalid_attributes:
+            raise ValueError(f'Undefined attributes: {",".join(invalid_attributes)}')
+        else:
+            self._valid_attributes.add(args)
+
+    @property
+    def endpoints(self) -> Endpoints:
+        """
+        Route resolver for the client's base URL and project group.
+
+        Returns:
+            Endpoints : Resolver, rebuilt whenever a scope attribute changes.
+        """
+        if self._endpoints is None:
+            self._endpoints = Endpoints(self.base_url, self.project_group_name)
+        return self._endpoints
@@ -0,0 +1,31 @@
+from typing import Dict, List, Optional
+
+
+class TaskWaitTimeout(TimeoutError):
+    """
+    Raised when Matillion tasks do not reach a terminal state before the deadline.
+
+    Attributes:
+        pending (list): IDs of the tasks that were still running.
+        completed (dict): Final task details of the tasks that did finish, by ID.
+    """
+
+    def __init__(
+        self, message: str, pending: List[int], completed: Optional[Dict] = None
+    ):
+        super().__init__(message)
+        self.pending = pending
+        self.completed = completed if completed is not None else {}
+
+
+class CircuitOpenError(ConnectionError):
+    """
+    Raised instead of making a request while the circuit breaker is open.
+
+    Attributes:
+        retry_in (float): Seconds until the breaker lets a trial request through.
+    """
+
+    def __init__(self, message: str, retry_in: float):
+        super().__init__(message)
+        self.retry_in = retry_in
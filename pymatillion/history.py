@@ -0,0 +1,413 @@
+import logging
+import math
+import os
+import queue
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from pymatillion.cache import default_cache_directory
+from pymatillion.constants import (
+    DEFAULT_HISTORY_BATCH_SIZE,
+    DEFAULT_HISTORY_PERCENTILES,
+    DEFAULT_PERSISTENT_CACHE_BUSY_TIMEOUT,
+    HISTORY_FILE_NAME,
+    TASK_STATE_SUCCESS,
+    TERMINAL_TASK_STATES,
+)
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS runs ("
+    "recorded_at REAL NOT NULL, group_name TEXT, project_name TEXT, version TEXT,"
+    " job_name TEXT, task_id INTEGER, success INTEGER, message TEXT)",
+    "CREATE TABLE IF NOT EXISTS tasks ("
+    "group_name TEXT, project_name TEXT, task_id INTEGER, version TEXT,"
+    " job_name TEXT, environment TEXT, state TEXT, enqueued_time INTEGER,"
+    " start_time INTEGER, end_time INTEGER, duration REAL, row_count INTEGER,"
+    " message TEXT, recorded_at REAL NOT NULL,"
+    " PRIMARY KEY (group_name, project_name, task_id))",
+    "CREATE TABLE IF NOT EXISTS components ("
+    "group_name TEXT, project_name TEXT, task_id INTEGER, component_task_id INTEGER,"
+    " parent_id INTEGER, type TEXT, job_name TEXT, component_name TEXT, state TEXT,"
+    " row_count INTEGER, start_time INTEGER, end_time INTEGER, duration REAL,"
+    " message TEXT,"
+    " PRIMARY KEY (group_name, project_name, task_id, component_task_id))",
+    "CREATE INDEX IF NOT EXISTS runs_job ON runs (job_name, recorded_at)",
+    "CREATE INDEX IF NOT EXISTS tasks_job ON tasks (job_name, start_time)",
+    "CREATE INDEX IF NOT EXISTS tasks_project ON tasks (project_name, start_time)",
+    "CREATE INDEX IF NOT EXISTS tasks_start ON tasks (start_time)",
+)
+
+# Queue item kinds.
+_RUN = 0
+_TASK = 1
+_FLUSH = 2
+_STOP = 3
+
+_TERMINAL_STATES = tuple(sorted(TERMINAL_TASK_STATES))
+
+
+def _duration(start_time: Optional[int], end_time: Optional[int]) -> Optional[float]:
+    # Matillion reports times in milliseconds since the epoch.
+    if start_time is None or end_time is None:
+        return None
+    return (end_time - start_time) / 1000
+
+
+def percentile(ordered: Sequence[float], value: float) -> float:
+    """
+    Nearest-rank percentile of sorted values.
+    """
+    return ordered[max(0, math.ceil(value / 100 * len(ordered)) - 1)]
+
+
+class RunRecorder:
+    """
+    Local history of job launches and task details, stored in SQLite.
+
+    `MatillionClient` hands every `run_job` response and `get_task_details` result
+    to the recorder, which only queues it: a background thread writes queued
+    records in batches, so recording adds no I/O to the API call path. Task details
+    are kept once per task, updated each time the task is polled, together with
+    their component results. Call `flush` to wait for queued records to be written;
+    the query helpers do so before reading.
+
+    Tasks are indexed by job, project and start time. Only finished tasks are
+    taken into account by the query helpers.
+
+    Args:
+        path (str): Database file. Defaults to `history.sqlite3` in
+            `default_cache_directory()`.
+        batch_size (int): Maximum number of records written per transaction.
+        busy_timeout (float): Seconds to wait for a lock held by another process.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Union[str, os.PathLike]] = None,
+        batch_size: int = DEFAULT_HISTORY_BATCH_SIZE,
+        busy_timeout: float = DEFAULT_PERSISTENT_CACHE_BUSY_TIMEOUT,
+    ):
+        self.path = (
+            Path(path) if path else default_cache_directory() / HISTORY_FILE_NAME
+        )
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.batch_size = batch_size
+        self.busy_timeout = busy_timeout
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._queue: Optional[queue.SimpleQueue] = None
+        self._writer: Optional[threading.Thread] = None
+        self._writer_pid = None
+        connection = self._connect()
+        with connection:
+            for statement in _SCHEMA:
+                connection.execute(statement)
+        self._local.connection = connection
+        self._local.pid = os.getpid()
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, timeout=self.busy_timeout)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        # Connections must not be shared with a forked child.
+        if connection is None or self._local.pid != os.getpid():
+            connection = self._local.connection = self._connect()
+            self._local.pid = os.getpid()
+        return connection
+
+    def _put(self, item: Tuple):
+        if self._writer_pid != os.getpid():
+            with self._lock:
+                # The writer thread does not survive a fork; start one per process.
+                if self._writer_pid != os.getpid():
+                    self._queue = queue.SimpleQueue()
+                    self._writer = threading.Thread(
+                        target=self._write_loop,
+                        args=(self._queue,),
+                        name="pymatillion-history",
+                        daemon=True,
+                    )
+                    self._writer.start()
+                    self._writer_pid = os.getpid()
+        self._queue.put(item)
+
+    def record_run(
+        self,
+        response: Dict,
+        job_name: str,
+        project_name: str = None,
+        version: str = None,
+        group_name: str = None,
+    ):
+        """
+        Queue a `run_job` response.
+        """
+        row = (
+            time.time(),
+            group_name,
+            project_name,
+            version,
+            job_name,
+            response.get("id"),
+            response.get("success"),
+            response.get("msg"),
+        )
+        self._put((_RUN, row))
+
+    def record_task(self, task: Dict):
+        """
+        Queue task details as returned by `get_task_details`.
+
+        The dictionary is converted by the writer thread and must not be modified
+        afterwards.
+        """
+        self._put((_TASK, (time.time(), task)))
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every record queued so far has been written.
+
+        Returns:
+            bool : False if `timeout` seconds passed first.
+        """
+        if self._writer_pid != os.getpid():
+            return True
+        written = threading.Event()
+        self._queue.put((_FLUSH, written))
+        return written.wait(timeout)
+
+    def close(self):
+        """
+        Write queued records, stop the writer thread and close the calling thread's
+        database connection.
+        """
+        if self._writer_pid == os.getpid():
+            self._queue.put((_STOP, None))
+            self._writer.join()
+            self._writer_pid = None
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    def __enter__(self) -> "RunRecorder":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _write_loop(self, items: queue.SimpleQueue):
+        connection = self._connect()
+        try:
+            while True:
+                batch = [items.get()]
+                while len(batch) < self.batch_size:
+                    try:
+                        batch.append(items.get_nowait())
+                    except queue.Empty:
+                        break
+                try:
+                    self._write(connection, batch)
+                except Exception as e:
+                    logger.error(f"Failed to record {len(batch)} history records: {e}")
+                stop = False
+                for kind, payload in batch:
+                    if kind == _FLUSH:
+                        payload.set()
+                    elif kind == _STOP:
+                        stop = True
+                if stop:
+                    return
+        finally:
+            connection.close()
+
+    @staticmethod
+    def _write(connection: sqlite3.Connection, batch: List[Tuple]):
+        runs, tasks, components = [], [], []
+        for kind, payload in batch:
+            if kind == _RUN:
+                runs.append(payload)
+            elif kind == _TASK:
+                recorded_at, task = payload
+                get = task.get
+                key = (get("groupName"), get("projectName"), get("id"))
+                tasks.append(
+                    (
+                        *key,
+                        get("versionName"),
+                        get("jobName"),
+                        get("environmentName"),
+                        get("state"),
+                        get("enqueuedTime"),
+                        get("startTime"),
+                        get("endTime"),
+                        _duration(get("startTime"), get("endTime")),
+                        get("rowCount"),
+                        get("message"),
+                        recorded_at,
+                    )
+                )
+                for component in get("tasks") or ():
+                    get_component = component.get
+                    components.append(
+                        (
+                            *key,
+                            get_component("taskID"),
+                            get_component("parentID"),
+                            get_component("type"),
+                            get_component("jobName"),
+                            get_component("componentName"),
+                            get_component("state"),
+                            get_component("rowCount"),
+                            get_component("startTime"),
+                            get_component("endTime"),
+                            _duration(
+                                get_component("startTime"), get_component("endTime")
+                            ),
+                            get_component("message"),
+                        )
+                    )
+        if not (runs or tasks):
+            return
+        with connection:
+            connection.executemany(
+                "INSERT INTO runs VALUES (?, ?, ?, ?, ?, ?, ?, ?)", runs
+            )
+            connection.executemany(
+                "INSERT OR REPLACE INTO tasks"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                tasks,
+            )
+            connection.executemany(
+                "INSERT OR REPLACE INTO components"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                components,
+            )
+
+    def _query(
+        self,
+        sql: str,
+        job_name: str = None,
+        project_name: str = None,
+        since: Optional[float] = None,
+        suffix: str = "",
+        parameters: Iterable = (),
+    ) -> List[Tuple]:
+        # Filters apply to the tasks table, which every query reads from.
+        self.flush()
+        conditions = [f"tasks.state IN ({', '.join('?' * len(_TERMINAL_STATES))})"]
+        values = list(_TERMINAL_STATES)
+        if job_name is not None:
+            conditions.append("tasks.job_name = ?")
+            values.append(job_name)
+        if project_name is not None:
+            conditions.append("tasks.project_name = ?")
+            values.append(project_name)
+        if since is not None:
+            conditions.append("tasks.start_time >= ?")
+            values.append(since * 1000)
+        sql = f"{sql} WHERE {' AND '.join(conditions)} {suffix}"
+        return self._connection().execute(sql, [*values, *parameters]).fetchall()
+
+    def duration_percentiles(
+        self,
+        job_name: str = None,
+        project_name: str = None,
+        since: Optional[float] = None,
+        percentiles: Sequence[float] = DEFAULT_HISTORY_PERCENTILES,
+    ) -> Dict[str, Dict[str, float]]:
+        """
+        Duration percentiles of finished tasks, per job.
+
+        Args:
+            job_name (str): Only include this job.
+            project_name (str): Only include tasks of this project.
+            since (float): Only include tasks started after this Unix time.
+            percentiles (sequence): Percentiles to compute, between 0 and 100.
+        Returns:
+            dict : By job name, `{"count": n, "p50": seconds, ...}`.
+        """
+        rows = self._query(
+            "SELECT job_name, duration FROM tasks",
+            job_name,
+            project_name,
+            since,
+            suffix="AND duration IS NOT NULL ORDER BY job_name, duration",
+        )
+        durations: Dict[str, List[float]] = {}
+        for name, duration in rows:
+            durations.setdefault(name, []).append(duration)
+        return {
+            name: {
+                "count": len(values),
+                **{f"p{value:g}": percentile(values, value) for value in percentiles},
+            }
+            for name, values in durations.items()
+        }
+
+    def failure_rates(
+        self,
+        job_name: str = None,
+        project_name: str = None,
+        since: Optional[float] = None,
+    ) -> Dict[str, Dict[str, float]]:
+        """
+        Share of finished tasks that did not succeed, per job.
+
+        Returns:
+            dict : By job name, `{"runs": n, "failures": n, "failure_rate": ratio}`.
+        """
+        rows = self._query(
+            f"SELECT job_name, COUNT(*), SUM(state != '{TASK_STATE_SUCCESS}') FROM tasks",
+            job_name,
+            project_name,
+            since,
+            suffix="GROUP BY job_name ORDER BY job_name",
+        )
+        return {
+            name: {"runs": runs, "failures": failures, "failure_rate": failures / runs}
+            for name, runs, failures in rows
+        }
+
+    def slowest_components(
+        self,
+        job_name: str = None,
+        project_name: str = None,
+        since: Optional[float] = None,
+        limit: int = 10,
+    ) -> List[Dict]:
+        """
+        Components with the longest average duration across finished tasks.
+
+        Args:
+            job_name (str): Only include components of tasks of this job.
+            project_name (str): Only include tasks of this project.
+            since (float): Only include tasks started after this Unix time.
+            limit (int): Maximum number of components returned.
+        Returns:
+            list : Dictionaries with `job_name`, `component_name`, `runs`,
+                `avg_duration` and `max_duration`, slowest first.
+        """
+        rows = self._query(
+            "SELECT components.job_name, components.component_name, COUNT(*),"
+            " AVG(components.duration), MAX(components.duration)"
+            " FROM components JOIN tasks USING (group_name, project_name, task_id)",
+            job_name,
+            project_name,
+            since,
+            suffix="AND components.duration IS NOT NULL"
+            " GROUP BY components.job_name, components.component_name"
+            " ORDER BY AVG(components.duration) DESC LIMIT ?",
+            parameters=(limit,),
+        )
+        keys = ("job_name", "component_name", "runs", "avg_duration", "max_duration")
+        return [dict(zip(keys, row)) for row in rows]
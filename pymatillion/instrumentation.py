@@ -0,0 +1,168 @@
+import logging
+import math
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, Iterable, List, Optional
+
+import requests
+
+from pymatillion.constants import DEFAULT_LATENCY_SAMPLES
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class RequestEvent:
+    """
+    A single HTTP attempt made by `MatillionClient`.
+
+    Pre-request hooks receive the event before the request is sent; post-request
+    hooks receive it once `status`, `bytes`, `elapsed` or `error` are filled in.
+    """
+
+    method: str
+    endpoint: str
+    url: str
+    attempt: int = 0
+    status: Optional[int] = None
+    bytes: Optional[int] = None
+    elapsed: Optional[float] = None
+    error: Optional[BaseException] = None
+
+    @property
+    def failed(self) -> bool:
+        return self.error is not None or (self.status or 0) >= 400
+
+
+RequestHook = Callable[[RequestEvent], None]
+
+
+class Instrumentation:
+    """
+    Pre and post request hooks invoked around every HTTP attempt.
+
+    Exceptions raised by hooks are logged and never interrupt the API call.
+
+    Args:
+        pre_request_hooks (iterable): Callables receiving a `RequestEvent` before
+            the request is sent.
+        post_request_hooks (iterable): Callables receiving the completed
+            `RequestEvent`.
+    """
+
+    def __init__(
+        self,
+        pre_request_hooks: Iterable[RequestHook] = (),
+        post_request_hooks: Iterable[RequestHook] = (),
+    ):
+        self.pre_request_hooks: List[RequestHook] = list(pre_request_hooks)
+        self.post_request_hooks: List[RequestHook] = list(post_request_hooks)
+
+    def add_pre_request_hook(self, hook: RequestHook):
+        self.pre_request_hooks.append(hook)
+
+    def add_post_request_hook(self, hook: RequestHook):
+        self.post_request_hooks.append(hook)
+
+    def observe(
+        self,
+        event: RequestEvent,
+        send: Callable[[], requests.Response],
+        stream: bool = False,
+    ) -> requests.Response:
+        """
+        Run `send` between the pre and post request hooks.
+
+        For streamed responses the body is not read: `elapsed` covers the time to
+        the response headers and `bytes` comes from the `Content-Length` header.
+        """
+        self._run_hooks(self.pre_request_hooks, event)
+        started_at = time.perf_counter()
+        try:
+            response = send()
+        except Exception as e:
+            event.error = e
+            raise
+        else:
+            event.status = response.status_code
+            if stream:
+                content_length = response.headers.get("Content-Length")
+                event.bytes = int(content_length) if content_length else None
+            else:
+                event.bytes = len(response.content)
+            return response
+        finally:
+            event.elapsed = time.perf_counter() - started_at
+            self._run_hooks(self.post_request_hooks, event)
+
+    @staticmethod
+    def _run_hooks(hooks: List[RequestHook], event: RequestEvent):
+        for hook in hooks:
+            try:
+                hook(event)
+            except Exception:
+                logger.exception(f"Request hook {hook!r} failed")
+
+
+class LatencyAggregator:
+    """
+    In-process latency and error rate statistics per endpoint.
+
+    Register an instance as a post-request hook. Latency percentiles are computed
+    over the most recent `max_samples` requests of each endpoint.
+    """
+
+    def __init__(self, max_samples: int = DEFAULT_LATENCY_SAMPLES):
+        self.max_samples = max_samples
+        self._samples: Dict[str, Deque[float]] = {}
+        self._counts: Dict[str, List[int]] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, event: RequestEvent):
+        key = f"{event.method.upper()} {event.endpoint}"
+        with self._lock:
+            samples = self._samples.get(key)
+            if samples is None:
+                samples = self._samples[key] = deque(maxlen=self.max_samples)
+                self._counts[key] = [0, 0]
+            samples.append(event.elapsed)
+            counts = self._counts[key]
+            counts[0] += 1
+            counts[1] += event.failed
+
+    @staticmethod
+    def _percentile(ordered: List[float], percentile: float) -> float:
+        index = max(0, math.ceil(percentile / 100 * len(ordered)) - 1)
+        return ordered[index]
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """
+        Statistics keyed by `"<METHOD> <endpoint template>"`.
+
+        Returns:
+            dict : count, errors, error_rate and p50/p95/p99 latency in seconds for
+                each endpoint.
+        """
+        with self._lock:
+            snapshot = {
+                key: (sorted(samples), list(self._counts[key]))
+                for key, samples in self._samples.items()
+            }
+        return {
+            key: {
+                "count": count,
+                "errors": errors,
+                "error_rate": errors / count,
+                "p50": self._percentile(ordered, 50),
+                "p95": self._percentile(ordered, 95),
+                "p99": self._percentile(ordered, 99),
+            }
+            for key, (ordered, (count, errors)) in snapshot.items()
+        }
+
+    def reset(self):
+        with self._lock:
+            self._samples.clear()
+            self._counts.clear()
@@ -1,103 +1,435 @@
+from __future__ import annotations
+
 import logging
-from typing import Dict, List
+import os
+import time
+from functools import partial
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Collection,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import requests
+from requests.adapters import HTTPAdapter
 
+from pymatillion.backoff import Backoff
 from pymatillion.constants import (
     API_GET,
-    API_POST,
     BASE_URL,
+    DAG_FAIL_FAST,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_POOL_MAXSIZE,
     DEFAULT_VERSION,
+    HTTP_UNSUPPORTED_MEDIA_TYPE,
     PASSWORD,
     PROJECT_GROUP_NAME,
     PROJECT_NAME,
+    RETRY_STATUS_CODES,
     USERNAME,
 )
+from pymatillion.endpoints import (
+    DELETE_JOB,
+    DELETE_VERSION,
+    EXPORT_JOB,
+    GET_TASK_DETAILS,
+    IMPORT_JOB,
+    LIST_JOBS,
+    LIST_PROJECT_GROUPS,
+    LIST_PROJECTS,
+    LIST_RUNNING_TASKS,
+    LIST_VERSIONS,
+    RUN_JOB,
+    Route,
+    ScopedClient,
+)
+from pymatillion.ratelimit import RateLimiter, get_rate_limiter
+
+# Feature modules are imported where they are used, so importing the client only
+# loads what every request needs.
+if TYPE_CHECKING:
+    from pymatillion.bulk import DeletionReport, JobRunResult, JobSpec
+    from pymatillion.cache import MetadataCache, PersistentCache, Validators
+    from pymatillion.concurrency import AdaptiveLimiter
+    from pymatillion.dag import DagRunReport, JobDag
+    from pymatillion.history import RunRecorder
+    from pymatillion.instrumentation import Instrumentation
+    from pymatillion.models import ComponentResult, RunResponse, TaskDetails
+    from pymatillion.payloads import GridVariables
+    from pymatillion.retry import CircuitBreaker, RetryPolicy
+    from pymatillion.singleflight import SingleFlight
+    from pymatillion.transfer import PathLike, TransferResult
+    from pymatillion.watcher import TaskWatcher
 
 logger = logging.getLogger(__name__)
 
 
-class MatillionClient:
+class MatillionClient(ScopedClient):
     def __init__(
-        self, base_url, username, password, project_group_name=None, project_name=None
+        self,
+        base_url,
+        username,
+        password,
+        project_group_name=None,
+        project_name=None,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        keep_alive: bool = True,
+        cache: Optional[Union[MetadataCache, PersistentCache]] = None,
+        retry: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        instrumentation: Optional[Instrumentation] = None,
+        single_flight: Optional[SingleFlight] = None,
+        recorder: Optional[RunRecorder] = None,
+        concurrency_limiter: Optional[AdaptiveLimiter] = None,
+        compress_threshold: Optional[int] = None,
     ):
         self.base_url = base_url
         self.username = username
         self.password = password
         self.project_group_name = project_group_name
         self.project_name = project_name
-        self._valid_attributes = False
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.keep_alive = keep_alive
+        self.cache = cache
+        self.retry = retry
+        self.circuit_breaker = circuit_breaker
+        self.rate_limiter = rate_limiter
+        self.instrumentation = instrumentation
+        self.single_flight = single_flight
+        self.recorder = recorder
+        self.concurrency_limiter = concurrency_limiter
+        self.compress_threshold = compress_threshold
+        self._compression_rejected = False
         self._headers = None
+        self._session = None
+        self._session_pid = None
 
-    def _ensure_attributes(self, *args):
-        attributes_to_check = set(args)
-        invalid_attributes = []
-        for attr in attributes_to_check:
-            if (getattr(self, attr) is None) or (not getattr(self, attr)):
-                invalid_attributes.append(attr)
-        if invalid_attributes:
-            raise ValueError(f'Undefined attributes: {",".join(invalid_attributes)}')
-        else:
-            self._valid_attributes = True
+    def __enter__(self) -> "MatillionClient":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        HTTP session shared by every API request made by this client.
+
+        The session is created on first use and keeps connections to the
+        Matillion instance alive in a pool sized by `pool_connections` and
+        `pool_maxsize`. A forked child process gets a session of its own instead of
+        sharing the parent's pooled sockets.
+
+        Returns:
+            requests.Session : Session object.
+        """
+        if self._session is None or self._session_pid != os.getpid():
+            self._session = self._create_session()
+            self._session_pid = os.getpid()
+        return self._session
+
+    def _create_session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        if not self.keep_alive:
+            session.headers["Connection"] = "close"
+        return session
+
+    def close(self):
+        """
+        Close the HTTP session and release pooled connections.
+
+        The client can still be used afterwards; a new session is created on the
+        next API request.
+        """
+        # A session inherited through fork is dropped without closing the
+        # parent's connections.
+        if self._session is not None and self._session_pid == os.getpid():
+            self._session.close()
+        self._session = None
 
     def _set_headers(self):
         self._headers = {"Content-Type": "application/json"}
 
     def _api_request(
-        self, http_method, *args, is_json=True, **kwargs
+        self,
+        route: Route,
+        project_name: str = None,
+        version: str = None,
+        path: Optional[Dict] = None,
+        is_json=True,
+        stream=False,
+        headers=None,
+        quiet_statuses: Collection[int] = (),
+        **kwargs,
     ) -> requests.Response:
         """
         Make an API Request.
 
         Args:
-            http_method (str) : HTTP method to use when making API request.
-            args : Variable length list of strings to construct endpoint path.
+            route (Route) : Endpoint to call, from `pymatillion.endpoints`.
+            project_name (str) : Project of project and version scoped routes.
+                Defaults to the client's project.
+            version (str) : Version of version scoped routes.
+            path (dict) : Values of the fields of the route path, e.g. `job`.
             is_json (bool) : Set to False if payload/response is not JSON data.
+            stream (bool) : Set to True to read the response body incrementally.
+            headers (dict) : Headers replacing the client's default request headers.
+            quiet_statuses (collection) : HTTP error statuses the caller handles,
+                whose response content is logged at debug rather than error level.
             kwargs : Arbitrary keyword arguments to construct request payload.
 
         Returns:
-            requests.Response : Response object.
-        """
-
-        api_request = getattr(requests, http_method)
-        api_path = f'{self.base_url}/rest/v1/{"/".join(args)}'
-        if is_json:
-            if len(kwargs) == 1 and "json" in kwargs:
-                response = api_request(
-                    api_path,
-                    headers=self._headers,
-                    auth=(self.username, self.password),
-                    json=kwargs["json"],
-                )
-            else:
-                response = api_request(
-                    api_path,
-                    headers=self._headers,
-                    auth=(self.username, self.password),
-                    json=kwargs,
-                )
+            requests.Response : Response object. With `single_flight` set,
+            concurrent identical GET requests share one response, whose content
+            has already been read.
+        """
+        api_path = self.endpoints.url(
+            route, project_name or self.project_name, version, **(path or {})
+        )
+        payload_key = "json" if is_json else "data"
+        if len(kwargs) == 1 and payload_key in kwargs:
+            payload = kwargs[payload_key]
         else:
-            if len(kwargs) == 1 and "data" in kwargs:
-                response = api_request(
-                    api_path,
-                    headers=self._headers,
-                    auth=(self.username, self.password),
-                    data=kwargs["data"],
+            payload = kwargs
+        request_kwargs = {payload_key: payload}
+        if stream:
+            request_kwargs["stream"] = True
+        if headers is not None:
+            request_kwargs["headers"] = headers
+
+        def request():
+            response = self._send(
+                route.method, api_path, endpoint=route.endpoint, **request_kwargs
+            )
+            try:
+                response.raise_for_status()
+            except Exception:
+                if response.status_code in quiet_statuses:
+                    logger.debug(f"Response content:\n{response.content}")
+                else:
+                    logger.error(f"Response content:\n{response.content}")
+                raise
+            return response
+
+        if (
+            self.single_flight is None
+            or route.method != API_GET
+            or stream
+            or headers is not None
+        ):
+            return request()
+
+        def shared_request():
+            response = request()
+            # Read the body once, before the response is handed to other threads.
+            response.content
+            return response
+
+        key = (self.username, route.method, api_path)
+        return self.single_flight.do(key, shared_request)
+
+    def _send(
+        self, http_method, api_path, endpoint=None, **kwargs
+    ) -> requests.Response:
+        """
+        Send an API request, applying the rate limiter, retry policy and circuit
+        breaker.
+
+        Args:
+            http_method (str) : HTTP method to use when making API request.
+            api_path (str) : Endpoint URL.
+            endpoint (str) : Endpoint template reported to instrumentation hooks.
+            kwargs : Keyword arguments passed on to the session.
+
+        Returns:
+            requests.Response : Response object of the last attempt.
+        """
+        rate_limiter = self.rate_limiter or get_rate_limiter(self.base_url)
+        if self.retry is None and self.circuit_breaker is None:
+            if rate_limiter is not None:
+                rate_limiter.acquire(http_method)
+            return self._call(http_method, api_path, endpoint, 0, **kwargs)
+
+        attempt = 0
+        while True:
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.before_request()
+            if rate_limiter is not None:
+                rate_limiter.acquire(http_method)
+            try:
+                response = self._call(
+                    http_method, api_path, endpoint, attempt, **kwargs
                 )
+            except (requests.ConnectionError, requests.Timeout) as e:
+                self._record_outcome(failed=True)
+                if self.retry is None or not self.retry.should_retry(
+                    http_method, attempt
+                ):
+                    raise
+                delay = self.retry.delay(attempt)
+                logger.warning(f"Retrying {api_path} in {delay:.2f}s after: {e}")
+            except Exception:
+                self._record_outcome(failed=True)
+                raise
             else:
-                response = api_request(
-                    api_path,
-                    headers=self._headers,
-                    auth=(self.username, self.password),
-                    data=kwargs,
+                status_code = response.status_code
+                self._record_outcome(failed=status_code >= 500)
+                if self.retry is None or not self.retry.should_retry(
+                    http_method, attempt, status_code
+                ):
+                    return response
+                delay = self.retry.delay(attempt, response.headers.get("Retry-After"))
+                logger.warning(
+                    f"Retrying {api_path} in {delay:.2f}s after HTTP {status_code}"
                 )
-        try:
-            response.raise_for_status()
-        except Exception:
-            logger.error(f"Response content:\n{response.content}")
-            raise
+                response.close()
+            time.sleep(delay)
+            attempt += 1
+
+    def _call(
+        self, http_method, api_path, endpoint, attempt, **kwargs
+    ) -> requests.Response:
+        api_request = getattr(self.session, http_method)
+        headers = kwargs.pop("headers", self._headers)
+
+        def send():
+            return api_request(
+                api_path,
+                headers=headers,
+                auth=(self.username, self.password),
+                **kwargs,
+            )
+
+        if self.instrumentation is not None:
+            from pymatillion.instrumentation import RequestEvent
+
+            event = RequestEvent(http_method, endpoint, api_path, attempt)
+            stream = kwargs.get("stream")
+            send = partial(self.instrumentation.observe, event, send, stream=stream)
+        if self.concurrency_limiter is None:
+            return send()
+        with self.concurrency_limiter.slot() as outcome:
+            response = send()
+            outcome.failed = response.status_code in RETRY_STATUS_CODES
         return response
 
+    def _post_body(
+        self,
+        route: Route,
+        project_name: Optional[str],
+        version: Optional[str],
+        path: Dict,
+        body: bytes,
+    ) -> requests.Response:
+        """
+        Send an encoded JSON body, gzipped when it reaches `compress_threshold` bytes.
+
+        A server answering a compressed body with HTTP 415 does not accept gzip
+        requests: the body is sent again uncompressed, as are all later ones.
+        """
+        headers = {**(self._headers or {}), "Content-Type": "application/json"}
+        request = partial(
+            self._api_request, route, project_name, version, path=path, is_json=False
+        )
+        if (
+            self.compress_threshold is None
+            or len(body) < self.compress_threshold
+            or self._compression_rejected
+        ):
+            return request(headers=headers, data=body)
+        from pymatillion.payloads import gzip_body
+
+        try:
+            return request(
+                headers={**headers, "Content-Encoding": "gzip"},
+                quiet_statuses=(HTTP_UNSUPPORTED_MEDIA_TYPE,),
+                data=gzip_body(body),
+            )
+        except requests.HTTPError as e:
+            if (
+                e.response is None
+                or e.response.status_code != HTTP_UNSUPPORTED_MEDIA_TYPE
+            ):
+                raise
+        logger.debug("Server rejected a gzip request body, no longer compressing")
+        self._compression_rejected = True
+        return request(headers=headers, data=body)
+
+    def _record_outcome(self, failed: bool):
+        if self.circuit_breaker is None:
+            return
+        if failed:
+            self.circuit_breaker.record_failure()
+        else:
+            self.circuit_breaker.record_success()
+
+    def _cached_listing(
+        self, request: Callable[..., requests.Response], *scope
+    ) -> List[str]:
+        if self.cache is None:
+            return request().json()
+        from pymatillion.cache import PersistentCache
+
+        key = (self.base_url, *scope)
+        if isinstance(self.cache, PersistentCache):
+            return list(
+                self.cache.get_or_revalidate(
+                    key, lambda validators: self._revalidate(request, validators)
+                )
+            )
+        return list(self.cache.get_or_fetch(key, lambda: request().json()))
+
+    def _revalidate(
+        self,
+        request: Callable[..., requests.Response],
+        validators: Optional[Validators],
+    ) -> Optional[Tuple[List[str], Optional[Validators]]]:
+        from pymatillion.cache import Validators
+
+        # Conditional GET: None means the cached listing is still current.
+        headers = validators.request_headers() if validators else None
+        response = request(headers=headers)
+        if response.status_code == 304:
+            response.close()
+            return None
+        return response.json(), Validators.from_headers(response.headers)
+
+    def invalidate_cache(self, project_name: str = None, version: str = None) -> int:
+        """
+        Drop cached listings of the client's project group, optionally narrowed down
+        to a project and version.
+
+        Args:
+            project_name (str): Name of the Matillion project.
+            version: (str), optional. Version of the Matillion project.
+        Returns:
+            int : Number of removed cache entries.
+        """
+        if self.cache is None:
+            return 0
+        scope = [self.base_url, self.project_group_name]
+        if project_name:
+            scope.append(project_name)
+            if version:
+                scope.append(version)
+        return self.cache.invalidate(*scope)
+
     def list_project_groups(self) -> List[str]:
         """
         Retrieve Project Groups within the Matillion instance.
@@ -106,7 +438,15 @@ class MatillionClient:
             Project Groups (list) : A list of strings with names of Project Groups.
         """
         self._ensure_attributes(BASE_URL, USERNAME, PASSWORD)
-        return self._api_request(API_GET, "group").json()
+        return self._cached_listing(
+            lambda headers=None: self._api_request(
+                LIST_PROJECT_GROUPS, headers=headers
+            ),
+            None,
+            None,
+            None,
+            "group",
+        )
 
     def list_projects(self) -> List[str]:
         """
@@ -116,9 +456,13 @@ class MatillionClient:
             Project Names (list) : A list of strings with names of Projects.
         """
         self._ensure_attributes(BASE_URL, USERNAME, PASSWORD, PROJECT_GROUP_NAME)
-        return self._api_request(
-            API_GET, "group", "name", self.project_group_name, "project"
-        ).json()
+        return self._cached_listing(
+            lambda headers=None: self._api_request(LIST_PROJECTS, headers=headers),
+            self.project_group_name,
+            None,
+            None,
+            "project",
+        )
 
     def list_jobs(
         self, project_name: str = None, version: str = DEFAULT_VERSION
@@ -135,86 +479,334 @@ class MatillionClient:
         self._ensure_attributes(
             BASE_URL, USERNAME, PASSWORD, PROJECT_GROUP_NAME, PROJECT_NAME
         )
-        return self._api_request(
-            API_GET,
-            "group",
-            "name",
+        project_name = project_name if project_name else self.project_name
+        return self._cached_listing(
+            lambda headers=None: self._api_request(
+                LIST_JOBS, project_name, version, headers=headers
+            ),
             self.project_group_name,
-            "project",
-            "name",
-            project_name if project_name else self.project_name,
-            "version",
-            "name",
+            project_name,
             version,
             "job",
-        ).json()
+        )
+
+    def list_versions(self, project_name: str = None) -> List[str]:
+        """
+        Retrieve versions of the Matillion project.
+
+        Args:
+            project_name (str): Name of the Matillion project.
+        Returns:
+            Versions (list): A list of strings with names of the project versions.
+        """
+        self._ensure_attributes(
+            BASE_URL, USERNAME, PASSWORD, PROJECT_GROUP_NAME, PROJECT_NAME
+        )
+        project_name = project_name if project_name else self.project_name
+        return self._cached_listing(
+            lambda headers=None: self._api_request(
+                LIST_VERSIONS, project_name, headers=headers
+            ),
+            self.project_group_name,
+            project_name,
+            None,
+            "version",
+        )
+
+    def iter_jobs(
+        self, project_name: str = None, version: str = DEFAULT_VERSION
+    ) -> Iterator[str]:
+        """
+        Stream job names within the specified version of the Matillion project.
+
+        Unlike `list_jobs` the response is decoded incrementally, so memory use does
+        not grow with the number of jobs. Results are not cached.
+
+        Args:
+            project_name (str): Name of the Matillion project.
+            version: (str), optional. Default value : default.
+        Returns:
+            Iterator[str] : Names of the Matillion jobs.
+        """
+        self._ensure_attributes(
+            BASE_URL, USERNAME, PASSWORD, PROJECT_GROUP_NAME, PROJECT_NAME
+        )
+        from pymatillion.streaming import iter_response_array
+
+        response = self._api_request(LIST_JOBS, project_name, version, stream=True)
+        return iter_response_array(response)
 
     def run_job(
         self,
         job_name: str,
         job_variables: dict = {},
-        grid_variables: dict = {},
+        grid_variables: Union[dict, GridVariables] = {},
         project_name: str = None,
         version: str = DEFAULT_VERSION,
-    ) -> Dict:
+        as_model: bool = False,
+    ) -> Union[Dict, RunResponse]:
         """
         Run Matillion job within the specified project, for the specified version.
 
         Args:
             job_name (str): Name of the Matillion job intended to run.
             job_variables (dict): Dictionary of Matillion job variables.
-            grid_variables (dict): Dictionary of Matillion grid variables.
+            grid_variables (dict | GridVariables): Dictionary of Matillion grid
+                variables, or `GridVariables` serialized once for many runs.
             project_name (str): Name of the Matillion project.
             version: (str), optional. Default value : default.
+            as_model (bool): Return a `RunResponse` instead of a dictionary.
         Returns:
             dict : Sample response can be found at https://documentation.matillion.com/docs/2475544#server-response
         """
         self._ensure_attributes(
             BASE_URL, USERNAME, PASSWORD, PROJECT_GROUP_NAME, PROJECT_NAME
         )
-        body = {"scalarVariables": job_variables, "gridVariables": grid_variables}
-        return self._api_request(
-            API_POST,
-            "group",
-            "name",
-            self.project_group_name,
-            "project",
-            "name",
-            project_name if project_name else self.project_name,
-            "version",
-            "name",
-            version,
-            "job",
-            "name",
-            job_name,
-            "run",
-            json=body,
+        from pymatillion.payloads import run_job_body
+
+        body = run_job_body(job_variables, grid_variables)
+        response = self._post_body(
+            RUN_JOB, project_name, version, {"job": job_name}, body
         ).json()
+        if self.recorder is not None:
+            self.recorder.record_run(
+                response,
+                job_name,
+                project_name or self.project_name,
+                version,
+                self.project_group_name,
+            )
+        if as_model:
+            from pymatillion.models import RunResponse
+
+            return RunResponse.from_dict(response)
+        return response
 
-    def get_task_details(self, task_id: int, project_name: str = None) -> Dict:
+    def run_jobs(
+        self,
+        specs: Iterable[Union[JobSpec, tuple, Dict]],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> Iterator[JobRunResult]:
+        """
+        Run several Matillion jobs in parallel.
+
+        Launches are spread over a pool of at most `max_concurrency` threads sharing
+        this client's session, so `pool_maxsize` should be at least `max_concurrency`.
+
+        Args:
+            specs (iterable): (job_name, job_variables, grid_variables, project_name, version)
+                tuples, `JobSpec` objects or dictionaries with the same keys.
+            max_concurrency (int): Maximum number of launches in flight.
+        Returns:
+            Iterator[JobRunResult] : Per-spec results, yielded as each launch finishes.
+        """
+        from pymatillion.bulk import run_jobs
+
+        return run_jobs(self, specs, max_concurrency=max_concurrency)
+
+    def get_task_details(
+        self, task_id: int, project_name: str = None, as_model: bool = False
+    ) -> Union[Dict, TaskDetails]:
         """
         Retrieve details for the specified executed task id.
         Args:
             task_id (int): ID of the executed Matillion task.
             project_name (str): Name of the Matillion project.
+            as_model (bool): Return a `TaskDetails` instead of a dictionary.
         Returns:
             dict : Sample response can be found at https://documentation.matillion.com/docs/2972278
         """
         self._ensure_attributes(
             BASE_URL, USERNAME, PASSWORD, PROJECT_GROUP_NAME, PROJECT_NAME
         )
-        return self._api_request(
-            API_GET,
-            "group",
-            "name",
-            self.project_group_name,
-            "project",
-            "name",
-            project_name if project_name else self.project_name,
-            "task",
-            "id",
-            str(task_id),
+        response = self._api_request(
+            GET_TASK_DETAILS, project_name, path={"id": task_id}
         ).json()
+        if self.recorder is not None:
+            self.recorder.record_task(response)
+        if as_model:
+            from pymatillion.models import TaskDetails
+
+            return TaskDetails.from_dict(response)
+        return response
+
+    def iter_task_components(
+        self, task_id: int, project_name: str = None, as_records: bool = False
+    ) -> Iterator[Union[Dict, ComponentResult]]:
+        """
+        Stream the component results of the specified executed task id.
+
+        The task details response is decoded incrementally and only the `tasks`
+        list is read, so large task details never have to be held in memory.
+
+        Args:
+            task_id (int): ID of the executed Matillion task.
+            project_name (str): Name of the Matillion project.
+            as_records (bool): Yield compact `ComponentResult` records instead of
+                dictionaries.
+        Returns:
+            Iterator : Component results in the order returned by the server.
+        """
+        self._ensure_attributes(
+            BASE_URL, USERNAME, PASSWORD, PROJECT_GROUP_NAME, PROJECT_NAME
+        )
+        from pymatillion.streaming import iter_response_array
+
+        response = self._api_request(
+            GET_TASK_DETAILS, project_name, path={"id": task_id}, stream=True
+        )
+        components = iter_response_array(response, ("tasks",))
+        if as_records:
+            from pymatillion.models import ComponentResult
+
+            return map(ComponentResult.from_dict, components)
+        return components
+
+    def wait_for_task(
+        self,
+        task_id: int,
+        project_name: str = None,
+        timeout: Optional[float] = None,
+        backoff: Optional[Backoff] = None,
+    ) -> Dict:
+        """
+        Poll the specified task until it reaches a terminal state.
+
+        Args:
+            task_id (int): ID of the executed Matillion task.
+            project_name (str): Name of the Matillion project.
+            timeout (float): Deadline in seconds, or None to wait forever.
+            backoff (Backoff): Poll interval schedule. Defaults to exponential
+                backoff from 1 to 30 seconds with jitter.
+        Returns:
+            dict : Final task details, as returned by `get_task_details`.
+        Raises:
+            TaskWaitTimeout : If the task is still running after `timeout` seconds.
+        """
+        from pymatillion.waiter import wait_for_tasks
+
+        return wait_for_tasks(
+            self, [task_id], project_name=project_name, timeout=timeout, backoff=backoff
+        )[task_id]
+
+    def wait_for_tasks(
+        self,
+        task_ids: Iterable[int],
+        project_name: str = None,
+        timeout: Optional[float] = None,
+        backoff: Optional[Backoff] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> Dict[int, Dict]:
+        """
+        Poll several tasks from one scheduler until all reach a terminal state.
+
+        Args:
+            task_ids (iterable): IDs of the executed Matillion tasks.
+            project_name (str): Name of the Matillion project.
+            timeout (float): Overall deadline in seconds, or None to wait forever.
+            backoff (Backoff): Poll interval schedule applied to each task.
+            max_concurrency (int): Maximum number of polls in flight.
+        Returns:
+            dict : Final task details by task ID.
+        Raises:
+            TaskWaitTimeout : If any task is still running after `timeout` seconds.
+        """
+        from pymatillion.waiter import wait_for_tasks
+
+        return wait_for_tasks(
+            self,
+            task_ids,
+            project_name=project_name,
+            timeout=timeout,
+            backoff=backoff,
+            max_concurrency=max_concurrency,
+        )
+
+    def run_dag(
+        self,
+        dag: Union[JobDag, Iterable],
+        policy: str = DAG_FAIL_FAST,
+        completed: Iterable[str] = (),
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        backoff: Optional[Backoff] = None,
+        task_timeout: Optional[float] = None,
+    ) -> DagRunReport:
+        """
+        Run a DAG of dependent jobs, starting each one as soon as its parents succeed.
+
+        Args:
+            dag (JobDag or iterable): The DAG, or its `DagNode` objects.
+            policy (str): `fail_fast` to start no new job after a failure, or
+                `continue` to only skip the descendants of failed jobs.
+            completed (iterable): Nodes that already succeeded, to resume a run.
+            max_concurrency (int): Maximum number of jobs running at once.
+            backoff (Backoff): Task poll interval schedule.
+            task_timeout (float): Seconds to wait for each task, or None.
+        Returns:
+            DagRunReport : Per-node results and critical path timing.
+        """
+        from pymatillion.dag import run_dag
+
+        return run_dag(
+            self,
+            dag,
+            policy=policy,
+            completed=completed,
+            max_concurrency=max_concurrency,
+            backoff=backoff,
+            task_timeout=task_timeout,
+        )
+
+    def list_running_tasks(self, project_name: str = None) -> List[Dict]:
+        """
+        Retrieve the tasks currently running within the Matillion project.
+
+        Args:
+            project_name (str): Name of the Matillion project.
+        Returns:
+            list : Task details of the running tasks.
+        """
+        self._ensure_attributes(
+            BASE_URL, USERNAME, PASSWORD, PROJECT_GROUP_NAME, PROJECT_NAME
+        )
+        return self._api_request(LIST_RUNNING_TASKS, project_name).json()
+
+    def watch_tasks(
+        self,
+        task_ids: Optional[Iterable[int]] = None,
+        project_name: str = None,
+        cursor: Optional[Dict] = None,
+        backoff: Optional[Backoff] = None,
+        timeout: Optional[float] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> TaskWatcher:
+        """
+        Stream state transitions of tasks, or of every task of the project.
+
+        Iterate over the result with `for`; see `TaskWatcher`.
+
+        Args:
+            task_ids (iterable): IDs of the tasks to watch until they finish. Watches
+                every task of the project when omitted.
+            project_name (str): Name of the Matillion project.
+            cursor (dict): `cursor` of a previous watcher to resume from.
+            backoff (Backoff): Delay schedule between polling rounds.
+            timeout (float): Stop after this many seconds, or None to run until done.
+            max_concurrency (int): Maximum number of task detail polls in flight.
+        Returns:
+            TaskWatcher : Iterable of `TaskEvent`.
+        """
+        from pymatillion.watcher import TaskWatcher
+
+        return TaskWatcher(
+            self,
+            task_ids,
+            project_name=project_name,
+            cursor=cursor,
+            backoff=backoff,
+            timeout=timeout,
+            max_concurrency=max_concurrency,
+        )
 
     def delete_project(self, project_name: str, version: str = DEFAULT_VERSION) -> Dict:
         """
@@ -229,19 +821,10 @@ class MatillionClient:
         self._ensure_attributes(
             BASE_URL, USERNAME, PASSWORD, PROJECT_GROUP_NAME, PROJECT_NAME
         )
-        return self._api_request(
-            API_POST,
-            "group",
-            "name",
-            self.project_group_name,
-            "project",
-            "name",
-            project_name if project_name else self.project_name,
-            "version",
-            "name",
-            version,
-            "delete",
-        ).json()
+        project_name = project_name if project_name else self.project_name
+        response = self._api_request(DELETE_VERSION, project_name, version).json()
+        self.invalidate_cache()
+        return response
 
     def delete_job(
         self, job_name: str, project_name: str = None, version: str = DEFAULT_VERSION
@@ -259,19 +842,260 @@ class MatillionClient:
         self._ensure_attributes(
             BASE_URL, USERNAME, PASSWORD, PROJECT_GROUP_NAME, PROJECT_NAME
         )
+        project_name = project_name if project_name else self.project_name
+        response = self._api_request(
+            DELETE_JOB, project_name, version, path={"job": job_name}
+        ).json()
+        self.invalidate_cache(project_name, version)
+        return response
+
+    def delete_jobs(
+        self,
+        job_names: Optional[Iterable[str]] = None,
+        project_name: str = None,
+        version: str = DEFAULT_VERSION,
+        match: Optional[Callable[[str], bool]] = None,
+        dry_run: bool = False,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> DeletionReport:
+        """
+        Delete several Matillion jobs within the specified version of the project.
+
+        The deletion plan is built from `list_jobs`, so only existing jobs are
+        deleted; requested jobs that are not listed are reported as `MISSING`.
+        Deletions run in parallel and failures are reported per job.
+
+        Args:
+            job_names (iterable): Names of the jobs to delete.
+            project_name (str): Name of the Matillion project.
+            version: (str), optional. Default value : default.
+            match (callable): Predicate selecting jobs to delete, e.g.
+                `lambda name: name.startswith("tmp_")`.
+            dry_run (bool): Only report the plan, with every job `PLANNED`.
+            max_concurrency (int): Maximum number of deletions in flight.
+        Returns:
+            DeletionReport : Per-job outcomes.
+        Raises:
+            ValueError : If neither `job_names` nor `match` is given.
+        """
+        from pymatillion.bulk import delete_all, plan_deletions
+
+        project_name = project_name if project_name else self.project_name
+        plan, missing, _ = plan_deletions(
+            self.list_jobs(project_name, version), job_names, match
+        )
+        return delete_all(
+            plan,
+            lambda job_name: self.delete_job(job_name, project_name, version),
+            missing,
+            dry_run=dry_run,
+            max_concurrency=max_concurrency,
+        )
+
+    def delete_project_versions(
+        self,
+        versions: Optional[Iterable[str]] = None,
+        project_name: str = None,
+        match: Optional[Callable[[str], bool]] = None,
+        dry_run: bool = False,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> DeletionReport:
+        """
+        Delete several versions of the Matillion project.
+
+        The deletion plan is built from `list_versions`. The default version is never
+        deleted; when selected, it is reported as `SKIPPED` with the reason.
+        Deletions run in parallel and failures are reported per version.
+
+        Args:
+            versions (iterable): Names of the versions to delete.
+            project_name (str): Name of the Matillion project.
+            match (callable): Predicate selecting versions to delete, e.g.
+                `lambda name: name.startswith("feature-")`.
+            dry_run (bool): Only report the plan, with every version `PLANNED`.
+            max_concurrency (int): Maximum number of deletions in flight.
+        Returns:
+            DeletionReport : Per-version outcomes.
+        Raises:
+            ValueError : If neither `versions` nor `match` is given.
+        """
+        from pymatillion.bulk import delete_all, plan_deletions
+
+        project_name = project_name if project_name else self.project_name
+        plan, missing, protected = plan_deletions(
+            self.list_versions(project_name),
+            versions,
+            match,
+            protected=(DEFAULT_VERSION,),
+        )
+        skipped = {
+            version: "The default version of a project cannot be deleted"
+            for version in protected
+        }
+        return delete_all(
+            plan,
+            lambda version: self.delete_project(project_name, version),
+            missing,
+            dry_run=dry_run,
+            max_concurrency=max_concurrency,
+            skipped=skipped,
+        )
+
+    def export_job(
+        self, job_name: str, project_name: str = None, version: str = DEFAULT_VERSION
+    ) -> Dict:
+        """
+        Export the definition of a Matillion job.
+
+        Args:
+            job_name (str): Name of the Matillion job to export.
+            project_name (str): Name of the Matillion project.
+            version: (str), optional. Default value : default.
+        Returns:
+            dict : Job export, accepted as is by `import_job`.
+        """
+        self._ensure_attributes(
+            BASE_URL, USERNAME, PASSWORD, PROJECT_GROUP_NAME, PROJECT_NAME
+        )
         return self._api_request(
-            API_POST,
-            "group",
-            "name",
-            self.project_group_name,
-            "project",
-            "name",
-            project_name if project_name else self.project_name,
-            "version",
-            "name",
-            version,
-            "job",
-            "name",
-            job_name,
-            "delete",
+            EXPORT_JOB, project_name, version, path={"job": job_name}
         ).json()
+
+    def export_job_to_file(
+        self,
+        job_name: str,
+        path: PathLike,
+        project_name: str = None,
+        version: str = DEFAULT_VERSION,
+    ) -> str:
+        """
+        Stream the export of a Matillion job to a file.
+
+        Args:
+            job_name (str): Name of the Matillion job to export.
+            path (str): Destination file.
+            project_name (str): Name of the Matillion project.
+            version: (str), optional. Default value : default.
+        Returns:
+            str : SHA-256 hex digest of the export.
+        """
+        self._ensure_attributes(
+            BASE_URL, USERNAME, PASSWORD, PROJECT_GROUP_NAME, PROJECT_NAME
+        )
+        response = self._api_request(
+            EXPORT_JOB, project_name, version, path={"job": job_name}, stream=True
+        )
+        from pymatillion.transfer import download
+
+        return download(response, path)
+
+    def import_job(
+        self,
+        source: Union[Dict, PathLike],
+        project_name: str = None,
+        version: str = DEFAULT_VERSION,
+    ) -> Dict:
+        """
+        Import a job export into the specified version of the Matillion project.
+
+        Args:
+            source (dict or str): Job export as returned by `export_job`, or the path
+                of a file written by `export_job_to_file`, which is streamed from disk.
+            project_name (str): Name of the Matillion project.
+            version: (str), optional. Default value : default.
+        Returns:
+            dict : Import response.
+        """
+        self._ensure_attributes(
+            BASE_URL, USERNAME, PASSWORD, PROJECT_GROUP_NAME, PROJECT_NAME
+        )
+        project_name = project_name if project_name else self.project_name
+        if isinstance(source, dict):
+            response = self._api_request(
+                IMPORT_JOB, project_name, version, json=source
+            ).json()
+        else:
+            with open(source, "rb") as body:
+                response = self._api_request(
+                    IMPORT_JOB,
+                    project_name,
+                    version,
+                    is_json=False,
+                    headers={"Content-Type": "application/json"},
+                    data=body,
+                ).json()
+        self.invalidate_cache(project_name, version)
+        return response
+
+    def export_jobs(
+        self,
+        directory: PathLike,
+        job_names: Optional[Iterable[str]] = None,
+        project_name: str = None,
+        version: str = DEFAULT_VERSION,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> List[TransferResult]:
+        """
+        Export jobs of a project version to a directory, one file per job.
+
+        Exports run in parallel and are streamed to disk. A manifest of content
+        digests is kept in the directory, so jobs unchanged since the previous
+        export are reported as `UNCHANGED`.
+
+        Args:
+            directory (str): Export directory, created if missing.
+            job_names (iterable): Jobs to export. Defaults to every job of the version.
+            project_name (str): Name of the Matillion project.
+            version: (str), optional. Default value : default.
+            max_concurrency (int): Maximum number of exports in flight.
+        Returns:
+            List[TransferResult] : Per-job results.
+        """
+        from pymatillion.transfer import export_jobs
+
+        return export_jobs(
+            self,
+            directory,
+            job_names,
+            project_name=project_name,
+            version=version,
+            max_concurrency=max_concurrency,
+        )
+
+    def import_jobs(
+        self,
+        directory: PathLike,
+        job_names: Optional[Iterable[str]] = None,
+        project_name: str = None,
+        version: str = DEFAULT_VERSION,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        state_file: Optional[PathLike] = None,
+    ) -> List[TransferResult]:
+        """
+        Import jobs written by `export_jobs` into a project version.
+
+        Imports run in parallel and are streamed from disk. With `state_file`, jobs
+        already imported with the same content are skipped.
+
+        Args:
+            directory (str): Directory written by `export_jobs`.
+            job_names (iterable): Jobs to import. Defaults to every exported job.
+            project_name (str): Name of the Matillion project.
+            version: (str), optional. Default value : default.
+            max_concurrency (int): Maximum number of imports in flight.
+            state_file (str): Manifest of the jobs already imported into this
+                instance, updated after the import.
+        Returns:
+            List[TransferResult] : Per-job results.
+        """
+        from pymatillion.transfer import import_jobs
+
+        return import_jobs(
+            self,
+            directory,
+            job_names,
+            project_name=project_name,
+            version=version,
+            max_concurrency=max_concurrency,
+            state_file=state_file,
+        )
@@ -0,0 +1,171 @@
+import sys
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from pymatillion.constants import TERMINAL_TASK_STATES
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    # States, types and names repeat across thousands of tasks; interning them
+    # keeps a single copy of each string.
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+@dataclass(slots=True)
+class RunResponse:
+    """
+    Response of `MatillionClient.run_job`.
+    """
+
+    success: bool
+    message: Optional[str]
+    id: int
+
+    @classmethod
+    def from_dict(cls, response: Dict) -> "RunResponse":
+        return cls(response.get("success"), response.get("msg"), response.get("id"))
+
+    @property
+    def task_id(self) -> int:
+        return self.id
+
+
+@dataclass(slots=True)
+class ComponentResult:
+    """
+    Compact record of one component execution within a Matillion task.
+
+    Mirrors an item of the `tasks` list of a task details response.
+    """
+
+    task_id: int
+    parent_id: int
+    type: str
+    job_id: int
+    job_name: str
+    job_revision: int
+    job_timestamp: int
+    component_id: int
+    component_name: str
+    state: str
+    row_count: int
+    start_time: Optional[int]
+    end_time: Optional[int]
+    message: Optional[str]
+
+    @classmethod
+    def from_dict(cls, component: Dict) -> "ComponentResult":
+        get = component.get
+        return cls(
+            get("taskID"),
+            get("parentID"),
+            _intern(get("type")),
+            get("jobID"),
+            _intern(get("jobName")),
+            get("jobRevision"),
+            get("jobTimestamp"),
+            get("componentID"),
+            _intern(get("componentName")),
+            _intern(get("state")),
+            get("rowCount"),
+            get("startTime"),
+            get("endTime"),
+            get("message"),
+        )
+
+    @property
+    def duration(self) -> Optional[float]:
+        """
+        Execution time in seconds, if the component has finished.
+        """
+        if self.start_time is None or self.end_time is None:
+            return None
+        return (self.end_time - self.start_time) / 1000
+
+
+@dataclass(slots=True)
+class TaskDetails:
+    """
+    Compact representation of a task details response.
+
+    Component results are kept in their raw form and only converted to
+    `ComponentResult` records the first time `components` is read.
+    """
+
+    id: int
+    type: str
+    customer_id: int
+    group_name: str
+    project_id: int
+    project_name: str
+    version_id: int
+    version_name: str
+    job_id: int
+    job_name: str
+    environment_id: int
+    environment_name: str
+    state: str
+    enqueued_time: Optional[int]
+    start_time: Optional[int]
+    end_time: Optional[int]
+    message: Optional[str]
+    originator_id: Optional[str]
+    row_count: int
+    has_historic_jobs: bool
+    job_names: Tuple[str, ...]
+    _raw_components: Optional[List[Dict]] = field(default=None, repr=False)
+    _components: Optional[Tuple[ComponentResult, ...]] = field(
+        default=None, init=False, repr=False
+    )
+
+    @classmethod
+    def from_dict(cls, task: Dict) -> "TaskDetails":
+        get = task.get
+        return cls(
+            get("id"),
+            _intern(get("type")),
+            get("customerID"),
+            _intern(get("groupName")),
+            get("projectID"),
+            _intern(get("projectName")),
+            get("versionID"),
+            _intern(get("versionName")),
+            get("jobID"),
+            _intern(get("jobName")),
+            get("environmentID"),
+            _intern(get("environmentName")),
+            _intern(get("state")),
+            get("enqueuedTime"),
+            get("startTime"),
+            get("endTime"),
+            get("message"),
+            get("originatorID"),
+            get("rowCount"),
+            get("hasHistoricJobs"),
+            tuple(_intern(name) for name in get("jobNames") or ()),
+            get("tasks"),
+        )
+
+    @property
+    def components(self) -> Tuple[ComponentResult, ...]:
+        """
+        Component results of the task, parsed on first access.
+        """
+        if self._components is None:
+            raw_components = self._raw_components or ()
+            self._components = tuple(map(ComponentResult.from_dict, raw_components))
+            self._raw_components = None
+        return self._components
+
+    @property
+    def is_terminal(self) -> bool:
+        return self.state in TERMINAL_TASK_STATES
+
+    @property
+    def duration(self) -> Optional[float]:
+        """
+        Execution time in seconds, if the task has finished.
+        """
+        if self.start_time is None or self.end_time is None:
+            return None
+        return (self.end_time - self.start_time) / 1000
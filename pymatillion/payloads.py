@@ -0,0 +1,118 @@
+import gzip
+import json
+from typing import Any, Dict, Union
+
+from pymatillion.constants import DEFAULT_GZIP_LEVEL
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(value: Any) -> bytes:
+    """
+    Serialize a value to compact UTF-8 JSON.
+
+    Uses orjson when it is installed (`pip install pymatillion[speedups]`) and the
+    standard library otherwise. Both produce the same JSON for dictionaries with
+    string, number, boolean or None keys, lists, strings, finite numbers, booleans
+    and None, which is what Matillion variables are made of. Beyond that they
+    differ:
+
+    - NaN and infinity are encoded as `null` by orjson but raise `ValueError`
+      with the standard library, as they did when requests encoded the body.
+    - orjson also encodes dates, datetimes, UUIDs and dataclasses, which raise
+      `TypeError` with the standard library.
+    - orjson raises `TypeError` for integers that do not fit in 64 bits.
+
+    Args:
+        value (Any): JSON serializable value.
+    Returns:
+        bytes : Encoded JSON.
+    """
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(
+        value, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+class GridVariables:
+    """
+    Grid variables serialized once, to be sent with any number of job runs.
+
+    Pass an instance to `run_job(grid_variables=...)`, or in job specs of
+    `run_jobs`, instead of a dictionary: each run then copies the encoded grid into
+    its request body rather than encoding thousands of rows again.
+
+    Args:
+        grid_variables (dict): Dictionary of Matillion grid variables, mapping grid
+            names to lists of rows.
+    """
+
+    __slots__ = ("encoded",)
+
+    def __init__(self, grid_variables: Dict):
+        self.encoded = dumps(grid_variables)
+
+    def __len__(self) -> int:
+        return len(self.encoded)
+
+    def __repr__(self) -> str:
+        return f"GridVariables({len(self.encoded)} bytes)"
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, GridVariables):
+            return NotImplemented
+        return self.encoded == other.encoded
+
+    def __hash__(self) -> int:
+        return hash(self.encoded)
+
+    def __getstate__(self) -> bytes:
+        return self.encoded
+
+    def __setstate__(self, encoded: bytes):
+        self.encoded = encoded
+
+
+def run_job_body(
+    job_variables: Dict, grid_variables: Union[Dict, GridVariables]
+) -> bytes:
+    """
+    Request body of a job run.
+
+    Args:
+        job_variables (dict): Dictionary of Matillion job variables.
+        grid_variables (dict | GridVariables): Grid variables, as a dictionary or
+            already serialized.
+    Returns:
+        bytes : Encoded JSON body.
+    """
+    if not isinstance(grid_variables, GridVariables):
+        grid_variables = GridVariables(grid_variables)
+    return b"".join(
+        [
+            b'{"scalarVariables":',
+            dumps(job_variables),
+            b',"gridVariables":',
+            grid_variables.encoded,
+            b"}",
+        ]
+    )
+
+
+def gzip_body(body: bytes, level: int = DEFAULT_GZIP_LEVEL) -> bytes:
+    """
+    Compress a request body, to be sent with `Content-Encoding: gzip`.
+
+    The gzip header carries no timestamp, so equal bodies compress to equal bytes.
+
+    Args:
+        body (bytes): Request body.
+        level (int): Compression level, from 1 (fastest) to 9 (smallest).
+    Returns:
+        bytes : Compressed body.
+    """
+    return gzip.compress(body, compresslevel=level, mtime=0)
@@ -0,0 +1,153 @@
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple, Union
+
+from pymatillion.bulk import JobRunResult, JobSpec, as_job_spec
+from pymatillion.constants import (
+    DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_POOL_MAXSIZE,
+)
+from pymatillion.matillion import MatillionClient
+
+logger = logging.getLogger(__name__)
+
+# Per-process clients by spec, with the PID that built them.
+_clients: Dict["ClientSpec", Tuple[int, MatillionClient]] = {}
+
+
+@dataclass(frozen=True)
+class ClientSpec:
+    """
+    Picklable description of a `MatillionClient`.
+
+    Send a spec to worker processes instead of a client: `client()` builds a
+    client the first time it is called in each process and reuses it afterwards,
+    so sessions and sockets are never shared between processes.
+
+    Only connection settings are carried over. Caches, retry policies, circuit
+    breakers, rate limiters and instrumentation hold process-local state and are
+    not part of the spec.
+    """
+
+    base_url: str
+    username: str
+    password: str
+    project_group_name: Optional[str] = None
+    project_name: Optional[str] = None
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE
+    keep_alive: bool = True
+    compress_threshold: Optional[int] = None
+
+    def __repr__(self) -> str:
+        return (
+            f"ClientSpec(base_url={self.base_url!r}, username={self.username!r},"
+            f" project_group_name={self.project_group_name!r},"
+            f" project_name={self.project_name!r})"
+        )
+
+    @classmethod
+    def from_client(cls, client: MatillionClient) -> "ClientSpec":
+        return cls(
+            client.base_url,
+            client.username,
+            client.password,
+            client.project_group_name,
+            client.project_name,
+            client.pool_connections,
+            client.pool_maxsize,
+            client.keep_alive,
+            client.compress_threshold,
+        )
+
+    def build(self) -> MatillionClient:
+        """
+        Create a new client from the spec.
+        """
+        return MatillionClient(**asdict(self))
+
+    def client(self) -> MatillionClient:
+        """
+        The calling process's client for this spec, built on first use.
+        """
+        pid = os.getpid()
+        entry = _clients.get(self)
+        if entry is None or entry[0] != pid:
+            # Clients inherited through fork belong to the parent; build our own.
+            entry = (pid, self.build())
+            _clients[self] = entry
+        return entry[1]
+
+
+def _run_job_in_process(
+    spec: ClientSpec,
+    index: int,
+    job_spec: JobSpec,
+    post_process: Optional[Callable[[MatillionClient, Dict], Any]],
+) -> JobRunResult:
+    try:
+        client = spec.client()
+        response = client.run_job(*job_spec)
+        if post_process is not None:
+            response = post_process(client, response)
+        return JobRunResult(index, job_spec, response=response)
+    except Exception as e:
+        logger.error(f"Failed to run job {job_spec.job_name}: {e}")
+        return JobRunResult(index, job_spec, error=e)
+
+
+def run_jobs_in_processes(
+    spec: Union[ClientSpec, MatillionClient],
+    specs: Iterable[Union[JobSpec, tuple, Dict]],
+    post_process: Optional[Callable[[MatillionClient, Dict], Any]] = None,
+    max_workers: Optional[int] = None,
+    mp_context=None,
+) -> Iterator[JobRunResult]:
+    """
+    Launch Matillion jobs from a pool of worker processes.
+
+    Each worker builds its own client from `spec` and runs `post_process` on every
+    launch response, so CPU-heavy handling of responses, e.g. waiting for the task
+    and summarising its components, is spread across cores instead of contending
+    for the GIL.
+
+    Args:
+        spec (ClientSpec or MatillionClient): Connection settings of the workers'
+            clients. A client is converted with `ClientSpec.from_client`.
+        specs (iterable): Job specs as `JobSpec`, tuples or dictionaries.
+        post_process (callable): Picklable function called in the worker as
+            `post_process(client, response)`. Its return value replaces the
+            response in the result.
+        max_workers (int): Number of worker processes, defaults to the CPU count.
+        mp_context : `multiprocessing` context used to start the workers.
+    Returns:
+        Iterator[JobRunResult] : Per-spec results, yielded as each job finishes.
+    """
+    if isinstance(spec, MatillionClient):
+        spec = ClientSpec.from_client(spec)
+    specs = [as_job_spec(job_spec) for job_spec in specs]
+    if not specs:
+        return
+    executor = ProcessPoolExecutor(
+        max_workers=min(max_workers or os.cpu_count() or 1, len(specs)),
+        mp_context=mp_context,
+    )
+    try:
+        futures = {
+            executor.submit(_run_job_in_process, spec, index, job_spec, post_process): (
+                index
+            )
+            for index, job_spec in enumerate(specs)
+        }
+        for future in as_completed(futures):
+            index = futures[future]
+            try:
+                yield future.result()
+            except Exception as e:
+                # The worker died or its result could not be pickled.
+                logger.error(f"Failed to run job {specs[index].job_name}: {e}")
+                yield JobRunResult(index, specs[index], error=e)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,190 @@
+import heapq
+import itertools
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from pymatillion.constants import DEFAULT_METHOD_PRIORITIES, DEFAULT_PRIORITY
+
+_rate_limiters: Dict[str, "RateLimiter"] = {}
+_registry_lock = threading.Lock()
+
+
+def _host_key(base_url: str) -> str:
+    return base_url.rstrip("/")
+
+
+def set_rate_limiter(base_url: str, limiter: Optional["RateLimiter"]):
+    """
+    Share a rate limiter between every `MatillionClient` of a Matillion instance.
+
+    Clients created without an explicit `rate_limiter` look the limiter up by their
+    `base_url` on each request. Pass None to remove the limiter.
+    """
+    with _registry_lock:
+        if limiter is None:
+            _rate_limiters.pop(_host_key(base_url), None)
+        else:
+            _rate_limiters[_host_key(base_url)] = limiter
+
+
+def get_rate_limiter(base_url: str) -> Optional["RateLimiter"]:
+    """
+    Return the rate limiter registered for a Matillion instance, if any.
+    """
+    if not _rate_limiters:
+        return None
+    return _rate_limiters.get(_host_key(base_url))
+
+
+class TokenBucket:
+    """
+    Token bucket refilled at `rate` tokens per second, holding at most `burst`.
+
+    Not thread-safe; `RateLimiter` guards its buckets with a lock.
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self.tokens = self.burst
+        self._updated_at = time.monotonic()
+
+    def take(self) -> float:
+        """
+        Take one token if available.
+
+        Returns:
+            float : 0 if a token was taken, otherwise seconds until one is available.
+        """
+        now = time.monotonic()
+        self.tokens = min(
+            self.burst, self.tokens + (now - self._updated_at) * self.rate
+        )
+        self._updated_at = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+class WaitStats:
+    """
+    Queue wait times observed by a `RateLimiter` for one HTTP method.
+    """
+
+    __slots__ = ("count", "total", "max")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float):
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def as_dict(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.mean,
+            "max": self.max,
+        }
+
+
+class RateLimiter:
+    """
+    Client side request scheduler for one Matillion instance.
+
+    Every request takes a token from the bucket of its HTTP method (when
+    `method_limits` defines one) and then from the instance-wide bucket. Requests
+    waiting for the instance-wide bucket are served by priority, lowest value first,
+    so by default job launches (POST) go ahead of task polls (GET).
+
+    Args:
+        rate (float): Requests per second allowed to the instance, or None for no
+            instance-wide limit.
+        burst (float): Instance-wide bucket capacity. Defaults to `rate`.
+        method_limits (dict): Optional `{http_method: (rate, burst)}` limits.
+        priorities (dict): `{http_method: priority}` overrides.
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        method_limits: Optional[Dict[str, Tuple[float, Optional[float]]]] = None,
+        priorities: Optional[Dict[str, int]] = None,
+    ):
+        self._bucket = TokenBucket(rate, burst) if rate is not None else None
+        self._method_buckets = {
+            method.lower(): TokenBucket(*limit)
+            for method, limit in (method_limits or {}).items()
+        }
+        self.priorities = dict(DEFAULT_METHOD_PRIORITIES)
+        self.priorities.update(
+            {method.lower(): value for method, value in (priorities or {}).items()}
+        )
+        self._condition = threading.Condition()
+        self._waiters = []
+        self._sequence = itertools.count()
+        self._wait_stats: Dict[str, WaitStats] = {}
+
+    def acquire(self, http_method: str, priority: Optional[int] = None) -> float:
+        """
+        Block until a request with the given HTTP method may be sent.
+
+        Args:
+            http_method (str) : HTTP method of the request.
+            priority (int) : Overrides the method's default priority.
+        Returns:
+            float : Seconds spent waiting.
+        """
+        method = http_method.lower()
+        if priority is None:
+            priority = self.priorities.get(method, DEFAULT_PRIORITY)
+        started_at = time.monotonic()
+        with self._condition:
+            bucket = self._method_buckets.get(method)
+            if bucket is not None:
+                while (delay := bucket.take()) > 0:
+                    self._condition.wait(delay)
+            if self._bucket is not None:
+                self._acquire_shared(priority)
+            waited = time.monotonic() - started_at
+            self._wait_stats.setdefault(method, WaitStats()).record(waited)
+        return waited
+
+    def _acquire_shared(self, priority: int):
+        entry = (priority, next(self._sequence))
+        heapq.heappush(self._waiters, entry)
+        try:
+            while True:
+                delay = None
+                if self._waiters[0] == entry:
+                    delay = self._bucket.take()
+                    if delay == 0:
+                        return
+                self._condition.wait(delay)
+        finally:
+            self._waiters.remove(entry)
+            heapq.heapify(self._waiters)
+            self._condition.notify_all()
+
+    @property
+    def wait_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Queue wait statistics per HTTP method: count, total, mean and max seconds.
+        """
+        with self._condition:
+            return {
+                method: stats.as_dict() for method, stats in self._wait_stats.items()
+            }
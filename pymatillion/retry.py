@@ -0,0 +1,169 @@
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Iterable, Optional
+
+from pymatillion.backoff import Backoff
+from pymatillion.constants import (
+    API_GET,
+    CIRCUIT_CLOSED,
+    CIRCUIT_HALF_OPEN,
+    CIRCUIT_OPEN,
+    DEFAULT_FAILURE_THRESHOLD,
+    DEFAULT_MAX_RETRY_INTERVAL,
+    DEFAULT_RECOVERY_TIMEOUT,
+    DEFAULT_RETRY_ATTEMPTS,
+    DEFAULT_RETRY_INTERVAL,
+    RETRY_STATUS_CODES,
+)
+from pymatillion.exceptions import CircuitOpenError
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Convert a `Retry-After` header, given in seconds or as an HTTP date, to seconds.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class RetryPolicy:
+    """
+    Decide whether and when a failed API request is retried.
+
+    Args:
+        max_attempts (int): Total number of attempts, including the first one.
+        backoff (Backoff): Delay schedule between attempts. Defaults to full
+            jitter exponential backoff from 0.5 to 30 seconds.
+        status_codes (iterable): HTTP status codes that are retried.
+        methods (iterable): HTTP methods that are retried. Only GET requests are
+            retried by default because POST calls such as `run_job` are not
+            idempotent.
+        respect_retry_after (bool): Wait for the server's `Retry-After` header
+            instead of the backoff delay when present.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = DEFAULT_RETRY_ATTEMPTS,
+        backoff: Optional[Backoff] = None,
+        status_codes: Iterable[int] = RETRY_STATUS_CODES,
+        methods: Iterable[str] = (API_GET,),
+        respect_retry_after: bool = True,
+    ):
+        self.max_attempts = max_attempts
+        self.backoff = backoff or Backoff(
+            initial=DEFAULT_RETRY_INTERVAL, maximum=DEFAULT_MAX_RETRY_INTERVAL, jitter=1
+        )
+        self.status_codes = frozenset(status_codes)
+        self.methods = frozenset(method.lower() for method in methods)
+        self.respect_retry_after = respect_retry_after
+
+    def should_retry(
+        self, http_method: str, attempt: int, status_code: Optional[int] = None
+    ) -> bool:
+        """
+        Check whether a request can be retried after the given (zero based) attempt.
+
+        Args:
+            http_method (str) : HTTP method of the request.
+            attempt (int) : Attempt that just failed.
+            status_code (int) : Response status, or None if the connection failed.
+        """
+        if attempt + 1 >= self.max_attempts or http_method.lower() not in self.methods:
+            return False
+        return status_code is None or status_code in self.status_codes
+
+    def delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """
+        Seconds to wait before retrying after the given (zero based) attempt.
+        """
+        if self.respect_retry_after:
+            seconds = parse_retry_after(retry_after)
+            if seconds is not None:
+                return seconds
+        return self.backoff.delay(attempt)
+
+
+class CircuitBreaker:
+    """
+    Fail fast while the Matillion instance looks down.
+
+    After `failure_threshold` consecutive failures (connection errors or 5xx
+    responses) the circuit opens and requests raise `CircuitOpenError` without
+    reaching the server. Once `recovery_timeout` seconds have passed a single trial
+    request is let through; its success closes the circuit, its failure opens it
+    again.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        recovery_timeout: float = DEFAULT_RECOVERY_TIMEOUT,
+    ):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.failures = 0
+        self._state = CIRCUIT_CLOSED
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if (
+                self._state == CIRCUIT_OPEN
+                and time.monotonic() - self._opened_at >= self.recovery_timeout
+            ):
+                return CIRCUIT_HALF_OPEN
+            return self._state
+
+    def before_request(self):
+        """
+        Raise `CircuitOpenError` if the request must not be sent.
+        """
+        with self._lock:
+            if self._state == CIRCUIT_CLOSED:
+                return
+            retry_in = self._opened_at + self.recovery_timeout - time.monotonic()
+            if retry_in <= 0 and not self._trial_in_flight:
+                self._state = CIRCUIT_HALF_OPEN
+                self._trial_in_flight = True
+                return
+            raise CircuitOpenError(
+                f"Circuit open after {self.failures} consecutive failures",
+                max(0.0, retry_in),
+            )
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self._state = CIRCUIT_CLOSED
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self._trial_in_flight = False
+            if (
+                self._state == CIRCUIT_HALF_OPEN
+                or self.failures >= self.failure_threshold
+            ):
+                self._state = CIRCUIT_OPEN
+                self._opened_at = time.monotonic()
+
+    def reset(self):
+        self.record_success()
@@ -0,0 +1,313 @@
+import itertools
+import threading
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Union
+
+from pymatillion.backoff import Backoff
+from pymatillion.bulk import JobRunResult, JobSpec, run_jobs
+from pymatillion.constants import DEFAULT_MAX_CONCURRENCY, DEFAULT_VERSION
+from pymatillion.matillion import MatillionClient
+from pymatillion.waiter import is_terminal, wait_for_tasks
+
+
+class RoutedTask(NamedTuple):
+    """
+    A task together with the instance that launched it.
+
+    Task IDs are sequences kept by each Matillion instance, so two instances can
+    hand out the same ID; pass a `RoutedTask` to `MatillionRouter.get_task_details`
+    and `MatillionRouter.wait_for_tasks` to say which one is meant.
+    """
+
+    instance: str
+    task_id: int
+
+    @classmethod
+    def from_response(cls, response: Dict) -> "RoutedTask":
+        """
+        Build the task handle of a `MatillionRouter.run_job` response.
+        """
+        return cls(response["instance"], response["id"])
+
+
+TaskRef = Union[RoutedTask, int]
+
+
+class RoutingPolicy:
+    """
+    Base class of the policies choosing the instance that runs a job.
+    """
+
+    def select(
+        self, router: "MatillionRouter", job_name: str, project_name: Optional[str]
+    ) -> str:
+        """
+        Return the name of the instance that should run the job.
+        """
+        raise NotImplementedError
+
+
+class RoundRobinPolicy(RoutingPolicy):
+    """
+    Cycle through the instances in order.
+    """
+
+    def __init__(self):
+        self._counter = itertools.count()
+
+    def select(self, router, job_name, project_name):
+        names = router.instance_names
+        return names[next(self._counter) % len(names)]
+
+
+class LeastInFlightPolicy(RoutingPolicy):
+    """
+    Pick the instance with the fewest launched tasks not yet seen finishing.
+
+    Ties go to the instance listed first.
+    """
+
+    def select(self, router, job_name, project_name):
+        in_flight = router.in_flight
+        return min(router.instance_names, key=lambda name: in_flight[name])
+
+
+class AffinityPolicy(RoutingPolicy):
+    """
+    Pin projects to instances, delegating unmapped projects to `fallback`.
+
+    Args:
+        affinity (dict): `{project_name: instance_name}` map.
+        fallback (RoutingPolicy): Policy for projects missing from the map.
+            Defaults to `LeastInFlightPolicy`.
+    """
+
+    def __init__(
+        self, affinity: Dict[str, str], fallback: Optional[RoutingPolicy] = None
+    ):
+        self.affinity = dict(affinity)
+        self.fallback = fallback or LeastInFlightPolicy()
+
+    def select(self, router, job_name, project_name):
+        instance = self.affinity.get(project_name)
+        if instance is None:
+            return self.fallback.select(router, job_name, project_name)
+        return instance
+
+
+class MatillionRouter:
+    """
+    Spread job launches over several Matillion instances behind one API.
+
+    `run_job` launches the job on the instance chosen by the routing policy and
+    remembers which instance owns the returned task, so `get_task_details` and
+    `wait_for_tasks` are sent back to it. Task IDs are only unique per instance:
+    a bare task ID launched on more than one instance is rejected as ambiguous, so
+    pass `RoutedTask` handles, built from the `instance` added to each `run_job`
+    response, when several instances are in use.
+
+    Args:
+        instances (dict): `{instance_name: MatillionClient}`.
+        policy (RoutingPolicy): Defaults to `LeastInFlightPolicy`.
+    """
+
+    def __init__(
+        self,
+        instances: Dict[str, MatillionClient],
+        policy: Optional[RoutingPolicy] = None,
+    ):
+        if not instances:
+            raise ValueError("At least one instance is required")
+        self.instances = dict(instances)
+        self.policy = policy or LeastInFlightPolicy()
+        self._in_flight = dict.fromkeys(self.instances, 0)
+        self._task_instances: Dict[int, Set[str]] = {}
+        self._lock = threading.RLock()
+
+    @classmethod
+    def from_configs(
+        cls,
+        configs: Dict[str, Dict],
+        policy: Optional[RoutingPolicy] = None,
+        **client_kwargs,
+    ) -> "MatillionRouter":
+        """
+        Build a router from `MatillionClient` keyword arguments per instance.
+
+        Args:
+            configs (dict): `{instance_name: {"base_url": ..., "username": ...}}`.
+            policy (RoutingPolicy): Routing policy.
+            client_kwargs : Keyword arguments shared by every client, e.g. `retry`.
+        """
+        return cls(
+            {
+                name: MatillionClient(**{**client_kwargs, **config})
+                for name, config in configs.items()
+            },
+            policy=policy,
+        )
+
+    def __enter__(self) -> "MatillionRouter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        for client in self.instances.values():
+            client.close()
+
+    @property
+    def instance_names(self) -> List[str]:
+        return list(self.instances)
+
+    @property
+    def in_flight(self) -> Dict[str, int]:
+        """
+        Number of launched tasks per instance that have not been seen finishing.
+        """
+        with self._lock:
+            return dict(self._in_flight)
+
+    def instance_for_task(self, task_id: int) -> str:
+        """
+        Name of the instance that launched the task.
+
+        Raises:
+            ValueError : If the task was not launched through this router, or if
+                more than one instance launched a task with this ID.
+        """
+        with self._lock:
+            instances = sorted(self._task_instances.get(task_id, ()))
+        if not instances:
+            raise ValueError(f"Task {task_id} was not launched through this router")
+        if len(instances) > 1:
+            raise ValueError(
+                f"Task {task_id} was launched on several instances: {instances}."
+                " Pass a RoutedTask instead."
+            )
+        return instances[0]
+
+    def forget_task(self, task_id: TaskRef, instance: str = None):
+        """
+        Stop tracking a task, e.g. one that will never be polled again.
+        """
+        if isinstance(task_id, RoutedTask):
+            instance, task_id = task_id
+        with self._lock:
+            if instance is None:
+                if task_id not in self._task_instances:
+                    return
+                instance = self.instance_for_task(task_id)
+            instances = self._task_instances.get(task_id, set())
+            if instance in instances:
+                instances.discard(instance)
+                if not instances:
+                    del self._task_instances[task_id]
+                self._in_flight[instance] -= 1
+
+    def run_job(
+        self,
+        job_name: str,
+        job_variables: dict = {},
+        grid_variables: dict = {},
+        project_name: str = None,
+        version: str = DEFAULT_VERSION,
+        instance: str = None,
+    ) -> Dict:
+        """
+        Run a Matillion job on the instance chosen by the routing policy.
+
+        Accepts the arguments of `MatillionClient.run_job`, plus `instance` to
+        bypass the policy.
+
+        Returns:
+            dict : Response of the instance that ran the job, with its name added
+                under `instance`. `RoutedTask.from_response` turns it into a task
+                handle.
+        """
+        with self._lock:
+            if instance is None:
+                instance = self.policy.select(self, job_name, project_name)
+            if instance not in self.instances:
+                raise ValueError(f"Unknown Matillion instance: {instance}")
+            # Policies read the counters, so select and count under one (reentrant)
+            # lock to spread concurrent launches out.
+            self._in_flight[instance] += 1
+        try:
+            response = self.instances[instance].run_job(
+                job_name, job_variables, grid_variables, project_name, version
+            )
+        except Exception:
+            with self._lock:
+                self._in_flight[instance] -= 1
+            raise
+        # A launch rejected in the response body, e.g. {"success": false, "id": -1},
+        # has no task to track.
+        task_id = response.get("id") if response.get("success", True) else None
+        with self._lock:
+            if task_id is None:
+                self._in_flight[instance] -= 1
+            else:
+                self._task_instances.setdefault(task_id, set()).add(instance)
+        return {**response, "instance": instance}
+
+    def run_jobs(
+        self,
+        specs: Iterable[Union[JobSpec, tuple, Dict]],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> Iterator[JobRunResult]:
+        """
+        Run several Matillion jobs in parallel, routing each launch separately.
+
+        See `MatillionClient.run_jobs`.
+        """
+        return run_jobs(self, specs, max_concurrency=max_concurrency)
+
+    def get_task_details(
+        self, task_id: TaskRef, project_name: str = None, instance: str = None
+    ) -> Dict:
+        """
+        Retrieve task details from the instance that launched the task.
+
+        Tasks seen in a terminal state stop counting towards their instance's
+        in-flight total and are no longer tracked afterwards.
+
+        Args:
+            task_id (RoutedTask | int): Task handle, or a task ID that only one
+                instance launched.
+            project_name (str): Name of the Matillion project.
+            instance (str): Instance to ask, for a bare task ID.
+        """
+        if isinstance(task_id, RoutedTask):
+            instance, task_id = task_id
+        if instance is None:
+            instance = self.instance_for_task(task_id)
+        task = self.instances[instance].get_task_details(
+            task_id, project_name=project_name
+        )
+        if is_terminal(task):
+            self.forget_task(task_id, instance)
+        return task
+
+    def wait_for_tasks(
+        self,
+        task_ids: Iterable[TaskRef],
+        project_name: str = None,
+        timeout: Optional[float] = None,
+        backoff: Optional[Backoff] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> Dict[TaskRef, Dict]:
+        """
+        Poll tasks launched on any instance until all reach a terminal state.
+
+        See `MatillionClient.wait_for_tasks`. Tasks are `RoutedTask` handles or
+        bare task IDs, and the result is keyed by the same values.
+        """
+        return wait_for_tasks(
+            self,
+            task_ids,
+            project_name=project_name,
+            timeout=timeout,
+            backoff=backoff,
+            max_concurrency=max_concurrency,
+        )
@@ -0,0 +1,150 @@
+import codecs
+import json
+from typing import Any, Iterable, Iterator, List, Optional, Sequence
+
+from pymatillion.constants import DEFAULT_STREAM_CHUNK_SIZE
+
+_WHITESPACE = " \t\n\r"
+_DELIMITERS = _WHITESPACE + ",]"
+_decoder = json.JSONDecoder()
+
+
+class _Container:
+    __slots__ = ("is_object", "key")
+
+    def __init__(self, is_object: bool):
+        self.is_object = is_object
+        self.key: Optional[str] = None
+
+
+def iter_json_array(chunks: Iterable[bytes], path: Sequence[str] = ()) -> Iterator[Any]:
+    """
+    Incrementally decode the items of a JSON array from a stream of byte chunks.
+
+    Only the current item is held in memory, so arbitrarily large arrays can be
+    consumed with bounded memory. Decoding stops as soon as the array is closed;
+    the rest of the document is not read.
+
+    Args:
+        chunks (iterable): UTF-8 encoded chunks of the JSON document.
+        path (sequence): Object keys leading to the array, e.g. `("tasks",)` for
+            the components of a task details response. An empty path selects a
+            top-level array.
+    Returns:
+        Iterator[Any] : Decoded array items.
+    Raises:
+        ValueError : If the document is malformed or the array is not found.
+    """
+    text_chunks = _decode_chunks(chunks)
+    buffer = _find_array(text_chunks, tuple(path))
+    position = 0
+    expect_item = True
+    while True:
+        while position < len(buffer) and buffer[position] in _WHITESPACE:
+            position += 1
+        if position >= len(buffer):
+            chunk = next(text_chunks, None)
+            if chunk is None:
+                raise ValueError("Unexpected end of JSON array")
+            buffer = buffer[position:] + chunk
+            position = 0
+            continue
+        char = buffer[position]
+        if char == "]":
+            return
+        if not expect_item:
+            if char != ",":
+                raise ValueError(f"Expected ',' or ']' but found {char!r}")
+            position += 1
+            expect_item = True
+            continue
+        try:
+            item, end = _decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            end = None
+        # A complete item is always followed by ',', ']' or whitespace. Anything
+        # else means the item (e.g. a number) was cut off at the end of a chunk.
+        if end is None or end >= len(buffer) or buffer[end] not in _DELIMITERS:
+            chunk = next(text_chunks, None)
+            if chunk is None:
+                raise ValueError("Unexpected end of JSON array")
+            buffer = buffer[position:] + chunk
+            position = 0
+            continue
+        yield item
+        # Consumed text is only dropped when the next chunk is appended, so a chunk
+        # holding many items is not copied once per item.
+        position = end
+        expect_item = False
+
+
+def _decode_chunks(chunks: Iterable[bytes]) -> Iterator[str]:
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    for chunk in chunks:
+        text = decoder.decode(chunk) if isinstance(chunk, bytes) else chunk
+        if text:
+            yield text
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield tail
+
+
+def _find_array(text_chunks: Iterator[str], path: tuple) -> str:
+    """
+    Consume the stream up to the opening bracket of the target array.
+
+    Returns:
+        str : Remaining text of the current chunk after the bracket.
+    Raises:
+        ValueError : If the top-level value ends before the array is found.
+    """
+    stack: List[_Container] = []
+    in_string = False
+    escaped = False
+    string_chars: List[str] = []
+    last_string: Optional[str] = None
+    for chunk in text_chunks:
+        for index, char in enumerate(chunk):
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif char == "\\":
+                    escaped = True
+                elif char == '"':
+                    in_string = False
+                    last_string = json.loads(f'"{"".join(string_chars)}"')
+                    continue
+                string_chars.append(char)
+            elif char == '"':
+                in_string = True
+                string_chars = []
+            elif char == ":":
+                stack[-1].key = last_string
+            elif char == "{":
+                stack.append(_Container(is_object=True))
+            elif char == "[":
+                if all(c.is_object for c in stack) and path == tuple(
+                    c.key for c in stack
+                ):
+                    return chunk[index + 1 :]
+                stack.append(_Container(is_object=False))
+            elif char in "}]":
+                if not stack:
+                    raise ValueError("Malformed JSON document")
+                stack.pop()
+                if not stack:
+                    raise ValueError(f"JSON array not found at path {list(path)}")
+    raise ValueError(f"JSON array not found at path {list(path)}")
+
+
+def iter_response_array(
+    response, path: Sequence[str] = (), chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE
+) -> Iterator[Any]:
+    """
+    Stream the items of a JSON array from a `requests.Response` made with
+    `stream=True`, closing the response once done.
+    """
+    try:
+        yield from iter_json_array(response.iter_content(chunk_size), path)
+    finally:
+        response.close()
@@ -0,0 +1,257 @@
+import hashlib
+import json
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Union
+
+import requests
+
+from pymatillion.constants import (
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_STREAM_CHUNK_SIZE,
+    DEFAULT_VERSION,
+    EXPORT_FILE_SUFFIX,
+    MANIFEST_FILE_NAME,
+    TRANSFER_EXPORTED,
+    TRANSFER_FAILED,
+    TRANSFER_IMPORTED,
+    TRANSFER_UNCHANGED,
+)
+
+logger = logging.getLogger(__name__)
+
+PathLike = Union[str, os.PathLike]
+
+# Characters of job names that cannot appear in a file name as they are.
+_FILE_NAME_ESCAPES = str.maketrans({"%": "%25", "/": "%2F", "\\": "%5C", "\0": "%00"})
+
+
+@dataclass
+class TransferResult:
+    """
+    Outcome of exporting or importing one Matillion job.
+
+    `status` is one of `EXPORTED`, `IMPORTED`, `UNCHANGED` or `FAILED`.
+    """
+
+    job_name: str
+    path: Optional[Path]
+    status: str
+    digest: Optional[str] = None
+    error: Optional[BaseException] = field(default=None, repr=False)
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def job_file_name(job_name: str) -> str:
+    """
+    Name of the file a job is exported to.
+
+    Job names come from the server or from a manifest, so path separators, NUL
+    and `%` are percent-encoded: every job maps to a distinct file directly inside
+    the export directory, and no name can point outside of it or at the manifest.
+
+    Args:
+        job_name (str): Name of the Matillion job.
+    Returns:
+        str : File name, relative to the export directory.
+    """
+    file_name = job_name.translate(_FILE_NAME_ESCAPES) + EXPORT_FILE_SUFFIX
+    if file_name == MANIFEST_FILE_NAME:
+        file_name = f"%{ord(file_name[0]):02X}{file_name[1:]}"
+    return file_name
+
+
+def file_digest(path: PathLike, chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE) -> str:
+    """
+    SHA-256 hex digest of a file, read in chunks.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as source:
+        for chunk in iter(lambda: source.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def download(
+    response: requests.Response,
+    path: PathLike,
+    chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+) -> str:
+    """
+    Write a streamed response body to disk, hashing it on the way.
+
+    Args:
+        response (requests.Response): Response opened with `stream=True`.
+        path (str): Destination file.
+        chunk_size (int): Bytes read from the connection at a time.
+    Returns:
+        str : SHA-256 hex digest of the body.
+    """
+    digest = hashlib.sha256()
+    try:
+        with open(path, "wb") as destination:
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                digest.update(chunk)
+                destination.write(chunk)
+    finally:
+        response.close()
+    return digest.hexdigest()
+
+
+def load_manifest(path: PathLike) -> Dict[str, str]:
+    """
+    Read a `{job_name: digest}` manifest, returning an empty one if it is missing.
+    """
+    try:
+        with open(path) as manifest:
+            return json.load(manifest)["jobs"]
+    except FileNotFoundError:
+        return {}
+
+
+def save_manifest(path: PathLike, digests: Dict[str, str]):
+    """
+    Atomically write a `{job_name: digest}` manifest.
+    """
+    temporary_path = f"{path}.part"
+    with open(temporary_path, "w") as manifest:
+        json.dump({"jobs": dict(sorted(digests.items()))}, manifest, indent=2)
+    os.replace(temporary_path, path)
+
+
+def _transfer_all(
+    transfer: Callable[[str], TransferResult],
+    job_names: List[str],
+    max_concurrency: int,
+    action: str,
+) -> List[TransferResult]:
+    def run(job_name: str) -> TransferResult:
+        try:
+            return transfer(job_name)
+        except Exception as e:
+            logger.error(f"Failed to {action} job {job_name}: {e}")
+            return TransferResult(job_name, None, TRANSFER_FAILED, error=e)
+
+    if not job_names:
+        return []
+    with ThreadPoolExecutor(
+        max_workers=min(max_concurrency, len(job_names)),
+        thread_name_prefix=f"pymatillion-{action}",
+    ) as executor:
+        return list(executor.map(run, job_names))
+
+
+def export_jobs(
+    client,
+    directory: PathLike,
+    job_names: Optional[Iterable[str]] = None,
+    project_name: str = None,
+    version: str = DEFAULT_VERSION,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> List[TransferResult]:
+    """
+    Export jobs of a project version to one file per job, in parallel.
+
+    Each export is streamed to disk, to the file named by `job_file_name`, and
+    hashed. Files whose content matches the
+    digest recorded in the directory's manifest by the previous export are left
+    untouched and reported as `UNCHANGED`; the manifest is rewritten afterwards.
+
+    Args:
+        client (MatillionClient): Client of the source instance.
+        directory (str): Export directory, created if missing.
+        job_names (iterable): Jobs to export. Defaults to every job of the version.
+        project_name (str): Name of the Matillion project.
+        version (str): Name of the project version.
+        max_concurrency (int): Maximum number of exports in flight.
+    Returns:
+        List[TransferResult] : Per-job results, in the order of `job_names`.
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    manifest_path = directory / MANIFEST_FILE_NAME
+    previous = load_manifest(manifest_path)
+    # A full export drops jobs that no longer exist at the source.
+    digests = {} if job_names is None else dict(previous)
+    if job_names is None:
+        job_names = client.iter_jobs(project_name, version)
+
+    def export(job_name: str) -> TransferResult:
+        path = directory / job_file_name(job_name)
+        temporary_path = path.with_name(f"{path.name}.part")
+        try:
+            digest = client.export_job_to_file(
+                job_name, temporary_path, project_name, version
+            )
+        except Exception:
+            temporary_path.unlink(missing_ok=True)
+            raise
+        if digest == previous.get(job_name) and path.exists():
+            temporary_path.unlink()
+            return TransferResult(job_name, path, TRANSFER_UNCHANGED, digest)
+        os.replace(temporary_path, path)
+        return TransferResult(job_name, path, TRANSFER_EXPORTED, digest)
+
+    results = _transfer_all(export, list(job_names), max_concurrency, "export")
+    for result in results:
+        if result.ok:
+            digests[result.job_name] = result.digest
+        elif result.job_name in previous:
+            digests[result.job_name] = previous[result.job_name]
+    save_manifest(manifest_path, digests)
+    return results
+
+
+def import_jobs(
+    client,
+    directory: PathLike,
+    job_names: Optional[Iterable[str]] = None,
+    project_name: str = None,
+    version: str = DEFAULT_VERSION,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    state_file: Optional[PathLike] = None,
+) -> List[TransferResult]:
+    """
+    Import jobs exported by `export_jobs` into a project version, in parallel.
+
+    Job files are streamed from disk. When `state_file` is given it records the
+    digest of every job imported into the target, and jobs whose file still has
+    the recorded digest are skipped and reported as `UNCHANGED`.
+
+    Args:
+        client (MatillionClient): Client of the target instance.
+        directory (str): Directory written by `export_jobs`.
+        job_names (iterable): Jobs to import. Defaults to every job of the manifest.
+        project_name (str): Name of the Matillion project.
+        version (str): Name of the project version.
+        max_concurrency (int): Maximum number of imports in flight.
+        state_file (str): Manifest of the jobs already imported into the target.
+    Returns:
+        List[TransferResult] : Per-job results, in the order of `job_names`.
+    """
+    directory = Path(directory)
+    if job_names is None:
+        job_names = load_manifest(directory / MANIFEST_FILE_NAME)
+    imported = load_manifest(state_file) if state_file else {}
+
+    def import_(job_name: str) -> TransferResult:
+        path = directory / job_file_name(job_name)
+        digest = file_digest(path)
+        if imported.get(job_name) == digest:
+            return TransferResult(job_name, path, TRANSFER_UNCHANGED, digest)
+        client.import_job(path, project_name, version)
+        return TransferResult(job_name, path, TRANSFER_IMPORTED, digest)
+
+    results = _transfer_all(import_, list(job_names), max_concurrency, "import")
+    if state_file:
+        for result in results:
+            if result.ok:
+                imported[result.job_name] = result.digest
+        save_manifest(state_file, imported)
+    return results
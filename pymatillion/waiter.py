@@ -0,0 +1,208 @@
+import heapq
+import logging
+import queue
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from typing import Dict, Iterable, Iterator, Optional, Tuple, Union
+
+from requests import HTTPError, RequestException
+
+from pymatillion.backoff import Backoff
+from pymatillion.constants import (
+    DEFAULT_MAX_CONCURRENCY,
+    RETRY_STATUS_CODES,
+    TERMINAL_TASK_STATES,
+)
+from pymatillion.exceptions import CircuitOpenError, TaskWaitTimeout
+
+logger = logging.getLogger(__name__)
+
+
+def is_terminal(task: Dict) -> bool:
+    """
+    Check whether task details returned by `get_task_details` are in a final state.
+    """
+    return task.get("state") in TERMINAL_TASK_STATES
+
+
+def _is_transient_status(status_code: int) -> bool:
+    # Client errors such as 404 for an unknown task will not go away on their own.
+    return status_code >= 500 or status_code in RETRY_STATUS_CODES
+
+
+def _is_transient(error: Exception) -> bool:
+    if isinstance(error, HTTPError) and error.response is not None:
+        return _is_transient_status(error.response.status_code)
+    # Errors of the async client; aiohttp is optional and only loaded by it.
+    aiohttp = sys.modules.get("aiohttp")
+    if aiohttp is not None:
+        if isinstance(error, aiohttp.ClientResponseError):
+            return _is_transient_status(error.status)
+        if isinstance(error, aiohttp.ClientError):
+            return True
+    # asyncio.TimeoutError is an alias of FuturesTimeoutError.
+    return isinstance(error, (RequestException, CircuitOpenError, FuturesTimeoutError))
+
+
+def iter_finished_tasks(
+    client,
+    task_ids: Iterable[int],
+    project_name: str = None,
+    timeout: Optional[float] = None,
+    backoff: Optional[Backoff] = None,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    new_tasks: Optional[queue.Queue] = None,
+) -> Iterator[Tuple[int, Dict]]:
+    """
+    Poll several Matillion tasks until each one reaches a terminal state.
+
+    A single scheduler keeps one poll deadline per task. Tasks that are due at the
+    same time are polled together over a small thread pool, then rescheduled with
+    an exponential backoff that restarts whenever the task changes state.
+
+    A poll failing with a connection error, timeout or HTTP 429/5xx only
+    reschedules that task with the same backoff; other tasks keep being polled
+    and the wait only gives up at the deadline.
+
+    Tasks launched while waiting can be added through `new_tasks`, a queue of task
+    IDs closed by putting None. They are polled as soon as they are received, and
+    the wait lasts until the queue is closed and every task has finished.
+
+    Args:
+        client (MatillionClient): Client used to poll `get_task_details`.
+        task_ids (iterable): IDs of the tasks to wait for.
+        project_name (str): Name of the Matillion project.
+        timeout (float): Overall deadline in seconds, or None to wait forever.
+        backoff (Backoff): Poll interval schedule.
+        max_concurrency (int): Maximum number of polls in flight.
+        new_tasks (queue.Queue): IDs of more tasks to wait for, ending with None.
+    Returns:
+        Iterator[tuple] : (task ID, final task details) pairs, yielded as each task
+            finishes.
+    Raises:
+        TaskWaitTimeout : If the deadline passes before every task has finished.
+            Tasks that did finish are available on the exception's `completed`
+            attribute.
+    """
+    backoff = backoff or Backoff()
+    deadline = None if timeout is None else time.monotonic() + timeout
+    task_ids = list(dict.fromkeys(task_ids))
+    schedule = [(0.0, task_id) for task_id in task_ids]
+    attempts = dict.fromkeys(task_ids, 0)
+    states = {}
+    completed = {}
+    executor = None
+    receiving = new_tasks is not None
+
+    def receive(timeout: Optional[float]):
+        # Wait up to `timeout` seconds for a new task, then take any other queued
+        # ones without blocking.
+        nonlocal receiving
+        block = True
+        while receiving:
+            try:
+                task_id = new_tasks.get(block, timeout)
+            except queue.Empty:
+                return
+            block = False
+            if task_id is None:
+                receiving = False
+            elif task_id not in attempts:
+                attempts[task_id] = 0
+                heapq.heappush(schedule, (time.monotonic(), task_id))
+
+    def poll(task_id) -> Union[Dict, Exception]:
+        try:
+            return client.get_task_details(task_id, project_name=project_name)
+        except Exception as e:
+            if not _is_transient(e):
+                raise
+            return e
+
+    try:
+        while schedule or receiving:
+            now = time.monotonic()
+            if deadline is not None and now >= deadline:
+                receive(0)
+                pending = sorted(task_id for _, task_id in schedule)
+                raise TaskWaitTimeout(
+                    f"Tasks still running after {timeout}s: {pending}",
+                    pending,
+                    completed,
+                )
+            if not schedule or schedule[0][0] > now:
+                wake_at = schedule[0][0] if schedule else deadline
+                if deadline is not None:
+                    wake_at = min(wake_at, deadline)
+                if receiving:
+                    receive(None if wake_at is None else max(0.0, wake_at - now))
+                else:
+                    time.sleep(wake_at - now)
+                continue
+
+            due = []
+            while schedule and schedule[0][0] <= now:
+                due.append(heapq.heappop(schedule)[1])
+            if len(due) == 1:
+                tasks = [poll(due[0])]
+            else:
+                if executor is None:
+                    executor = ThreadPoolExecutor(
+                        max_workers=max_concurrency,
+                        thread_name_prefix="pymatillion-poll",
+                    )
+                tasks = list(executor.map(poll, due))
+
+            for task_id, task in zip(due, tasks):
+                if isinstance(task, Exception):
+                    logger.warning(f"Failed to poll task {task_id}, retrying: {task}")
+                elif is_terminal(task):
+                    completed[task_id] = task
+                    yield task_id, task
+                    continue
+                elif task.get("state") != states.get(task_id):
+                    states[task_id] = task.get("state")
+                    attempts[task_id] = 0
+                heapq.heappush(
+                    schedule,
+                    (time.monotonic() + backoff.delay(attempts[task_id]), task_id),
+                )
+                attempts[task_id] += 1
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+def wait_for_tasks(
+    client,
+    task_ids: Iterable[int],
+    project_name: str = None,
+    timeout: Optional[float] = None,
+    backoff: Optional[Backoff] = None,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> Dict[int, Dict]:
+    """
+    Block until every task reaches a terminal state.
+
+    Accepts the same arguments as `iter_finished_tasks`.
+
+    Returns:
+        dict : Final task details by task ID.
+    Raises:
+        TaskWaitTimeout : If the deadline passes first. Tasks that did finish are
+            available on the exception's `completed` attribute.
+    """
+    task_ids = list(dict.fromkeys(task_ids))
+    completed = dict(
+        iter_finished_tasks(
+            client,
+            task_ids,
+            project_name=project_name,
+            timeout=timeout,
+            backoff=backoff,
+            max_concurrency=max_concurrency,
+        )
+    )
+    return {task_id: completed[task_id] for task_id in task_ids}
@@ -0,0 +1,252 @@
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from pymatillion.backoff import Backoff
+from pymatillion.constants import DEFAULT_MAX_CONCURRENCY, TERMINAL_TASK_STATES
+from pymatillion.waiter import _is_transient
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class TaskEvent:
+    """
+    A task state transition observed by `TaskWatcher`.
+
+    `previous_state` is None the first time a task is seen.
+    """
+
+    task_id: int
+    state: str
+    previous_state: Optional[str]
+    task: Dict = field(repr=False)
+
+    @property
+    def is_finished(self) -> bool:
+        return self.state in TERMINAL_TASK_STATES
+
+
+class TaskWatcher:
+    """
+    Stream state transitions of Matillion tasks.
+
+    Watches either the given task IDs, until all of them finish, or every task of
+    a project, until the watch times out or the consumer stops iterating. Project
+    watches list the running tasks once per round and only fetch the details of
+    tasks that stopped running. Each round is followed by a backoff delay, which
+    restarts after a round that produced events.
+
+    Only transitions are yielded: a task is reported when first seen and whenever
+    its state differs from the last reported one. `cursor` captures the reported
+    states and can be passed to a new watcher to resume without replaying or
+    missing transitions. A task that starts and finishes between two rounds of a
+    project watch is not seen by the watcher.
+
+    A poll failing with a connection error, timeout or HTTP 429/5xx is logged and
+    retried in the next round, like in `wait_for_tasks`; other errors end the
+    watch.
+
+    Iterate with `for` when `client` is a `MatillionClient`, or `async for` when it
+    is an `AsyncMatillionClient`.
+
+    Args:
+        client (MatillionClient or AsyncMatillionClient): Client used to poll.
+        task_ids (iterable): IDs of the tasks to watch. Watches the whole project
+            when omitted.
+        project_name (str): Name of the Matillion project.
+        cursor (dict): `cursor` of a previous watcher to resume from.
+        backoff (Backoff): Delay schedule between polling rounds.
+        timeout (float): Stop after this many seconds, or None to run until done.
+        max_concurrency (int): Maximum number of task detail polls in flight.
+    """
+
+    def __init__(
+        self,
+        client,
+        task_ids: Optional[Iterable[int]] = None,
+        project_name: str = None,
+        cursor: Optional[Dict] = None,
+        backoff: Optional[Backoff] = None,
+        timeout: Optional[float] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ):
+        self.client = client
+        self.task_ids = None if task_ids is None else list(dict.fromkeys(task_ids))
+        self.project_name = project_name
+        self.backoff = backoff or Backoff()
+        self.timeout = timeout
+        self.max_concurrency = max_concurrency
+        self._states: Dict[int, str] = {}
+        if cursor:
+            self._states = {
+                int(task_id): state for task_id, state in cursor["states"].items()
+            }
+
+    @property
+    def cursor(self) -> Dict:
+        """
+        JSON serializable position of the watch, covering every yielded event.
+        """
+        return {
+            "states": {str(task_id): state for task_id, state in self._states.items()}
+        }
+
+    @property
+    def done(self) -> bool:
+        """
+        Whether every watched task has finished. Always False for project watches.
+        """
+        return self.task_ids is not None and not self._pending()
+
+    def _pending(self) -> List[int]:
+        # Watched task IDs that have not been reported finished yet.
+        return [
+            task_id
+            for task_id in self.task_ids
+            if self._states.get(task_id) not in TERMINAL_TASK_STATES
+        ]
+
+    def _diff(self, tasks: Iterable[Tuple[int, Optional[Dict]]]) -> List[TaskEvent]:
+        events = []
+        for task_id, task in tasks:
+            if task is None:
+                # The poll failed and is retried in the next round.
+                continue
+            state = task.get("state")
+            previous_state = self._states.get(task_id)
+            if state != previous_state:
+                events.append(TaskEvent(task_id, state, previous_state, task))
+        return events
+
+    def _apply(self, event: TaskEvent):
+        # States are committed one event at a time, so `cursor` never runs ahead of
+        # what the consumer has received. Project watches forget finished tasks,
+        # which no longer appear among the running ones.
+        if self.task_ids is None and event.is_finished:
+            self._states.pop(event.task_id, None)
+        else:
+            self._states[event.task_id] = event.state
+
+    def _running(self, running: List[Dict]) -> Tuple[List[Tuple[int, Dict]], List[int]]:
+        # Split a running task listing into (task ID, task) pairs and the IDs of
+        # known tasks that are no longer running.
+        tasks = [(task["id"], task) for task in running]
+        seen = {task_id for task_id, _ in tasks}
+        return tasks, [task_id for task_id in self._states if task_id not in seen]
+
+    def _failed(self, error: Exception, action: str):
+        # Transient failures are retried in the next round, others end the watch.
+        if not _is_transient(error):
+            raise error
+        logger.warning(f"Failed to {action}, retrying: {error}")
+
+    def _next_delay(
+        self, idle_rounds: int, deadline: Optional[float]
+    ) -> Optional[float]:
+        delay = self.backoff.delay(idle_rounds)
+        if deadline is None:
+            return delay
+        remaining = deadline - time.monotonic()
+        return None if remaining <= 0 else min(delay, remaining)
+
+    def __iter__(self) -> Iterator[TaskEvent]:
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+        executor = None
+        idle_rounds = 0
+
+        def poll(task_id):
+            try:
+                return task_id, self.client.get_task_details(
+                    task_id, project_name=self.project_name
+                )
+            except Exception as e:
+                self._failed(e, f"poll task {task_id}")
+                return task_id, None
+
+        def poll_all(task_ids):
+            nonlocal executor
+            if len(task_ids) <= 1:
+                return list(map(poll, task_ids))
+            if executor is None:
+                executor = ThreadPoolExecutor(
+                    max_workers=self.max_concurrency,
+                    thread_name_prefix="pymatillion-watch",
+                )
+            return list(executor.map(poll, task_ids))
+
+        try:
+            while not self.done:
+                if self.task_ids is None:
+                    try:
+                        running = self.client.list_running_tasks(self.project_name)
+                    except Exception as e:
+                        self._failed(e, "list running tasks")
+                        running = None
+                    tasks = []
+                    if running is not None:
+                        tasks, stopped = self._running(running)
+                        tasks.extend(poll_all(stopped))
+                else:
+                    tasks = poll_all(self._pending())
+                events = self._diff(tasks)
+                for event in events:
+                    self._apply(event)
+                    yield event
+                idle_rounds = 0 if events else idle_rounds + 1
+                if self.done:
+                    return
+                delay = self._next_delay(idle_rounds, deadline)
+                if delay is None:
+                    return
+                time.sleep(delay)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+    async def __aiter__(self) -> AsyncIterator[TaskEvent]:
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+        idle_rounds = 0
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def poll(task_id):
+            async with semaphore:
+                try:
+                    return task_id, await self.client.get_task_details(
+                        task_id, project_name=self.project_name
+                    )
+                except Exception as e:
+                    self._failed(e, f"poll task {task_id}")
+                    return task_id, None
+
+        async def poll_all(task_ids):
+            return list(await asyncio.gather(*map(poll, task_ids)))
+
+        while not self.done:
+            if self.task_ids is None:
+                try:
+                    running = await self.client.list_running_tasks(self.project_name)
+                except Exception as e:
+                    self._failed(e, "list running tasks")
+                    running = None
+                tasks = []
+                if running is not None:
+                    tasks, stopped = self._running(running)
+                    tasks.extend(await poll_all(stopped))
+            else:
+                tasks = await poll_all(self._pending())
+            events = self._diff(tasks)
+            for event in events:
+                self._apply(event)
+                yield event
+            idle_rounds = 0 if events else idle_rounds + 1
+            if self.done:
+                return
+            delay = self._next_delay(idle_rounds, deadline)
+            if delay is None:
+                return
+            await asyncio.sleep(delay)
@@ -0,0 +1,37 @@
+"""
+Test doubles shared by several test modules.
+"""
+
+
+def task_states(states):
+    """Build a get_task_details side effect returning the given states in turn."""
+    remaining = {task_id: list(values) for task_id, values in states.items()}
+
+    def get_task_details(task_id, project_name=None):
+        values = remaining[task_id]
+        state = values.pop(0) if len(values) > 1 else values[0]
+        return {"id": task_id, "state": state}
+
+    return get_task_details
+
+
+class FakeClock:
+    """
+    Stand-in for the `time` module of the code under test, patched in with
+    `patch("pymatillion.<module>.time", new_callable=FakeClock)`. Sleeping advances
+    the clock instantly.
+    """
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
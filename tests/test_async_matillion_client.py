@@ -0,0 +1,207 @@
+import asyncio
+import json
+from pathlib import Path
+from unittest import IsolatedAsyncioTestCase
+
+from pymatillion.async_matillion import AsyncMatillionClient
+from pymatillion.payloads import GridVariables
+from pymatillion.singleflight import AsyncSingleFlight
+
+DUMMY_URL = "https://fakematillioninstance.com"
+DUMMY_USERNAME = "fake_user"
+DUMMY_PASSWORD = "fake_pass"
+DUMMY_PROJECT_GROUP_NAME = "Sample_Project_Group"
+DUMMY_PROJECT_NAME = "Sample_Project_1"
+DUMMY_JOB_NAME = "Sample_Job_1"
+DUMMY_TASK_ID = 12345
+
+
+PARENT_DIR = Path(__file__).parent
+
+
+class FakeResponse:
+    def __init__(self, payload, status=200):
+        self.payload = payload
+        self.status = status
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def read(self):
+        return json.dumps(self.payload).encode()
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise RuntimeError(self.payload["msg"])
+
+    async def json(self, content_type=None):
+        return self.payload
+
+
+class FakeSession:
+    """Test double for aiohttp.ClientSession."""
+
+    def __init__(self, payload, status=200, delay=0):
+        self.payload = payload
+        self.status = status
+        self.delay = delay
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.closed = False
+
+    def request(self, method, url, headers=None, **payload):
+        body = payload.get("json")
+        if payload.get("data") is not None:
+            body = json.loads(payload["data"])
+        self.calls.append((method, url, headers, body))
+        return _FakeRequest(self)
+
+    async def close(self):
+        self.closed = True
+
+
+class _FakeRequest:
+    def __init__(self, session):
+        self.session = session
+
+    async def __aenter__(self):
+        self.session.in_flight += 1
+        self.session.max_in_flight = max(
+            self.session.max_in_flight, self.session.in_flight
+        )
+        await asyncio.sleep(self.session.delay)
+        self.session.in_flight -= 1
+        return FakeResponse(self.session.payload, self.session.status)
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+def load_response(file_name):
+    with open(PARENT_DIR.joinpath(file_name)) as response:
+        return json.load(response)
+
+
+class TestAsyncMatillionClient(IsolatedAsyncioTestCase):
+    def make_client(self, payload, max_concurrency=10, **kwargs):
+        session = FakeSession(payload, **kwargs)
+        client = AsyncMatillionClient(
+            DUMMY_URL,
+            DUMMY_USERNAME,
+            DUMMY_PASSWORD,
+            DUMMY_PROJECT_GROUP_NAME,
+            DUMMY_PROJECT_NAME,
+            max_concurrency=max_concurrency,
+            session=session,
+        )
+        return client, session
+
+    async def test_list_project_groups(self):
+        json_content = load_response("list_project_groups_response.json")
+        client, session = self.make_client(json_content)
+        self.assertListEqual(await client.list_project_groups(), json_content)
+        method, url, headers, _ = session.calls[0]
+        self.assertEqual(method, "GET")
+        self.assertEqual(url, f"{DUMMY_URL}/rest/v1/group")
+        self.assertTrue(headers["Authorization"].startswith("Basic "))
+
+    async def test_list_jobs(self):
+        json_content = load_response("list_jobs_response.json")
+        client, session = self.make_client(json_content)
+        self.assertListEqual(await client.list_jobs(), json_content)
+        self.assertEqual(
+            session.calls[0][1],
+            f"{DUMMY_URL}/rest/v1/group/name/{DUMMY_PROJECT_GROUP_NAME}/project/name/"
+            f"{DUMMY_PROJECT_NAME}/version/name/default/job",
+        )
+
+    async def test_list_jobs_without_project(self):
+        client, session = self.make_client([])
+        client.project_name = None
+        with self.assertRaises(ValueError):
+            await client.list_jobs()
+        self.assertListEqual(session.calls, [])
+
+    async def test_scope_change_rebuilds_credentials_and_urls(self):
+        client, session = self.make_client([])
+        await client.list_projects()
+        client.username = "other_user"
+        client.project_group_name = "Other_Group"
+        await client.list_projects()
+        (_, url, headers, _), (_, other_url, other_headers, _) = session.calls
+        self.assertNotEqual(headers["Authorization"], other_headers["Authorization"])
+        self.assertEqual(
+            other_url, f"{DUMMY_URL}/rest/v1/group/name/Other_Group/project"
+        )
+
+    async def test_run_job(self):
+        json_content = load_response("run_job_response.json")
+        client, session = self.make_client(json_content)
+        response = await client.run_job(DUMMY_JOB_NAME, job_variables={"a": "1"})
+        self.assertEqual(response, json_content)
+        method, url, _, body = session.calls[0]
+        self.assertEqual(method, "POST")
+        self.assertTrue(url.endswith(f"/job/name/{DUMMY_JOB_NAME}/run"))
+        self.assertEqual(body, {"scalarVariables": {"a": "1"}, "gridVariables": {}})
+
+    async def test_run_job_with_encoded_grid_variables(self):
+        client, session = self.make_client(load_response("run_job_response.json"))
+        grid = GridVariables({"rows": [["a", 1], ["b", 2]]})
+        await client.run_job(DUMMY_JOB_NAME, grid_variables=grid)
+        _, _, headers, body = session.calls[0]
+        self.assertEqual(headers["Content-Type"], "application/json")
+        self.assertEqual(
+            body,
+            {"scalarVariables": {}, "gridVariables": {"rows": [["a", 1], ["b", 2]]}},
+        )
+
+    async def test_get_task_details(self):
+        json_content = load_response("task_detail_response.json")
+        client, session = self.make_client(json_content)
+        response = await client.get_task_details(DUMMY_TASK_ID)
+        self.assertEqual(response, json_content)
+        self.assertTrue(session.calls[0][1].endswith(f"/task/id/{DUMMY_TASK_ID}"))
+
+    async def test_unauthorized(self):
+        json_content = load_response("unauthorized_response.json")
+        client, _ = self.make_client(json_content, status=401)
+        with self.assertRaises(RuntimeError) as cm:
+            await client.list_project_groups()
+        self.assertEqual(json_content["msg"], cm.exception.args[0])
+
+    async def test_max_concurrency(self):
+        client, session = self.make_client([], max_concurrency=3, delay=0.01)
+        await asyncio.gather(*(client.list_project_groups() for _ in range(12)))
+        self.assertEqual(len(session.calls), 12)
+        self.assertEqual(session.max_in_flight, 3)
+
+    async def test_close_keeps_shared_session_open(self):
+        client, session = self.make_client([])
+        async with client:
+            pass
+        self.assertFalse(session.closed)
+
+    async def test_single_flight(self):
+        session = FakeSession(["Group"], delay=0.01)
+        client = AsyncMatillionClient(
+            DUMMY_URL,
+            DUMMY_USERNAME,
+            DUMMY_PASSWORD,
+            DUMMY_PROJECT_GROUP_NAME,
+            DUMMY_PROJECT_NAME,
+            session=session,
+            single_flight=AsyncSingleFlight(),
+        )
+        groups = await asyncio.gather(*(client.list_project_groups() for _ in range(5)))
+        self.assertEqual(groups, [["Group"]] * 5)
+        self.assertEqual(len(session.calls), 1)
+        # Each caller decodes its own copy.
+        groups[0].append("Other")
+        self.assertEqual(groups[1], ["Group"])
+        # POST requests are never shared.
+        await asyncio.gather(*(client.run_job(DUMMY_JOB_NAME) for _ in range(2)))
+        self.assertEqual(len(session.calls), 3)
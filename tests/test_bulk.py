@@ -0,0 +1,246 @@
+import threading
+import time
+from unittest import TestCase
+from unittest.mock import patch
+
+from requests.exceptions import HTTPError
+
+from pymatillion.bulk import JobSpec, as_job_spec, plan_deletions
+from pymatillion.constants import (
+    DELETE_DELETED,
+    DELETE_FAILED,
+    DELETE_PLANNED,
+    DELETE_SKIPPED,
+)
+from pymatillion.matillion import MatillionClient
+
+DUMMY_URL = "https://fakematillioninstance.com"
+DUMMY_USERNAME = "fake_user"
+DUMMY_PASSWORD = "fake_pass"
+DUMMY_PROJECT_GROUP_NAME = "Sample_Project_Group"
+DUMMY_PROJECT_NAME = "Sample_Project_1"
+
+
+class TestRunJobs(TestCase):
+    client: MatillionClient
+
+    def setUp(self):
+        self.client = MatillionClient(
+            DUMMY_URL,
+            DUMMY_USERNAME,
+            DUMMY_PASSWORD,
+            DUMMY_PROJECT_GROUP_NAME,
+            DUMMY_PROJECT_NAME,
+        )
+
+    def test_as_job_spec(self):
+        expected = JobSpec("Job_1", {"a": 1}, {}, "Project_2", "v2")
+        self.assertEqual(as_job_spec(expected), expected)
+        self.assertEqual(
+            as_job_spec(("Job_1", {"a": 1}, {}, "Project_2", "v2")), expected
+        )
+        self.assertEqual(
+            as_job_spec(
+                {
+                    "job_name": "Job_1",
+                    "job_variables": {"a": 1},
+                    "project_name": "Project_2",
+                    "version": "v2",
+                }
+            ),
+            expected,
+        )
+        self.assertEqual(as_job_spec(("Job_1",)), JobSpec("Job_1"))
+
+    @patch("pymatillion.matillion.MatillionClient.run_job")
+    def test_run_jobs(self, mock_run_job):
+        def run_job(job_name, *args):
+            if job_name == "Job_2":
+                raise HTTPError("Internal Server Error")
+            return {"success": True, "id": int(job_name.split("_")[1])}
+
+        mock_run_job.side_effect = run_job
+        specs = [(f"Job_{i}",) for i in range(5)]
+
+        results = sorted(self.client.run_jobs(specs), key=lambda r: r.index)
+
+        self.assertEqual(len(results), 5)
+        self.assertEqual(mock_run_job.call_count, 5)
+        for i, result in enumerate(results):
+            self.assertEqual(result.spec.job_name, f"Job_{i}")
+            if i == 2:
+                self.assertFalse(result.ok)
+                self.assertIsInstance(result.error, HTTPError)
+                self.assertIsNone(result.response)
+            else:
+                self.assertTrue(result.ok)
+                self.assertEqual(result.response["id"], i)
+
+    @patch("pymatillion.matillion.MatillionClient.run_job")
+    def test_run_jobs_streams_in_completion_order(self, mock_run_job):
+        mock_run_job.side_effect = lambda job_name, *args: time.sleep(
+            0.05 if job_name == "Slow" else 0
+        )
+        results = list(self.client.run_jobs([("Slow",), ("Fast",)]))
+        self.assertEqual([r.spec.job_name for r in results], ["Fast", "Slow"])
+
+    @patch("pymatillion.matillion.MatillionClient.run_job")
+    def test_run_jobs_max_concurrency(self, mock_run_job):
+        lock = threading.Lock()
+        in_flight = [0, 0]
+
+        def run_job(*args):
+            with lock:
+                in_flight[0] += 1
+                in_flight[1] = max(in_flight)
+            time.sleep(0.01)
+            with lock:
+                in_flight[0] -= 1
+
+        mock_run_job.side_effect = run_job
+        results = list(
+            self.client.run_jobs([(f"Job_{i}",) for i in range(12)], max_concurrency=3)
+        )
+        self.assertEqual(len(results), 12)
+        self.assertLessEqual(in_flight[1], 3)
+
+    def test_run_jobs_without_specs(self):
+        self.assertListEqual(list(self.client.run_jobs([])), [])
+
+
+class TestBatchDelete(TestCase):
+    client: MatillionClient
+
+    def setUp(self):
+        self.client = MatillionClient(
+            DUMMY_URL,
+            DUMMY_USERNAME,
+            DUMMY_PASSWORD,
+            DUMMY_PROJECT_GROUP_NAME,
+            DUMMY_PROJECT_NAME,
+        )
+
+    def test_plan_deletions(self):
+        listing = ["default", "feature-1", "feature-2", "release-1"]
+        self.assertEqual(
+            plan_deletions(listing, ["feature-2", "feature-9"]),
+            (["feature-2"], ["feature-9"], []),
+        )
+        self.assertEqual(
+            plan_deletions(
+                listing,
+                match=lambda name: not name.startswith("release"),
+                protected=["default"],
+            ),
+            (["feature-1", "feature-2"], [], ["default"]),
+        )
+        self.assertEqual(
+            plan_deletions(listing, ["feature-1", "feature-2"], lambda n: "2" in n),
+            (["feature-2"], [], []),
+        )
+        with self.assertRaises(ValueError):
+            plan_deletions(listing)
+
+    def test_plan_deletions_protected(self):
+        listing = ["default", "main", "feature-1"]
+        protected = ["default", "main"]
+        self.assertEqual(
+            plan_deletions(listing, ["main", "feature-1"], protected=protected),
+            (["feature-1"], [], ["main"]),
+        )
+        selected = []
+
+        def match(name):
+            selected.append(name)
+            return name != "main"
+
+        self.assertEqual(
+            plan_deletions(listing, match=match, protected=protected),
+            (["feature-1"], [], ["default"]),
+        )
+        # Each listed name is matched once.
+        self.assertEqual(selected, listing)
+
+    @patch("pymatillion.matillion.MatillionClient.delete_job")
+    @patch("pymatillion.matillion.MatillionClient.list_jobs")
+    def test_delete_jobs_dry_run(self, mock_list_jobs, mock_delete_job):
+        mock_list_jobs.return_value = ["Job_1", "Job_2", "tmp_1", "tmp_2"]
+        report = self.client.delete_jobs(
+            match=lambda name: name.startswith("tmp_"), dry_run=True
+        )
+        self.assertTrue(report.dry_run)
+        self.assertEqual(report.planned, ["tmp_1", "tmp_2"])
+        self.assertEqual(
+            [result.status for result in report.results], [DELETE_PLANNED] * 2
+        )
+        mock_delete_job.assert_not_called()
+
+    @patch("pymatillion.matillion.MatillionClient.delete_job")
+    @patch("pymatillion.matillion.MatillionClient.list_jobs")
+    def test_delete_jobs(self, mock_list_jobs, mock_delete_job):
+        def delete_job(job_name, project_name, version):
+            if job_name == "Job_2":
+                raise HTTPError("Internal Server Error")
+            if job_name == "Job_3":
+                return {"success": False, "msg": "Job is running"}
+            return {"success": True, "msg": "Successfully deleted", "id": 1}
+
+        mock_list_jobs.return_value = ["Job_1", "Job_2", "Job_3", "Job_4"]
+        mock_delete_job.side_effect = delete_job
+        report = self.client.delete_jobs(
+            ["Job_1", "Job_2", "Job_3", "Job_9"], version="v2", max_concurrency=2
+        )
+
+        mock_list_jobs.assert_called_once_with(DUMMY_PROJECT_NAME, "v2")
+        self.assertFalse(report.ok)
+        self.assertEqual(report.deleted, ["Job_1"])
+        self.assertEqual(report.failed, ["Job_2", "Job_3"])
+        self.assertEqual(report.missing, ["Job_9"])
+        self.assertIsInstance(report.results[1].error, HTTPError)
+        self.assertEqual(report.results[2].response["msg"], "Job is running")
+        mock_delete_job.assert_any_call("Job_1", DUMMY_PROJECT_NAME, "v2")
+
+    @patch("pymatillion.matillion.MatillionClient.delete_project")
+    @patch("pymatillion.matillion.MatillionClient.list_versions")
+    def test_delete_project_versions(self, mock_list_versions, mock_delete_project):
+        mock_list_versions.return_value = ["default", "feature-1", "feature-2"]
+        mock_delete_project.return_value = {"success": True}
+        report = self.client.delete_project_versions(match=lambda name: True)
+
+        self.assertTrue(report.ok)
+        self.assertEqual(
+            [(r.name, r.status) for r in report.results],
+            [
+                ("feature-1", DELETE_DELETED),
+                ("feature-2", DELETE_DELETED),
+                ("default", DELETE_SKIPPED),
+            ],
+        )
+        mock_delete_project.assert_any_call(DUMMY_PROJECT_NAME, "feature-1")
+        self.assertEqual(mock_delete_project.call_count, 2)
+
+    @patch("pymatillion.matillion.MatillionClient.delete_project")
+    @patch("pymatillion.matillion.MatillionClient.list_versions")
+    def test_delete_default_version_is_skipped(
+        self, mock_list_versions, mock_delete_project
+    ):
+        mock_list_versions.return_value = ["default", "feature-1"]
+        report = self.client.delete_project_versions(
+            iter(["default", "feature-1"]), dry_run=True
+        )
+        self.assertTrue(report.ok)
+        self.assertEqual(report.planned, ["feature-1"])
+        self.assertEqual(report.skipped, ["default"])
+        self.assertIn("default version", report.results[-1].reason)
+        mock_delete_project.assert_not_called()
+
+    @patch("pymatillion.matillion.MatillionClient.delete_project")
+    @patch("pymatillion.matillion.MatillionClient.list_versions")
+    def test_delete_project_versions_failure(
+        self, mock_list_versions, mock_delete_project
+    ):
+        mock_list_versions.return_value = ["default", "feature-1"]
+        mock_delete_project.side_effect = HTTPError("Forbidden")
+        report = self.client.delete_project_versions(["feature-1"])
+        self.assertEqual(report.results[0].status, DELETE_FAILED)
+        self.assertFalse(report.ok)
@@ -0,0 +1,292 @@
+import multiprocessing
+import tempfile
+import threading
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from pymatillion.cache import MetadataCache, PersistentCache, Validators
+from pymatillion.matillion import MatillionClient
+
+DUMMY_URL = "https://fakematillioninstance.com"
+DUMMY_USERNAME = "fake_user"
+DUMMY_PASSWORD = "fake_pass"
+DUMMY_PROJECT_GROUP_NAME = "Sample_Project_Group"
+DUMMY_PROJECT_NAME = "Sample_Project_1"
+DUMMY_JOB_NAME = "Sample_Job_1"
+
+
+class TestMetadataCache(TestCase):
+    def test_get_and_set(self):
+        cache = MetadataCache()
+        self.assertIsNone(cache.get("a"))
+        cache.set("a", [1])
+        self.assertListEqual(cache.get("a"), [1])
+        self.assertDictEqual(cache.stats, {"hits": 1, "misses": 1, "size": 1})
+
+    @patch("pymatillion.cache.time.monotonic")
+    def test_ttl(self, mock_monotonic):
+        mock_monotonic.return_value = 100
+        cache = MetadataCache(ttl=10)
+        cache.set("a", 1)
+        mock_monotonic.return_value = 109
+        self.assertEqual(cache.get("a"), 1)
+        mock_monotonic.return_value = 110
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(len(cache), 0)
+
+    def test_lru_eviction(self):
+        cache = MetadataCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), 3)
+
+    def test_invalidate(self):
+        cache = MetadataCache()
+        cache.set(("url", "group", None, None, "project"), 1)
+        cache.set(("url", "group", "project", "default", "job"), 2)
+        cache.set(("url", "group", "project", "v2", "job"), 3)
+        cache.set(("url", None, None, None, "group"), 4)
+        self.assertEqual(cache.invalidate("url", "group", "project", "v2"), 1)
+        self.assertEqual(cache.invalidate("url", "group"), 2)
+        self.assertEqual(len(cache), 1)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+
+class TestClientCache(TestCase):
+    client: MatillionClient
+
+    def setUp(self):
+        self.cache = MetadataCache()
+        self.client = MatillionClient(
+            DUMMY_URL,
+            DUMMY_USERNAME,
+            DUMMY_PASSWORD,
+            DUMMY_PROJECT_GROUP_NAME,
+            DUMMY_PROJECT_NAME,
+            cache=self.cache,
+        )
+
+    @patch("pymatillion.matillion.requests.Session.get")
+    def test_listings_are_cached(self, mock_get):
+        mock_get.return_value.json.return_value = ["Sample_Job_1"]
+        for _ in range(3):
+            self.assertListEqual(self.client.list_jobs(), ["Sample_Job_1"])
+            self.client.list_projects()
+            self.client.list_project_groups()
+        self.assertEqual(mock_get.call_count, 3)
+        self.assertDictEqual(self.cache.stats, {"hits": 6, "misses": 3, "size": 3})
+
+    @patch("pymatillion.matillion.requests.Session.get")
+    def test_cached_listing_is_a_copy(self, mock_get):
+        mock_get.return_value.json.return_value = ["Sample_Job_1"]
+        self.client.list_jobs().append("Sample_Job_2")
+        self.assertListEqual(self.client.list_jobs(), ["Sample_Job_1"])
+
+    @patch("pymatillion.matillion.requests.Session.get")
+    def test_listings_are_keyed_by_version(self, mock_get):
+        mock_get.return_value.json.return_value = []
+        self.client.list_jobs()
+        self.client.list_jobs(version="v2")
+        self.client.list_jobs(project_name="Sample_Project_2")
+        self.assertEqual(mock_get.call_count, 3)
+
+    @patch("pymatillion.matillion.requests.Session.post")
+    @patch("pymatillion.matillion.requests.Session.get")
+    def test_delete_job_invalidates_jobs(self, mock_get, mock_post):
+        mock_get.return_value.json.return_value = []
+        self.client.list_jobs()
+        self.client.list_jobs(version="v2")
+        self.client.list_projects()
+        self.client.delete_job(DUMMY_JOB_NAME)
+        self.client.list_jobs()
+        self.client.list_jobs(version="v2")
+        self.client.list_projects()
+        self.assertEqual(mock_get.call_count, 4)
+
+    @patch("pymatillion.matillion.requests.Session.post")
+    @patch("pymatillion.matillion.requests.Session.get")
+    def test_delete_project_invalidates_group(self, mock_get, mock_post):
+        mock_get.return_value.json.return_value = []
+        self.client.list_jobs()
+        self.client.list_projects()
+        self.client.list_project_groups()
+        self.client.delete_project(DUMMY_PROJECT_NAME)
+        self.client.list_jobs()
+        self.client.list_projects()
+        self.client.list_project_groups()
+        self.assertEqual(mock_get.call_count, 5)
+
+
+def write_entries(directory, worker):
+    cache = PersistentCache(directory)
+    for i in range(50):
+        cache.set((DUMMY_URL, worker, i), [f"Job_{i}"])
+        cache.get((DUMMY_URL, worker, i))
+    cache.invalidate(DUMMY_URL, worker, 0)
+
+
+class TestPersistentCache(TestCase):
+    def setUp(self):
+        temporary_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+        self.directory = temporary_directory.name
+
+    def test_get_and_set(self):
+        cache = PersistentCache(self.directory)
+        self.addCleanup(cache.close)
+        key = (DUMMY_URL, None, None, None, "group")
+        self.assertIsNone(cache.get(key))
+        cache.set(key, ["Group_1"])
+        self.assertListEqual(cache.get(key), ["Group_1"])
+        self.assertDictEqual(
+            cache.stats, {"hits": 1, "misses": 1, "revalidations": 0, "size": 1}
+        )
+
+    def test_shared_across_instances(self):
+        PersistentCache(self.directory).set(("a",), {"b": 1})
+        self.assertDictEqual(PersistentCache(self.directory).get(("a",)), {"b": 1})
+
+    @patch("pymatillion.cache.time.time")
+    def test_ttl(self, mock_time):
+        mock_time.return_value = 100
+        cache = PersistentCache(self.directory, ttl=10)
+        cache.set(("a",), 1)
+        mock_time.return_value = 109
+        self.assertEqual(cache.get(("a",)), 1)
+        mock_time.return_value = 110
+        self.assertIsNone(cache.get(("a",)))
+
+    @patch("pymatillion.cache.time.time")
+    def test_revalidate(self, mock_time):
+        mock_time.return_value = 100
+        cache = PersistentCache(self.directory, ttl=10)
+        fetch = MagicMock(return_value=([1], Validators(etag='"v1"')))
+        self.assertEqual(cache.get_or_revalidate(("a",), fetch), [1])
+        fetch.assert_called_once_with(None)
+
+        self.assertEqual(cache.get_or_revalidate(("a",), fetch), [1])
+        self.assertEqual(fetch.call_count, 1)
+
+        # Expired: not modified, so the entry is kept for another TTL.
+        mock_time.return_value = 115
+        fetch.return_value = None
+        self.assertEqual(cache.get_or_revalidate(("a",), fetch), [1])
+        fetch.assert_called_with(Validators(etag='"v1"'))
+        mock_time.return_value = 124
+        self.assertEqual(cache.get_or_revalidate(("a",), fetch), [1])
+        self.assertEqual(fetch.call_count, 2)
+
+        # Expired and modified.
+        mock_time.return_value = 130
+        fetch.return_value = ([2], None)
+        self.assertEqual(cache.get_or_revalidate(("a",), fetch), [2])
+        self.assertEqual(cache.stats["revalidations"], 1)
+
+    def test_revalidate_without_entry(self):
+        cache = PersistentCache(self.directory)
+        with self.assertRaises(ValueError):
+            cache.get_or_revalidate(("a",), lambda validators: None)
+        self.assertEqual(len(cache), 0)
+
+    def test_counters_are_thread_safe(self):
+        cache = PersistentCache(self.directory)
+        cache.set(("a",), [1])
+
+        def lookup():
+            for _ in range(200):
+                cache.get(("a",))
+                cache.get(("b",))
+
+        threads = [threading.Thread(target=lookup) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual((cache.hits, cache.misses), (1600, 1600))
+
+    def test_invalidate(self):
+        cache = PersistentCache(self.directory)
+        cache.set((DUMMY_URL, "Group_1", "Project_1", "default", "job"), [1])
+        cache.set((DUMMY_URL, "Group_1", "Project_10", "default", "job"), [2])
+        cache.set((DUMMY_URL, "Group_2", None, None, "project"), [3])
+        self.assertEqual(cache.invalidate(DUMMY_URL, "Group_1", "Project_1"), 1)
+        self.assertEqual(len(cache), 2)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+    def test_maxsize(self):
+        cache = PersistentCache(self.directory, maxsize=3)
+        for i in range(5):
+            cache.set((i,), i)
+        self.assertEqual(len(cache), 3)
+        self.assertEqual(cache.get((4,)), 4)
+        self.assertIsNone(cache.get((0,)))
+
+    def test_concurrent_processes(self):
+        PersistentCache(self.directory)
+        context = multiprocessing.get_context("spawn")
+        processes = [
+            context.Process(target=write_entries, args=(self.directory, worker))
+            for worker in range(4)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join(30)
+            self.assertEqual(process.exitcode, 0)
+        self.assertEqual(len(PersistentCache(self.directory)), 4 * 49)
+
+
+class TestClientPersistentCache(TestCase):
+    def setUp(self):
+        temporary_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+        self.directory = temporary_directory.name
+
+    def client(self, **kwargs):
+        return MatillionClient(
+            DUMMY_URL,
+            DUMMY_USERNAME,
+            DUMMY_PASSWORD,
+            DUMMY_PROJECT_GROUP_NAME,
+            DUMMY_PROJECT_NAME,
+            cache=PersistentCache(self.directory, **kwargs),
+        )
+
+    @patch("pymatillion.matillion.requests.Session.get")
+    def test_listings_survive_the_client(self, mock_get):
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.headers = {}
+        mock_get.return_value.json.return_value = [DUMMY_JOB_NAME]
+        self.assertListEqual(self.client().list_jobs(), [DUMMY_JOB_NAME])
+        self.assertListEqual(self.client().list_jobs(), [DUMMY_JOB_NAME])
+        mock_get.assert_called_once()
+
+    @patch("pymatillion.matillion.requests.Session.get")
+    def test_conditional_revalidation(self, mock_get):
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.headers = {
+            "ETag": '"abc"',
+            "Last-Modified": "Wed, 21 Oct 2026 07:28:00 GMT",
+        }
+        mock_get.return_value.json.return_value = [DUMMY_JOB_NAME]
+        client = self.client(ttl=0)
+        client.list_jobs()
+        self.assertIsNone(mock_get.call_args.kwargs["headers"])
+
+        mock_get.return_value.status_code = 304
+        mock_get.return_value.json.side_effect = ValueError("No content")
+        self.assertListEqual(client.list_jobs(), [DUMMY_JOB_NAME])
+        self.assertDictEqual(
+            mock_get.call_args.kwargs["headers"],
+            {
+                "If-None-Match": '"abc"',
+                "If-Modified-Since": "Wed, 21 Oct 2026 07:28:00 GMT",
+            },
+        )
+        self.assertEqual(client.cache.stats["revalidations"], 1)
@@ -0,0 +1,260 @@
+import io
+import json
+import subprocess
+import sys
+import tempfile
+import threading
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import patch
+
+from requests.exceptions import ConnectionError, HTTPError
+
+from pymatillion.cli import main
+
+DUMMY_URL = "https://fakematillioninstance.com"
+DUMMY_USERNAME = "fake_user"
+DUMMY_PASSWORD = "fake_pass"
+DUMMY_PROJECT_GROUP_NAME = "Sample_Project_Group"
+DUMMY_PROJECT_NAME = "Sample_Project_1"
+
+CONNECTION = [
+    "--url",
+    DUMMY_URL,
+    "--username",
+    DUMMY_USERNAME,
+    "--password",
+    DUMMY_PASSWORD,
+    "--group",
+    DUMMY_PROJECT_GROUP_NAME,
+    "--project",
+    DUMMY_PROJECT_NAME,
+]
+
+
+def run_job(job_name, *args):
+    if job_name == "Broken":
+        raise HTTPError("Internal Server Error")
+    return {"success": True, "id": int(job_name.split("_")[1])}
+
+
+def get_task_details(task_id, project_name=None):
+    state = "FAILED" if task_id == 3 else "SUCCESS"
+    return {"id": task_id, "state": state, "tasks": [{"taskID": 1}]}
+
+
+class TestCli(TestCase):
+    def invoke(self, *args, stdin=""):
+        stdout = io.StringIO()
+        with patch("sys.stdin", io.StringIO(stdin)), redirect_stdout(stdout):
+            code = main([*CONNECTION, *args])
+        return code, [json.loads(line) for line in stdout.getvalue().splitlines()]
+
+    @patch("pymatillion.matillion.MatillionClient.run_job", side_effect=run_job)
+    def test_run(self, mock_run_job):
+        lines = '{"job_name": "Job_1", "job_variables": {"a": "1"}}\n\n"Job_2"\nJob_4\n'
+        code, records = self.invoke("run", stdin=lines)
+        self.assertEqual(code, 0)
+        self.assertEqual(
+            sorted((r["index"], r["job_name"], r["task_id"]) for r in records),
+            [(0, "Job_1", 1), (1, "Job_2", 2), (2, "Job_4", 4)],
+        )
+        mock_run_job.assert_any_call("Job_1", {"a": "1"}, {}, None, "default")
+
+    @patch("pymatillion.matillion.MatillionClient.run_job", side_effect=run_job)
+    def test_run_from_file(self, mock_run_job):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory, "jobs.jsonl")
+            path.write_text('["Job_1", {}, {}, "Project_2"]\n"Broken"\n')
+            code, records = self.invoke("--concurrency", "2", "run", str(path))
+        self.assertEqual(code, 1)
+        records = {r["job_name"]: r for r in records}
+        self.assertEqual(records["Job_1"]["project_name"], "Project_2")
+        self.assertFalse(records["Broken"]["ok"])
+        self.assertIn("Internal Server Error", records["Broken"]["error"])
+
+    @patch("pymatillion.matillion.MatillionClient.run_job", side_effect=run_job)
+    def test_run_reports_invalid_specs(self, mock_run_job):
+        lines = '{"job": "x"}\nJob_1\n["Job_2", {}, {}, null, "v", "extra"]\n7\nJob_3\n'
+        code, records = self.invoke("run", stdin=lines)
+        self.assertEqual(code, 1)
+        records = sorted(records, key=lambda r: r["index"])
+        self.assertEqual([r["index"] for r in records], [0, 1, 2, 3, 4])
+        self.assertEqual([r["ok"] for r in records], [False, True, False, False, True])
+        self.assertIn("unexpected keyword argument 'job'", records[0]["error"])
+        self.assertEqual(records[4]["task_id"], 3)
+        self.assertEqual(mock_run_job.call_count, 2)
+
+    @patch(
+        "pymatillion.matillion.MatillionClient.get_task_details",
+        side_effect=get_task_details,
+    )
+    @patch("pymatillion.matillion.MatillionClient.run_job", side_effect=run_job)
+    def test_run_and_wait(self, mock_run_job, mock_get_task_details):
+        code, records = self.invoke("run", "--wait", stdin="Job_1\nJob_3\n")
+        self.assertEqual(code, 1)
+        self.assertEqual(
+            sorted((r["task_id"], r["state"]) for r in records),
+            [(1, "SUCCESS"), (3, "FAILED")],
+        )
+        self.assertNotIn("tasks", records[0]["task"])
+
+    @patch("pymatillion.matillion.MatillionClient.run_job", side_effect=run_job)
+    def test_run_waits_while_launching(self, mock_run_job):
+        polled = threading.Event()
+
+        def run_job_after_poll(job_name, *args):
+            # The second launch only completes once the first task was polled.
+            if job_name == "Job_2":
+                self.assertTrue(polled.wait(timeout=5))
+            return run_job(job_name, *args)
+
+        def get_task_details(task_id, project_name=None):
+            polled.set()
+            return {"id": task_id, "state": "SUCCESS"}
+
+        mock_run_job.side_effect = run_job_after_poll
+        with patch(
+            "pymatillion.matillion.MatillionClient.get_task_details",
+            side_effect=get_task_details,
+        ):
+            code, records = self.invoke(
+                "--concurrency", "2", "run", "--wait", stdin="Job_1\nJob_2\n"
+            )
+        self.assertEqual(code, 0)
+        self.assertEqual(
+            [(r["index"], r["job_name"], r["task_id"], r["state"]) for r in records],
+            [(0, "Job_1", 1, "SUCCESS"), (1, "Job_2", 2, "SUCCESS")],
+        )
+
+    @patch(
+        "pymatillion.matillion.MatillionClient.get_task_details",
+        side_effect=get_task_details,
+    )
+    def test_wait_reads_run_output(self, mock_get_task_details):
+        lines = (
+            '{"job_name": "Job_1", "ok": true, "task_id": 1}\n'
+            '{"job_name": "Broken", "ok": false, "error": "Not found"}\n'
+            "2\n"
+        )
+        code, records = self.invoke("wait", "--details", stdin=lines)
+        self.assertEqual(code, 0)
+        records = sorted(records, key=lambda r: r["task_id"])
+        self.assertEqual([r["task_id"] for r in records], [1, 2])
+        self.assertEqual(records[0]["job_name"], "Job_1")
+        self.assertEqual(records[0]["task"]["tasks"], [{"taskID": 1}])
+
+    @patch("pymatillion.matillion.MatillionClient.run_job", side_effect=run_job)
+    def test_run_and_wait_projects_concurrently(self, mock_run_job):
+        # Both projects must be polled at once for the barrier to open.
+        barrier = threading.Barrier(2, timeout=5)
+
+        def get_task_details(task_id, project_name=None):
+            barrier.wait()
+            return {"id": task_id, "state": "SUCCESS"}
+
+        lines = '["Job_1", {}, {}, "Project_1"]\n["Job_2", {}, {}, "Project_2"]\n'
+        with patch(
+            "pymatillion.matillion.MatillionClient.get_task_details",
+            side_effect=get_task_details,
+        ):
+            code, records = self.invoke("run", "--wait", stdin=lines)
+        self.assertEqual(code, 0)
+        self.assertEqual(sorted(r["task_id"] for r in records), [1, 2])
+
+    @patch(
+        "pymatillion.matillion.MatillionClient.get_task_details",
+        side_effect=get_task_details,
+    )
+    def test_wait_reports_invalid_tasks(self, mock_get_task_details):
+        lines = '{"job_name": "Job_1", "ok": true}\n[1]\nabc\n2\n'
+        code, records = self.invoke("wait", stdin=lines)
+        self.assertEqual(code, 1)
+        self.assertEqual(
+            [(r["ok"], "error" in r) for r in records],
+            [(False, True), (False, True), (False, True), (True, False)],
+        )
+        self.assertEqual(records[-1]["task_id"], 2)
+
+    @patch("pymatillion.matillion.MatillionClient.list_project_groups")
+    def test_request_errors(self, mock_list_project_groups):
+        mock_list_project_groups.side_effect = ConnectionError("Connection refused")
+        stderr = io.StringIO()
+        with patch("sys.stderr", stderr):
+            code, records = self.invoke("list", "groups")
+        self.assertEqual(code, 1)
+        self.assertEqual(records, [])
+        self.assertIn("Connection refused", stderr.getvalue())
+
+    @patch("pymatillion.matillion.MatillionClient.iter_jobs")
+    def test_list(self, mock_iter_jobs):
+        mock_iter_jobs.return_value = iter(["Job_1", "Job_2"])
+        code, records = self.invoke("list", "jobs", "--version", "v2")
+        self.assertEqual(code, 0)
+        self.assertEqual(records, [{"name": "Job_1"}, {"name": "Job_2"}])
+        mock_iter_jobs.assert_called_once_with(version="v2")
+
+    @patch("pymatillion.matillion.MatillionClient.list_jobs")
+    def test_delete_dry_run(self, mock_list_jobs):
+        mock_list_jobs.return_value = ["tmp_1", "tmp_2", "Job_1"]
+        code, records = self.invoke("delete", "jobs", "--match", "tmp_*", "--dry-run")
+        self.assertEqual(code, 0)
+        self.assertEqual(
+            records,
+            [
+                {"name": "tmp_1", "ok": True, "status": "PLANNED"},
+                {"name": "tmp_2", "ok": True, "status": "PLANNED"},
+            ],
+        )
+
+    @patch("pymatillion.matillion.MatillionClient.delete_job")
+    @patch("pymatillion.matillion.MatillionClient.list_jobs")
+    def test_delete_from_stdin(self, mock_list_jobs, mock_delete_job):
+        mock_list_jobs.return_value = ["Job_1", "Job_2"]
+        mock_delete_job.return_value = {"success": True}
+        code, records = self.invoke("delete", "jobs", stdin='"Job_2"\nJob_9\n')
+        self.assertEqual(code, 0)
+        self.assertEqual(
+            [(r["name"], r["status"]) for r in records],
+            [("Job_2", "DELETED"), ("Job_9", "MISSING")],
+        )
+
+    @patch("pymatillion.matillion.MatillionClient.delete_job")
+    @patch("pymatillion.matillion.MatillionClient.list_jobs")
+    def test_delete_reports_invalid_names(self, mock_list_jobs, mock_delete_job):
+        mock_list_jobs.return_value = ["Job_1"]
+        mock_delete_job.return_value = {"success": True}
+        code, records = self.invoke("delete", "jobs", stdin='{"id": 1}\nJob_1\n')
+        self.assertEqual(code, 1)
+        self.assertEqual(
+            [(r["ok"], r.get("status")) for r in records],
+            [(False, None), (True, "DELETED")],
+        )
+
+    def test_missing_connection_settings(self):
+        stderr = io.StringIO()
+        with patch("sys.stderr", stderr):
+            self.assertEqual(main(["--url", DUMMY_URL, "list", "groups"]), 1)
+        self.assertIn("Undefined attributes", stderr.getvalue())
+
+    def test_startup_does_not_import_client(self):
+        code = (
+            "import sys, pymatillion.cli;"
+            "print(any(m in sys.modules for m in ('requests', 'pymatillion.matillion')))"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        self.assertEqual(output.stdout.strip(), "False")
+
+    def test_client_import_defers_feature_modules(self):
+        code = (
+            "import sys, pymatillion.matillion;"
+            "print(sorted(m for m in ('asyncio', 'gzip', 'sqlite3', 'pymatillion.bulk')"
+            " if m in sys.modules))"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        self.assertEqual(output.stdout.strip(), "[]")
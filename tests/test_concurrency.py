@@ -0,0 +1,137 @@
+import threading
+import time
+from unittest import TestCase
+from unittest.mock import patch
+
+from requests.exceptions import ConnectionError
+
+from pymatillion.concurrency import AdaptiveLimiter
+from pymatillion.matillion import MatillionClient
+from tests.helpers import FakeClock
+
+DUMMY_URL = "https://fakematillioninstance.com"
+DUMMY_USERNAME = "fake_user"
+DUMMY_PASSWORD = "fake_pass"
+DUMMY_PROJECT_GROUP_NAME = "Sample_Project_Group"
+DUMMY_PROJECT_NAME = "Sample_Project_1"
+
+
+def run_round(limiter, clock, latency, failed=False):
+    """Fill every slot, then complete the requests after `latency` seconds."""
+    started = [limiter.acquire() for _ in range(limiter.limit)]
+    clock.now += latency
+    for started_at in started:
+        limiter.release(started_at, failed=failed)
+
+
+@patch("pymatillion.concurrency.time", new_callable=FakeClock)
+class TestAdaptiveLimiter(TestCase):
+    def test_additive_increase(self, clock):
+        limiter = AdaptiveLimiter(initial=2, maximum=4)
+        # Each round adds a little under one.
+        run_round(limiter, clock, 0.1)
+        self.assertEqual(limiter.limit, 2)
+        run_round(limiter, clock, 0.1)
+        self.assertEqual(limiter.limit, 3)
+        for _ in range(5):
+            run_round(limiter, clock, 0.1)
+        self.assertEqual(limiter.limit, 4)
+        self.assertEqual([limit for _, limit in limiter.history], [2, 3, 4])
+
+    def test_no_increase_below_limit(self, clock):
+        limiter = AdaptiveLimiter(initial=4)
+        for _ in range(20):
+            started_at = limiter.acquire()
+            clock.now += 0.1
+            limiter.release(started_at)
+        self.assertEqual(limiter.limit, 4)
+        self.assertEqual(limiter.increases, 0)
+
+    def test_failures_decrease_once_per_round(self, clock):
+        limiter = AdaptiveLimiter(initial=8)
+        run_round(limiter, clock, 0.1, failed=True)
+        self.assertEqual(limiter.limit, 4)
+        self.assertEqual(limiter.decreases, 1)
+        run_round(limiter, clock, 0.1, failed=True)
+        self.assertEqual(limiter.limit, 2)
+        for _ in range(3):
+            run_round(limiter, clock, 0.1, failed=True)
+        self.assertEqual(limiter.limit, 1)
+
+    def test_latency_increase(self, clock):
+        limiter = AdaptiveLimiter(initial=8, latency_tolerance=2)
+        run_round(limiter, clock, 0.1)
+        self.assertEqual(limiter.limit, 8)
+        run_round(limiter, clock, 1.0)
+        self.assertEqual(limiter.limit, 4)
+        self.assertLess(limiter.stats["baseline_latency"], 0.2)
+        self.assertGreater(limiter.stats["latency"], 0.2)
+
+    def test_acquire_timeout(self, clock):
+        limiter = AdaptiveLimiter(initial=1)
+        self.assertIsNotNone(limiter.acquire())
+        self.assertIsNone(limiter.acquire(timeout=0.01))
+        self.assertEqual(limiter.in_flight, 1)
+
+    def test_slot(self, clock):
+        limiter = AdaptiveLimiter(initial=2)
+        with self.assertRaises(ConnectionError):
+            with limiter.slot():
+                raise ConnectionError("Connection refused")
+        self.assertEqual(limiter.limit, 1)
+        self.assertEqual(limiter.in_flight, 0)
+
+    def test_invalid_arguments(self, clock):
+        with self.assertRaises(ValueError):
+            AdaptiveLimiter(initial=8, maximum=4)
+        with self.assertRaises(ValueError):
+            AdaptiveLimiter(backoff_ratio=1)
+        with self.assertRaises(ValueError):
+            AdaptiveLimiter(latency_tolerance=0.5)
+
+
+class TestClientConcurrencyLimiter(TestCase):
+    def setUp(self):
+        self.limiter = AdaptiveLimiter(initial=2, maximum=4)
+        self.client = MatillionClient(
+            DUMMY_URL,
+            DUMMY_USERNAME,
+            DUMMY_PASSWORD,
+            DUMMY_PROJECT_GROUP_NAME,
+            DUMMY_PROJECT_NAME,
+            concurrency_limiter=self.limiter,
+        )
+
+    @patch("pymatillion.matillion.requests.Session.post")
+    def test_bulk_runs_respect_limit(self, mock_post):
+        lock = threading.Lock()
+        in_flight = []
+        peak = [0]
+
+        def post(url, **kwargs):
+            with lock:
+                in_flight.append(url)
+                peak[0] = max(peak[0], len(in_flight))
+            time.sleep(0.01)
+            with lock:
+                in_flight.remove(url)
+            return mock_post.return_value
+
+        mock_post.side_effect = post
+        mock_post.return_value.status_code = 200
+        mock_post.return_value.json.return_value = {"success": True, "id": 1}
+        results = list(
+            self.client.run_jobs([(f"Job_{i}",) for i in range(12)], max_concurrency=8)
+        )
+        self.assertTrue(all(result.ok for result in results))
+        self.assertLessEqual(peak[0], 4)
+        self.assertEqual(self.limiter.in_flight, 0)
+
+    @patch("pymatillion.matillion.requests.Session.get")
+    def test_server_errors_decrease_limit(self, mock_get):
+        mock_get.return_value.status_code = 503
+        mock_get.return_value.raise_for_status.side_effect = Exception("503")
+        with self.assertRaises(Exception):
+            self.client.list_project_groups()
+        self.assertEqual(self.limiter.limit, 1)
+        self.assertEqual(self.limiter.in_flight, 0)
@@ -0,0 +1,174 @@
+import threading
+import time
+from unittest import TestCase
+from unittest.mock import patch
+
+from pymatillion.backoff import Backoff
+from pymatillion.constants import (
+    DAG_CONTINUE,
+    NODE_FAILED,
+    NODE_RESUMED,
+    NODE_SKIPPED,
+    NODE_SUCCEEDED,
+)
+from pymatillion.dag import DagNode, JobDag, NodeResult, critical_path
+from pymatillion.matillion import MatillionClient
+
+DUMMY_URL = "https://fakematillioninstance.com"
+DUMMY_USERNAME = "fake_user"
+DUMMY_PASSWORD = "fake_pass"
+DUMMY_PROJECT_GROUP_NAME = "Sample_Project_Group"
+DUMMY_PROJECT_NAME = "Sample_Project_1"
+
+NO_BACKOFF = Backoff(initial=0, maximum=0, jitter=0)
+
+# A -> B -> (C, D), with E independent.
+DIAMOND = [
+    DagNode("A"),
+    DagNode("B", depends_on="A"),
+    DagNode("C", depends_on=["B"]),
+    DagNode("D", depends_on=["B"]),
+    DagNode("E"),
+]
+
+
+class FakeServer:
+    """Run jobs as tasks numbered in launch order, with the given final states."""
+
+    def __init__(self, states=None, delay=0.0):
+        self.states = states or {}
+        self.delay = delay
+        self.launched = []
+        self.tasks = {}
+        self.lock = threading.Lock()
+
+    def run_job(self, job_name, *args):
+        with self.lock:
+            self.launched.append(job_name)
+            task_id = len(self.launched)
+            self.tasks[task_id] = job_name
+        return {"success": True, "id": task_id}
+
+    def get_task_details(self, task_id, project_name=None):
+        time.sleep(self.delay)
+        job_name = self.tasks[task_id]
+        return {"id": task_id, "state": self.states.get(job_name, "SUCCESS")}
+
+
+class TestJobDag(TestCase):
+    def test_topological_order(self):
+        dag = JobDag(DIAMOND)
+        order = dag.order
+        self.assertEqual(sorted(order), ["A", "B", "C", "D", "E"])
+        self.assertLess(order.index("A"), order.index("B"))
+        self.assertLess(order.index("B"), order.index("D"))
+        self.assertEqual(sorted(dag.descendants("A")), ["B", "C", "D"])
+
+    def test_node_names(self):
+        dag = JobDag(
+            [
+                {"job_name": "Load", "name": "Load_EU"},
+                {"job_name": "Load", "name": "Load_US", "depends_on": ["Load_EU"]},
+            ]
+        )
+        self.assertEqual(dag.nodes["Load_US"].job_name, "Load")
+
+    def test_invalid_dags(self):
+        with self.assertRaisesRegex(ValueError, "Duplicate"):
+            JobDag([DagNode("A"), DagNode("A")])
+        with self.assertRaisesRegex(ValueError, "unknown node Z"):
+            JobDag([DagNode("A", depends_on="Z")])
+        with self.assertRaisesRegex(ValueError, "cycle"):
+            JobDag([DagNode("A", depends_on="B"), DagNode("B", depends_on="A")])
+
+    def test_critical_path(self):
+        dag = JobDag(DIAMOND)
+        timings = {"A": (0, 2), "B": (2, 3), "C": (3, 9), "D": (3, 4), "E": (0, 8)}
+        results = {
+            name: NodeResult(name, NODE_SUCCEEDED, started_at=start, finished_at=end)
+            for name, (start, end) in timings.items()
+        }
+        self.assertEqual(critical_path(dag, results), (["A", "B", "C"], 9))
+
+
+class TestRunDag(TestCase):
+    client: MatillionClient
+
+    def setUp(self):
+        self.client = MatillionClient(
+            DUMMY_URL,
+            DUMMY_USERNAME,
+            DUMMY_PASSWORD,
+            DUMMY_PROJECT_GROUP_NAME,
+            DUMMY_PROJECT_NAME,
+        )
+
+    def run_dag(self, server, *args, **kwargs):
+        with (
+            patch.object(self.client, "run_job", side_effect=server.run_job),
+            patch(
+                "pymatillion.matillion.MatillionClient.get_task_details",
+                side_effect=server.get_task_details,
+            ),
+        ):
+            return self.client.run_dag(*args, backoff=NO_BACKOFF, **kwargs)
+
+    def test_run_dag(self):
+        server = FakeServer()
+        report = self.run_dag(server, DIAMOND)
+        self.assertTrue(report.ok)
+        self.assertEqual(list(report.results), JobDag(DIAMOND).order)
+        launched = server.launched
+        self.assertLess(launched.index("A"), launched.index("B"))
+        self.assertLess(launched.index("B"), launched.index("C"))
+        self.assertEqual(report.results["C"].task["state"], "SUCCESS")
+        self.assertEqual(report.critical_path[0], "A")
+
+    def test_independent_branches_run_concurrently(self):
+        server = FakeServer(delay=0.05)
+        report = self.run_dag(server, [DagNode(f"Job_{i}") for i in range(4)])
+        self.assertTrue(report.ok)
+        self.assertLess(report.elapsed, 0.15)
+        self.assertLessEqual(report.critical_path_duration, report.elapsed)
+
+    def test_fail_fast(self):
+        server = FakeServer({"B": "FAILED"})
+        report = self.run_dag(server, DIAMOND, max_concurrency=1)
+        self.assertFalse(report.ok)
+        self.assertEqual(report.failed, ["B"])
+        self.assertNotIn("C", server.launched)
+        self.assertEqual(report.results["C"].status, NODE_SKIPPED)
+        self.assertEqual(report.results["C"].duration, 0)
+
+    def test_continue(self):
+        server = FakeServer({"B": "FAILED"})
+        report = self.run_dag(server, DIAMOND, policy=DAG_CONTINUE, max_concurrency=1)
+        self.assertEqual(sorted(report.succeeded), ["A", "E"])
+        self.assertEqual(report.failed, ["B"])
+        self.assertEqual(sorted(report.skipped), ["C", "D"])
+
+    def test_rejected_launch_fails_node(self):
+        server = FakeServer()
+        with patch.object(
+            self.client, "run_job", return_value={"success": False, "msg": "No job"}
+        ):
+            report = self.client.run_dag([DagNode("A")], backoff=NO_BACKOFF)
+        self.assertEqual(report.results["A"].status, NODE_FAILED)
+        self.assertIn("No job", str(report.results["A"].error))
+        self.assertEqual(server.launched, [])
+
+    def test_resume_from_failure(self):
+        report = self.run_dag(FakeServer({"C": "FAILED"}), DIAMOND)
+        self.assertEqual(report.failed, ["C"])
+
+        server = FakeServer()
+        resumed = self.run_dag(server, DIAMOND, completed=report.succeeded)
+        self.assertTrue(resumed.ok)
+        self.assertEqual(server.launched, ["C"])
+        self.assertEqual(resumed.results["A"].status, NODE_RESUMED)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            self.client.run_dag(DIAMOND, policy="retry")
+        with self.assertRaises(ValueError):
+            self.client.run_dag(DIAMOND, completed=["Z"])
@@ -0,0 +1,151 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from pymatillion.constants import API_GET, API_POST
+from pymatillion.endpoints import (
+    DELETE_VERSION,
+    GET_TASK_DETAILS,
+    LIST_JOBS,
+    LIST_PROJECT_GROUPS,
+    LIST_PROJECTS,
+    LIST_VERSIONS,
+    MAX_CACHED_PREFIXES,
+    RUN_JOB,
+    Endpoints,
+)
+from pymatillion.matillion import MatillionClient
+
+DUMMY_URL = "https://fakematillioninstance.com"
+DUMMY_USERNAME = "fake_user"
+DUMMY_PASSWORD = "fake_pass"
+DUMMY_PROJECT_GROUP_NAME = "Sample_Project_Group"
+DUMMY_PROJECT_NAME = "Sample_Project_1"
+DUMMY_JOB_NAME = "Sample_Job_1"
+DUMMY_TASK_ID = 12345
+
+PROJECT_URL = (
+    f"{DUMMY_URL}/rest/v1/group/name/{DUMMY_PROJECT_GROUP_NAME}"
+    f"/project/name/{DUMMY_PROJECT_NAME}"
+)
+
+
+class TestEndpoints(TestCase):
+    def setUp(self):
+        self.endpoints = Endpoints(DUMMY_URL, DUMMY_PROJECT_GROUP_NAME)
+
+    def test_routes(self):
+        self.assertEqual(RUN_JOB.method, API_POST)
+        self.assertEqual(GET_TASK_DETAILS.method, API_GET)
+        self.assertEqual(
+            RUN_JOB.endpoint,
+            "group/name/{group}/project/name/{project}/version/name/{version}"
+            "/job/name/{job}/run",
+        )
+        self.assertEqual(
+            GET_TASK_DETAILS.endpoint,
+            "group/name/{group}/project/name/{project}/task/id/{id}",
+        )
+        self.assertEqual(LIST_PROJECT_GROUPS.endpoint, "group")
+
+    def test_url(self):
+        self.assertEqual(
+            self.endpoints.url(LIST_PROJECT_GROUPS), f"{DUMMY_URL}/rest/v1/group"
+        )
+        self.assertEqual(
+            self.endpoints.url(LIST_PROJECTS),
+            f"{DUMMY_URL}/rest/v1/group/name/{DUMMY_PROJECT_GROUP_NAME}/project",
+        )
+        self.assertEqual(
+            self.endpoints.url(LIST_VERSIONS, DUMMY_PROJECT_NAME, "ignored"),
+            f"{PROJECT_URL}/version",
+        )
+        self.assertEqual(
+            self.endpoints.url(LIST_JOBS, DUMMY_PROJECT_NAME, "v2"),
+            f"{PROJECT_URL}/version/name/v2/job",
+        )
+        self.assertEqual(
+            self.endpoints.url(
+                RUN_JOB, DUMMY_PROJECT_NAME, "default", job=DUMMY_JOB_NAME
+            ),
+            f"{PROJECT_URL}/version/name/default/job/name/{DUMMY_JOB_NAME}/run",
+        )
+        self.assertEqual(
+            self.endpoints.url(GET_TASK_DETAILS, DUMMY_PROJECT_NAME, id=DUMMY_TASK_ID),
+            f"{PROJECT_URL}/task/id/{DUMMY_TASK_ID}",
+        )
+
+    def test_missing_scope_segment(self):
+        with self.assertRaises(ValueError):
+            self.endpoints.url(DELETE_VERSION, DUMMY_PROJECT_NAME, None)
+        with self.assertRaises(ValueError):
+            self.endpoints.url(GET_TASK_DETAILS, None, id=DUMMY_TASK_ID)
+
+    def test_prefixes_are_cached(self):
+        prefix = self.endpoints.prefix(LIST_JOBS.scope, DUMMY_PROJECT_NAME, "v2")
+        self.assertIs(
+            self.endpoints.prefix(LIST_JOBS.scope, DUMMY_PROJECT_NAME, "v2"), prefix
+        )
+
+    def test_prefix_cache_is_bounded(self):
+        for i in range(MAX_CACHED_PREFIXES * 2):
+            self.endpoints.url(LIST_JOBS, DUMMY_PROJECT_NAME, f"v{i}")
+        self.assertLessEqual(len(self.endpoints._prefixes), MAX_CACHED_PREFIXES)
+
+
+class TestClientScope(TestCase):
+    client: MatillionClient
+
+    def setUp(self):
+        self.client = MatillionClient(
+            DUMMY_URL,
+            DUMMY_USERNAME,
+            DUMMY_PASSWORD,
+            DUMMY_PROJECT_GROUP_NAME,
+            DUMMY_PROJECT_NAME,
+        )
+
+    @patch("pymatillion.matillion.requests.Session.get")
+    def test_attributes_are_validated_once(self, mock_get):
+        self.client.get_task_details(DUMMY_TASK_ID)
+        # Bypass __setattr__ so the cached validation is not reset.
+        self.client.__dict__["password"] = ""
+        self.client.get_task_details(DUMMY_TASK_ID)
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch("pymatillion.matillion.requests.Session.get")
+    def test_scope_change_revalidates(self, mock_get):
+        self.client.list_projects()
+        self.client.project_group_name = ""
+        with self.assertRaises(ValueError):
+            self.client.list_projects()
+        self.assertEqual(mock_get.call_count, 1)
+
+    @patch("pymatillion.matillion.requests.Session.get")
+    def test_scope_change_rebuilds_endpoints(self, mock_get):
+        self.client.list_projects()
+        endpoints = self.client.endpoints
+        self.client.list_projects()
+        self.assertIs(self.client.endpoints, endpoints)
+
+        self.client.project_group_name = "Other_Group"
+        self.client.list_projects()
+        self.assertIsNot(self.client.endpoints, endpoints)
+        self.assertEqual(
+            mock_get.call_args.args[0],
+            f"{DUMMY_URL}/rest/v1/group/name/Other_Group/project",
+        )
+
+    @patch("pymatillion.matillion.requests.Session.post")
+    def test_delete_project_requires_version(self, mock_post):
+        with self.assertRaises(ValueError):
+            self.client.delete_project(DUMMY_PROJECT_NAME, None)
+        mock_post.assert_not_called()
+
+    @patch("pymatillion.matillion.requests.Session.get")
+    def test_project_name_override(self, mock_get):
+        self.client.get_task_details(DUMMY_TASK_ID, project_name="Sample_Project_2")
+        self.assertTrue(
+            mock_get.call_args.args[0].endswith(
+                f"/project/name/Sample_Project_2/task/id/{DUMMY_TASK_ID}"
+            )
+        )
@@ -0,0 +1,189 @@
+import json
+import sqlite3
+import tempfile
+import threading
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import patch
+
+from pymatillion.history import RunRecorder
+from pymatillion.matillion import MatillionClient
+
+DUMMY_URL = "https://fakematillioninstance.com"
+DUMMY_USERNAME = "fake_user"
+DUMMY_PASSWORD = "fake_pass"
+DUMMY_PROJECT_GROUP_NAME = "Sample_Project_Group"
+DUMMY_PROJECT_NAME = "Sample_Project_1"
+
+PARENT_DIR = Path(__file__).parent
+
+
+def load_response(file_name):
+    with open(PARENT_DIR.joinpath(file_name)) as response:
+        return json.load(response)
+
+
+def make_task(task_id, job_name, seconds, state="SUCCESS", components=()):
+    start = 1_700_000_000_000 + task_id * 1_000_000
+    return {
+        "id": task_id,
+        "groupName": DUMMY_PROJECT_GROUP_NAME,
+        "projectName": DUMMY_PROJECT_NAME,
+        "versionName": "default",
+        "jobName": job_name,
+        "state": state,
+        "startTime": start,
+        "endTime": start + int(seconds * 1000),
+        "tasks": [
+            {
+                "taskID": i,
+                "jobName": job_name,
+                "componentName": name,
+                "state": "SUCCESS",
+                "startTime": start,
+                "endTime": start + int(duration * 1000),
+            }
+            for i, (name, duration) in enumerate(components)
+        ],
+    }
+
+
+class TestRunRecorder(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name, "history.sqlite3")
+        self.recorder = RunRecorder(self.path)
+
+    def tearDown(self):
+        self.recorder.close()
+        self.directory.cleanup()
+
+    def test_duration_percentiles(self):
+        for i in range(1, 11):
+            self.recorder.record_task(make_task(i, "Load", i))
+        self.recorder.record_task(make_task(11, "Load", 100, state="RUNNING"))
+        self.recorder.record_task(make_task(12, "Other", 5))
+        self.assertEqual(
+            self.recorder.duration_percentiles(percentiles=(50, 90, 100)),
+            {
+                "Load": {"count": 10, "p50": 5, "p90": 9, "p100": 10},
+                "Other": {"count": 1, "p50": 5, "p90": 5, "p100": 5},
+            },
+        )
+        self.assertEqual(
+            list(self.recorder.duration_percentiles(job_name="Other")), ["Other"]
+        )
+
+    def test_task_is_updated_when_polled_again(self):
+        self.recorder.record_task(make_task(1, "Load", 1, state="RUNNING"))
+        self.recorder.record_task(make_task(1, "Load", 3, state="FAILED"))
+        self.recorder.record_task(make_task(2, "Load", 2))
+        self.assertEqual(
+            self.recorder.failure_rates(),
+            {"Load": {"runs": 2, "failures": 1, "failure_rate": 0.5}},
+        )
+
+    def test_since(self):
+        self.recorder.record_task(make_task(1, "Load", 1))
+        self.recorder.record_task(make_task(2, "Load", 2))
+        since = make_task(2, "Load", 0)["startTime"] / 1000
+        self.assertEqual(
+            self.recorder.duration_percentiles(since=since, percentiles=(50,)),
+            {"Load": {"count": 1, "p50": 2}},
+        )
+
+    def test_slowest_components(self):
+        self.recorder.record_task(
+            make_task(1, "Load", 10, components=[("Extract", 2), ("Transform", 6)])
+        )
+        self.recorder.record_task(
+            make_task(2, "Load", 10, components=[("Extract", 4), ("Transform", 8)])
+        )
+        self.recorder.record_task(make_task(3, "Other", 1, components=[("Ping", 1)]))
+        self.assertEqual(
+            self.recorder.slowest_components(job_name="Load", limit=1),
+            [
+                {
+                    "job_name": "Load",
+                    "component_name": "Transform",
+                    "runs": 2,
+                    "avg_duration": 7,
+                    "max_duration": 8,
+                }
+            ],
+        )
+        self.assertEqual(len(self.recorder.slowest_components()), 3)
+
+    def test_writes_are_batched_off_the_calling_thread(self):
+        written_by = set()
+        write = RunRecorder._write
+
+        def record_writer(connection, batch):
+            written_by.add(threading.current_thread().name)
+            write(connection, batch)
+
+        with patch.object(RunRecorder, "_write", side_effect=record_writer):
+            for i in range(1000):
+                self.recorder.record_run({"success": True, "id": i}, "Load")
+            self.assertTrue(self.recorder.flush(timeout=5))
+        self.assertEqual(written_by, {"pymatillion-history"})
+        connection = sqlite3.connect(self.path)
+        self.assertEqual(
+            connection.execute("SELECT COUNT(*) FROM runs").fetchone(), (1000,)
+        )
+        connection.close()
+
+    def test_close_writes_queued_records(self):
+        self.recorder.record_task(make_task(1, "Load", 1))
+        self.recorder.close()
+        with RunRecorder(self.path) as recorder:
+            self.assertEqual(recorder.failure_rates()["Load"]["runs"], 1)
+
+
+class TestClientRecorder(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.recorder = RunRecorder(Path(self.directory.name, "history.sqlite3"))
+        self.client = MatillionClient(
+            DUMMY_URL,
+            DUMMY_USERNAME,
+            DUMMY_PASSWORD,
+            DUMMY_PROJECT_GROUP_NAME,
+            DUMMY_PROJECT_NAME,
+            recorder=self.recorder,
+        )
+
+    def tearDown(self):
+        self.recorder.close()
+        self.directory.cleanup()
+
+    @patch("pymatillion.matillion.requests.Session.get")
+    @patch("pymatillion.matillion.requests.Session.post")
+    def test_client_records_runs_and_tasks(self, mock_post, mock_get):
+        mock_post.return_value.json.return_value = load_response(
+            "run_job_response.json"
+        )
+        task = load_response("task_detail_response.json")
+        mock_get.return_value.json.return_value = task
+        self.client.run_job("Sample_Job_1")
+        self.client.get_task_details(task["id"], as_model=True)
+
+        rates = self.recorder.failure_rates(project_name="Sample_Project_1")
+        self.assertEqual(rates[task["jobName"]]["runs"], 1)
+        components = self.recorder.slowest_components()
+        self.assertEqual(
+            len(components), len({c["componentName"] for c in task["tasks"]})
+        )
+        run = self.recorder._connection().execute("SELECT * FROM runs").fetchone()
+        self.assertEqual(
+            run[1:],
+            (
+                DUMMY_PROJECT_GROUP_NAME,
+                DUMMY_PROJECT_NAME,
+                "default",
+                "Sample_Job_1",
+                65659,
+                1,
+                "Successfully queued job Sample_Job_1",
+            ),
+        )
@@ -0,0 +1,98 @@
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from requests.exceptions import ConnectionError
+
+from pymatillion.instrumentation import (
+    Instrumentation,
+    LatencyAggregator,
+    RequestEvent,
+)
+from pymatillion.matillion import MatillionClient
+
+DUMMY_URL = "https://fakematillioninstance.com"
+DUMMY_USERNAME = "fake_user"
+DUMMY_PASSWORD = "fake_pass"
+DUMMY_PROJECT_GROUP_NAME = "Sample_Project_Group"
+DUMMY_PROJECT_NAME = "Sample_Project_1"
+DUMMY_TASK_ID = 12345
+
+
+def make_response(status_code, content=b"[]"):
+    response = MagicMock()
+    response.status_code = status_code
+    response.content = content
+    return response
+
+
+class TestLatencyAggregator(TestCase):
+    def test_summary(self):
+        aggregator = LatencyAggregator()
+        for i in range(1, 101):
+            aggregator(
+                RequestEvent("get", "group", "url", status=200, elapsed=i / 1000)
+            )
+        aggregator(RequestEvent("get", "group", "url", status=503, elapsed=1))
+        aggregator(RequestEvent("post", "group", "url", error=ConnectionError()))
+        summary = aggregator.summary()
+        self.assertEqual(summary["GET group"]["count"], 101)
+        self.assertEqual(summary["GET group"]["errors"], 1)
+        self.assertEqual(summary["GET group"]["p50"], 0.051)
+        self.assertEqual(summary["GET group"]["p99"], 0.1)
+        self.assertEqual(summary["POST group"]["error_rate"], 1)
+        aggregator.reset()
+        self.assertDictEqual(aggregator.summary(), {})
+
+
+class TestClientInstrumentation(TestCase):
+    client: MatillionClient
+
+    def setUp(self):
+        self.events = []
+        self.aggregator = LatencyAggregator()
+        self.client = MatillionClient(
+            DUMMY_URL,
+            DUMMY_USERNAME,
+            DUMMY_PASSWORD,
+            DUMMY_PROJECT_GROUP_NAME,
+            DUMMY_PROJECT_NAME,
+            instrumentation=Instrumentation(
+                pre_request_hooks=[lambda event: self.events.append(event.status)],
+                post_request_hooks=[self.events.append, self.aggregator],
+            ),
+        )
+
+    @patch("pymatillion.matillion.requests.Session.get")
+    def test_hooks(self, mock_get):
+        mock_get.return_value = make_response(200, b'{"id": 12345}')
+        self.client.get_task_details(DUMMY_TASK_ID)
+        self.assertIsNone(self.events[0])
+        event = self.events[1]
+        self.assertEqual(event.method, "get")
+        self.assertEqual(
+            event.endpoint, "group/name/{group}/project/name/{project}/task/id/{id}"
+        )
+        self.assertTrue(event.url.endswith(f"/task/id/{DUMMY_TASK_ID}"))
+        self.assertEqual(event.status, 200)
+        self.assertEqual(event.bytes, 13)
+        self.assertGreaterEqual(event.elapsed, 0)
+        self.assertIn(
+            "GET group/name/{group}/project/name/{project}/task/id/{id}",
+            self.aggregator.summary(),
+        )
+
+    @patch("pymatillion.matillion.requests.Session.get")
+    def test_hooks_on_error(self, mock_get):
+        mock_get.side_effect = ConnectionError("Connection refused")
+        with self.assertRaises(ConnectionError):
+            self.client.list_project_groups()
+        self.assertIs(self.events[1].error, mock_get.side_effect)
+        self.assertEqual(self.aggregator.summary()["GET group"]["errors"], 1)
+
+    @patch("pymatillion.matillion.requests.Session.get")
+    def test_failing_hook_is_ignored(self, mock_get):
+        mock_get.return_value = make_response(200)
+        self.client.instrumentation.add_pre_request_hook(lambda event: 1 / 0)
+        with self.assertLogs("pymatillion.instrumentation", "ERROR"):
+            self.client.list_project_groups()
+        self.assertEqual(len(self.events), 2)
@@ -43,7 +43,7 @@ class TestMatillionClient(TestCase):
         self.assertEqual(self.client.project_name, DUMMY_PROJECT_NAME)
 
     @patch("pymatillion.matillion.MatillionClient._ensure_attributes")
-    @patch("pymatillion.matillion.requests.get")
+    @patch("pymatillion.matillion.requests.Session.get")
     def test_list_project_groups(self, mock_get, mock_ensure_attributes):
         with open(PARENT_DIR.joinpath("list_project_groups_response.json")) as response:
             json_content = json.load(response)
@@ -53,7 +53,7 @@ class TestMatillionClient(TestCase):
         mock_ensure_attributes.called_once_with(BASE_URL, USERNAME, PASSWORD)
 
     @patch("pymatillion.matillion.MatillionClient._ensure_attributes")
-    @patch("pymatillion.matillion.requests.get")
+    @patch("pymatillion.matillion.requests.Session.get")
     def test_list_project_group_without_url(self, mock_get, mock_ensure_attributes):
         self.client.base_url = ""
         mock_ensure_attributes.side_effect = [
@@ -66,7 +66,7 @@ class TestMatillionClient(TestCase):
         mock_get.assert_not_called()
 
     @patch("pymatillion.matillion.MatillionClient._ensure_attributes")
-    @patch("pymatillion.matillion.requests.get")
+    @patch("pymatillion.matillion.requests.Session.get")
     def test_list_project_group_without_username(
         self, mock_get, mock_ensure_attributes
     ):
@@ -81,7 +81,7 @@ class TestMatillionClient(TestCase):
         mock_get.assert_not_called()
 
     @patch("pymatillion.matillion.MatillionClient._ensure_attributes")
-    @patch("pymatillion.matillion.requests.get")
+    @patch("pymatillion.matillion.requests.Session.get")
     def test_list_project_group_without_password(
         self, mock_get, mock_ensure_attributes
     ):
@@ -95,7 +95,7 @@ class TestMatillionClient(TestCase):
         mock_ensure_attributes.called_once_with(BASE_URL, USERNAME, PASSWORD)
         mock_get.assert_not_called()
 
-    @patch("pymatillion.matillion.requests.get")
+    @patch("pymatillion.matillion.requests.Session.get")
     def test_list_project_groups_when_attributes_unauthorized(self, mock_get):
         self.client.password = "xyz"
         self.client.username = "abc"
@@ -110,7 +110,7 @@ class TestMatillionClient(TestCase):
         self.assertEqual(json_content["msg"], cm.exception.args[0])
 
     @patch("pymatillion.matillion.MatillionClient._ensure_attributes")
-    @patch("pymatillion.matillion.requests.get")
+    @patch("pymatillion.matillion.requests.Session.get")
     def test_list_projects(self, mock_get, mock_ensure_attributes):
         self.client.project_group_name = DUMMY_PROJECT_GROUP_NAME
 
@@ -126,7 +126,7 @@ class TestMatillionClient(TestCase):
         )
 
     @patch("pymatillion.matillion.MatillionClient._ensure_attributes")
-    @patch("pymatillion.matillion.requests.get")
+    @patch("pymatillion.matillion.requests.Session.get")
     def test_list_projects_without_url(self, mock_get, mock_ensure_attributes):
         self.client.project_group_name = DUMMY_PROJECT_GROUP_NAME
         self.client.base_url = ""
@@ -145,7 +145,7 @@ class TestMatillionClient(TestCase):
         mock_get.assert_not_called()
 
     @patch("pymatillion.matillion.MatillionClient._ensure_attributes")
-    @patch("pymatillion.matillion.requests.get")
+    @patch("pymatillion.matillion.requests.Session.get")
     def test_list_projects_without_password(self, mock_get, mock_ensure_attributes):
         self.client.project_group_name = DUMMY_PROJECT_GROUP_NAME
         self.client.password = ""
@@ -163,7 +163,7 @@ class TestMatillionClient(TestCase):
         )
         mock_get.assert_not_called()
 
-    @patch("pymatillion.matillion.requests.get")
+    @patch("pymatillion.matillion.requests.Session.get")
     def test_list_projects_when_attributes_unauthorized(self, mock_get):
         self.client.project_group_name = DUMMY_PROJECT_GROUP_NAME
 
@@ -180,7 +180,7 @@ class TestMatillionClient(TestCase):
         self.assertEqual(json_content["msg"], cm.exception.args[0])
 
     @patch("pymatillion.matillion.MatillionClient._ensure_attributes")
-    @patch("pymatillion.matillion.requests.get")
+    @patch("pymatillion.matillion.requests.Session.get")
     def test_list_jobs(self, mock_get, mock_ensure_attributes):
         self.client.project_group_name = DUMMY_PROJECT_GROUP_NAME
         self.client.project_name = DUMMY_PROJECT_NAME
@@ -197,7 +197,7 @@ class TestMatillionClient(TestCase):
         )
 
     @patch("pymatillion.matillion.MatillionClient._ensure_attributes")
-    @patch("pymatillion.matillion.requests.get")
+    @patch("pymatillion.matillion.requests.Session.get")
     def test_list_jobs_without_url(self, mock_get, mock_ensure_attributes):
         self.client.project_group_name = DUMMY_PROJECT_GROUP_NAME
         self.client.project_name = DUMMY_PROJECT_NAME
@@ -217,7 +217,7 @@ class TestMatillionClient(TestCase):
         mock_get.assert_not_called()
 
     @patch("pymatillion.matillion.MatillionClient._ensure_attributes")
-    @patch("pymatillion.matillion.requests.get")
+    @patch("pymatillion.matillion.requests.Session.get")
     def test_list_jobs_without_password(self, mock_get, mock_ensure_attributes):
         self.client.project_group_name = DUMMY_PROJECT_GROUP_NAME
         self.client.project_name = DUMMY_PROJECT_NAME
@@ -236,7 +236,7 @@ class TestMatillionClient(TestCase):
         )
         mock_get.assert_not_called()
 
-    @patch("pymatillion.matillion.requests.get")
+    @patch("pymatillion.matillion.requests.Session.get")
     def test_list_jobs_when_attributes_unauthorized(self, mock_get):
         self.client.project_group_name = DUMMY_PROJECT_GROUP_NAME
         self.client.project_name = DUMMY_PROJECT_NAME
@@ -254,7 +254,26 @@ class TestMatillionClient(TestCase):
         self.assertEqual(json_content["msg"], cm.exception.args[0])
 
     @patch("pymatillion.matillion.MatillionClient._ensure_attributes")
-    @patch("pymatillion.matillion.requests.post")
+    @patch("pymatillion.matillion.requests.Session.get")
+    def test_list_versions(self, mock_get, mock_ensure_attributes):
+        self.client.project_group_name = DUMMY_PROJECT_GROUP_NAME
+        self.client.project_name = DUMMY_PROJECT_NAME
+
+        with open(PARENT_DIR.joinpath("list_versions_response.json")) as response:
+            json_content = json.load(response)
+        mock_get.return_value.json.return_value = json_content
+
+        versions = self.client.list_versions()
+
+        self.assertListEqual(versions, json_content)
+        self.assertTrue(
+            mock_get.call_args.args[0].endswith(
+                f"/project/name/{DUMMY_PROJECT_NAME}/version"
+            )
+        )
+
+    @patch("pymatillion.matillion.MatillionClient._ensure_attributes")
+    @patch("pymatillion.matillion.requests.Session.post")
     def test_run_job(self, mock_post, mock_ensure_attributes):
         self.client.project_group_name = DUMMY_PROJECT_GROUP_NAME
         self.client.project_name = DUMMY_PROJECT_NAME
@@ -271,7 +290,7 @@ class TestMatillionClient(TestCase):
         )
 
     @patch("pymatillion.matillion.MatillionClient._ensure_attributes")
-    @patch("pymatillion.matillion.requests.get")
+    @patch("pymatillion.matillion.requests.Session.get")
     def test_get_task_details(self, mock_get, mock_ensure_attributes):
         self.client.project_group_name = DUMMY_PROJECT_GROUP_NAME
         self.client.project_name = DUMMY_PROJECT_NAME
@@ -288,7 +307,7 @@ class TestMatillionClient(TestCase):
         )
 
     @patch("pymatillion.matillion.MatillionClient._ensure_attributes")
-    @patch("pymatillion.matillion.requests.post")
+    @patch("pymatillion.matillion.requests.Session.post")
     def test_delete_project(self, mock_post, mock_ensure_attributes):
         self.client.project_group_name = DUMMY_PROJECT_GROUP_NAME
         self.client.project_name = DUMMY_PROJECT_NAME
@@ -307,7 +326,7 @@ class TestMatillionClient(TestCase):
         )
 
     @patch("pymatillion.matillion.MatillionClient._ensure_attributes")
-    @patch("pymatillion.matillion.requests.post")
+    @patch("pymatillion.matillion.requests.Session.post")
     def test_delete_job(self, mock_post, mock_ensure_attributes):
         self.client.project_group_name = DUMMY_PROJECT_GROUP_NAME
         self.client.project_name = DUMMY_PROJECT_NAME
@@ -322,3 +341,37 @@ class TestMatillionClient(TestCase):
         mock_ensure_attributes.called_once_with(
             BASE_URL, USERNAME, PASSWORD, PROJECT_GROUP_NAME, PROJECT_NAME
         )
+
+    def test_session_is_reused(self):
+        session = self.client.session
+        self.assertIs(session, self.client.session)
+        adapter = session.get_adapter(DUMMY_URL)
+        self.assertEqual(adapter._pool_connections, self.client.pool_connections)
+        self.assertEqual(adapter._pool_maxsize, self.client.pool_maxsize)
+
+    @patch("pymatillion.matillion.requests.Session.get")
+    def test_requests_use_session(self, mock_get):
+        mock_get.return_value.json.return_value = []
+        self.client.list_project_groups()
+        self.client.list_project_groups()
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertEqual(mock_get.call_args.args[0], f"{DUMMY_URL}/rest/v1/group")
+
+    def test_session_without_keep_alive(self):
+        client = MatillionClient(
+            DUMMY_URL, DUMMY_USERNAME, DUMMY_PASSWORD, keep_alive=False
+        )
+        self.assertEqual(client.session.headers["Connection"], "close")
+
+    @patch("pymatillion.matillion.requests.Session.close")
+    def test_close(self, mock_close):
+        session = self.client.session
+        self.client.close()
+        mock_close.assert_called_once()
+        self.assertIsNot(session, self.client.session)
+
+    @patch("pymatillion.matillion.requests.Session.close")
+    def test_context_manager(self, mock_close):
+        with MatillionClient(DUMMY_URL, DUMMY_USERNAME, DUMMY_PASSWORD) as client:
+            client.session
+        mock_close.assert_called_once()
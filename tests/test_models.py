@@ -0,0 +1,88 @@
+import json
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import patch
+
+from pymatillion.matillion import MatillionClient
+from pymatillion.models import ComponentResult, RunResponse, TaskDetails
+
+DUMMY_URL = "https://fakematillioninstance.com"
+DUMMY_USERNAME = "fake_user"
+DUMMY_PASSWORD = "fake_pass"
+DUMMY_PROJECT_GROUP_NAME = "Sample_Project_Group"
+DUMMY_PROJECT_NAME = "Sample_Project_1"
+DUMMY_JOB_NAME = "Sample_Job_1"
+DUMMY_TASK_ID = 12345
+
+
+PARENT_DIR = Path(__file__).parent
+
+
+def load_response(file_name):
+    with open(PARENT_DIR.joinpath(file_name)) as response:
+        return json.load(response)
+
+
+class TestModels(TestCase):
+    def test_run_response(self):
+        response = RunResponse.from_dict(load_response("run_job_response.json"))
+        self.assertTrue(response.success)
+        self.assertEqual(response.message, "Successfully queued job Sample_Job_1")
+        self.assertEqual(response.task_id, 65659)
+
+    def test_task_details(self):
+        task = TaskDetails.from_dict(load_response("task_detail_response.json"))
+        self.assertEqual(task.id, DUMMY_TASK_ID)
+        self.assertEqual(task.state, "SUCCESS")
+        self.assertEqual(task.project_name, "Sample_Project_1")
+        self.assertEqual(task.job_names, ("Sample_Job_1",))
+        self.assertTrue(task.is_terminal)
+        self.assertEqual(task.duration, 10.069)
+        self.assertFalse(hasattr(task, "__dict__"))
+
+    def test_task_details_components_are_lazy(self):
+        task = TaskDetails.from_dict(load_response("task_detail_response.json"))
+        self.assertIsNone(task._components)
+        components = task.components
+        self.assertIs(components, task.components)
+        self.assertIsNone(task._raw_components)
+        self.assertEqual(len(components), 1)
+        self.assertIsInstance(components[0], ComponentResult)
+        self.assertEqual(components[0].component_id, 828)
+
+    def test_task_details_without_components(self):
+        task = TaskDetails.from_dict({"id": 1, "state": "RUNNING"})
+        self.assertEqual(task.components, ())
+        self.assertFalse(task.is_terminal)
+        self.assertIsNone(task.duration)
+
+
+class TestClientModels(TestCase):
+    client: MatillionClient
+
+    def setUp(self):
+        self.client = MatillionClient(
+            DUMMY_URL,
+            DUMMY_USERNAME,
+            DUMMY_PASSWORD,
+            DUMMY_PROJECT_GROUP_NAME,
+            DUMMY_PROJECT_NAME,
+        )
+
+    @patch("pymatillion.matillion.requests.Session.post")
+    def test_run_job_as_model(self, mock_post):
+        mock_post.return_value.json.return_value = load_response(
+            "run_job_response.json"
+        )
+        response = self.client.run_job(DUMMY_JOB_NAME, as_model=True)
+        self.assertIsInstance(response, RunResponse)
+        self.assertEqual(response.id, 65659)
+
+    @patch("pymatillion.matillion.requests.Session.get")
+    def test_get_task_details_as_model(self, mock_get):
+        mock_get.return_value.json.return_value = load_response(
+            "task_detail_response.json"
+        )
+        task = self.client.get_task_details(DUMMY_TASK_ID, as_model=True)
+        self.assertIsInstance(task, TaskDetails)
+        self.assertEqual(task.job_name, "Sample_Job_1")
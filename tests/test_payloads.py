@@ -0,0 +1,138 @@
+import gzip
+import json
+import pickle
+from unittest import TestCase
+from unittest.mock import patch
+
+from requests.exceptions import HTTPError
+
+from pymatillion import payloads
+from pymatillion.matillion import MatillionClient
+from pymatillion.payloads import GridVariables, dumps, gzip_body, run_job_body
+
+DUMMY_URL = "https://fakematillioninstance.com"
+DUMMY_USERNAME = "fake_user"
+DUMMY_PASSWORD = "fake_pass"
+DUMMY_PROJECT_GROUP_NAME = "Sample_Project_Group"
+DUMMY_PROJECT_NAME = "Sample_Project_1"
+DUMMY_JOB_NAME = "Sample_Job_1"
+
+DUMMY_GRID = {"rows": [[f"name_{i}", i, "é"] for i in range(1000)]}
+
+
+class TestPayloads(TestCase):
+    def test_dumps_matches_standard_library(self):
+        value = {"scalar": "é", "number": 1.5, "rows": DUMMY_GRID["rows"][:3]}
+        with patch.object(payloads, "orjson", None):
+            standard = dumps(value)
+        self.assertEqual(json.loads(standard), value)
+        self.assertEqual(dumps(value), standard)
+
+    def test_dumps_differences(self):
+        with patch.object(payloads, "orjson", None):
+            with self.assertRaises(ValueError):
+                dumps([float("nan")])
+        if payloads.orjson is not None:
+            self.assertEqual(dumps([float("nan")]), b"[null]")
+
+    def test_run_job_body(self):
+        body = run_job_body({"a": "1"}, GridVariables(DUMMY_GRID))
+        self.assertEqual(
+            json.loads(body),
+            {"scalarVariables": {"a": "1"}, "gridVariables": DUMMY_GRID},
+        )
+        self.assertEqual(run_job_body({"a": "1"}, DUMMY_GRID), body)
+
+    def test_grid_variables_are_encoded_once(self):
+        grid = GridVariables(DUMMY_GRID)
+        with patch("pymatillion.payloads.dumps", wraps=dumps) as mock_dumps:
+            for i in range(3):
+                run_job_body({"run": str(i)}, grid)
+        self.assertEqual(
+            [call.args[0] for call in mock_dumps.call_args_list],
+            [{"run": "0"}, {"run": "1"}, {"run": "2"}],
+        )
+
+    def test_grid_variables_pickle(self):
+        grid = GridVariables(DUMMY_GRID)
+        self.assertEqual(pickle.loads(pickle.dumps(grid)), grid)
+        self.assertEqual(len(grid), len(grid.encoded))
+
+    def test_gzip_body(self):
+        body = run_job_body({}, DUMMY_GRID)
+        compressed = gzip_body(body)
+        self.assertLess(len(compressed), len(body) / 4)
+        self.assertEqual(gzip.decompress(compressed), body)
+        self.assertEqual(gzip_body(body), compressed)
+
+
+@patch("pymatillion.matillion.requests.Session.post")
+class TestClientPayloads(TestCase):
+    def make_client(self, **kwargs):
+        return MatillionClient(
+            DUMMY_URL,
+            DUMMY_USERNAME,
+            DUMMY_PASSWORD,
+            DUMMY_PROJECT_GROUP_NAME,
+            DUMMY_PROJECT_NAME,
+            **kwargs,
+        )
+
+    def sent_body(self, call):
+        data = call.kwargs["data"]
+        if call.kwargs["headers"].get("Content-Encoding") == "gzip":
+            data = gzip.decompress(data)
+        return json.loads(data)
+
+    def test_run_job_sends_encoded_body(self, mock_post):
+        mock_post.return_value.json.return_value = {"success": True, "id": 1}
+        self.make_client().run_job(DUMMY_JOB_NAME, {"a": "1"}, DUMMY_GRID)
+        call = mock_post.call_args
+        self.assertEqual(call.kwargs["headers"], {"Content-Type": "application/json"})
+        self.assertEqual(
+            self.sent_body(call),
+            {"scalarVariables": {"a": "1"}, "gridVariables": DUMMY_GRID},
+        )
+
+    def test_compress_threshold(self, mock_post):
+        mock_post.return_value.json.return_value = {"success": True, "id": 1}
+        client = self.make_client(compress_threshold=1024)
+        client.run_job(DUMMY_JOB_NAME)
+        self.assertNotIn("Content-Encoding", mock_post.call_args.kwargs["headers"])
+        client.run_job(DUMMY_JOB_NAME, grid_variables=GridVariables(DUMMY_GRID))
+        call = mock_post.call_args
+        self.assertEqual(call.kwargs["headers"]["Content-Encoding"], "gzip")
+        self.assertEqual(self.sent_body(call)["gridVariables"], DUMMY_GRID)
+
+    def test_rejected_compression_is_disabled(self, mock_post):
+        def post(url, data=None, headers=None, **kwargs):
+            response = mock_post.return_value
+            response.status_code = 415 if "Content-Encoding" in headers else 200
+            if response.status_code == 415:
+                response.raise_for_status.side_effect = HTTPError(response=response)
+            else:
+                response.raise_for_status.side_effect = None
+            return response
+
+        mock_post.side_effect = post
+        mock_post.return_value.json.return_value = {"success": True, "id": 1}
+        client = self.make_client(compress_threshold=0)
+        with self.assertNoLogs("pymatillion", "WARNING"):
+            for _ in range(2):
+                self.assertEqual(client.run_job(DUMMY_JOB_NAME)["id"], 1)
+        self.assertEqual(
+            [
+                "Content-Encoding" in call.kwargs["headers"]
+                for call in mock_post.call_args_list
+            ],
+            [True, False, False],
+        )
+
+    def test_other_errors_are_raised(self, mock_post):
+        mock_post.return_value.status_code = 400
+        mock_post.return_value.raise_for_status.side_effect = HTTPError(
+            response=mock_post.return_value
+        )
+        with self.assertRaises(HTTPError):
+            self.make_client(compress_threshold=0).run_job(DUMMY_JOB_NAME)
+        self.assertEqual(mock_post.call_count, 1)
@@ -0,0 +1,121 @@
+import multiprocessing
+import os
+import pickle
+from unittest import TestCase, skipUnless
+from unittest.mock import patch
+
+from pymatillion.bulk import JobSpec
+from pymatillion.matillion import MatillionClient
+from pymatillion.processes import ClientSpec, run_jobs_in_processes
+
+DUMMY_URL = "https://fakematillioninstance.com"
+DUMMY_USERNAME = "fake_user"
+DUMMY_PASSWORD = "fake_pass"
+DUMMY_PROJECT_GROUP_NAME = "Sample_Project_Group"
+DUMMY_PROJECT_NAME = "Sample_Project_1"
+
+HAS_FORK = "fork" in multiprocessing.get_all_start_methods()
+
+
+def fake_run_job(self, job_name, *args, **kwargs):
+    if job_name == "Broken":
+        raise ValueError("Job not found")
+    return {"success": True, "id": job_name, "pid": os.getpid()}
+
+
+def count_components(client, response):
+    return {
+        **response,
+        "components": len(response["id"]),
+        "group": client.project_group_name,
+    }
+
+
+def session_id(_):
+    client = ClientSpec(DUMMY_URL, DUMMY_USERNAME, DUMMY_PASSWORD).client()
+    return id(client.session), client._session_pid == os.getpid()
+
+
+class TestClientSpec(TestCase):
+    def setUp(self):
+        self.client = MatillionClient(
+            DUMMY_URL,
+            DUMMY_USERNAME,
+            DUMMY_PASSWORD,
+            DUMMY_PROJECT_GROUP_NAME,
+            DUMMY_PROJECT_NAME,
+            pool_maxsize=4,
+        )
+
+    def test_pickle_round_trip(self):
+        spec = ClientSpec.from_client(self.client)
+        self.assertEqual(pickle.loads(pickle.dumps(spec)), spec)
+        self.assertNotIn(DUMMY_PASSWORD, repr(spec))
+        client = spec.build()
+        self.assertEqual(client.project_name, DUMMY_PROJECT_NAME)
+        self.assertEqual(client.pool_maxsize, 4)
+
+    def test_client_is_reused_per_process(self):
+        spec = ClientSpec.from_client(self.client)
+        client = spec.client()
+        self.assertIs(spec.client(), client)
+        with patch("pymatillion.processes.os.getpid", return_value=-1):
+            self.assertIsNot(spec.client(), client)
+
+    def test_session_reset_after_fork(self):
+        session = self.client.session
+        self.assertIs(self.client.session, session)
+        with patch("pymatillion.matillion.os.getpid", return_value=-1):
+            with patch.object(session, "close") as mock_close:
+                # The parent's connections are left alone.
+                self.client.close()
+                mock_close.assert_not_called()
+        self.assertIsNot(self.client.session, session)
+        with patch("pymatillion.matillion.os.getpid", return_value=-1):
+            self.assertIsNot(self.client.session, session)
+
+    @skipUnless(HAS_FORK, "requires the fork start method")
+    def test_forked_children_get_own_session(self):
+        spec = ClientSpec(DUMMY_URL, DUMMY_USERNAME, DUMMY_PASSWORD)
+        parent_session = id(spec.client().session)
+        with multiprocessing.get_context("fork").Pool(2) as pool:
+            results = pool.map(session_id, range(4))
+        for child_session, owned in results:
+            self.assertTrue(owned)
+            self.assertNotEqual(child_session, parent_session)
+
+
+@skipUnless(HAS_FORK, "requires the fork start method")
+@patch("pymatillion.matillion.MatillionClient.run_job", new=fake_run_job)
+class TestRunJobsInProcesses(TestCase):
+    def setUp(self):
+        self.client = MatillionClient(
+            DUMMY_URL,
+            DUMMY_USERNAME,
+            DUMMY_PASSWORD,
+            DUMMY_PROJECT_GROUP_NAME,
+            DUMMY_PROJECT_NAME,
+        )
+        self.context = multiprocessing.get_context("fork")
+
+    def test_run_jobs_in_processes(self):
+        specs = [("Job_1",), JobSpec("Job_22"), {"job_name": "Broken"}]
+        results = sorted(
+            run_jobs_in_processes(
+                self.client,
+                specs,
+                post_process=count_components,
+                max_workers=2,
+                mp_context=self.context,
+            ),
+            key=lambda r: r.index,
+        )
+        self.assertEqual([r.ok for r in results], [True, True, False])
+        self.assertEqual(results[0].response["components"], 5)
+        self.assertEqual(results[1].response["components"], 6)
+        self.assertEqual(results[1].response["group"], DUMMY_PROJECT_GROUP_NAME)
+        self.assertIsInstance(results[2].error, ValueError)
+        self.assertTrue(all(r.response["pid"] != os.getpid() for r in results[:2]))
+
+    def test_run_jobs_in_processes_without_specs(self):
+        self.assertEqual(list(run_jobs_in_processes(self.client, [])), [])
@@ -0,0 +1,106 @@
+import threading
+import time
+from unittest import TestCase
+from unittest.mock import patch
+
+from pymatillion.matillion import MatillionClient
+from pymatillion.ratelimit import (
+    RateLimiter,
+    TokenBucket,
+    get_rate_limiter,
+    set_rate_limiter,
+)
+
+DUMMY_URL = "https://fakematillioninstance.com"
+DUMMY_USERNAME = "fake_user"
+DUMMY_PASSWORD = "fake_pass"
+DUMMY_PROJECT_GROUP_NAME = "Sample_Project_Group"
+
+
+class TestTokenBucket(TestCase):
+    @patch("pymatillion.ratelimit.time.monotonic")
+    def test_take(self, mock_monotonic):
+        mock_monotonic.return_value = 0
+        bucket = TokenBucket(rate=2, burst=2)
+        self.assertEqual(bucket.take(), 0)
+        self.assertEqual(bucket.take(), 0)
+        self.assertEqual(bucket.take(), 0.5)
+        mock_monotonic.return_value = 0.5
+        self.assertEqual(bucket.take(), 0)
+        mock_monotonic.return_value = 100
+        bucket.take()
+        self.assertEqual(bucket.tokens, 1)
+
+    def test_invalid_rate(self):
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=0)
+
+
+class TestRateLimiter(TestCase):
+    def test_method_limits(self):
+        limiter = RateLimiter(method_limits={"POST": (20, 1)})
+        limiter.acquire("get")
+        limiter.acquire("get")
+        limiter.acquire("post")
+        self.assertGreater(limiter.acquire("post"), 0.02)
+        stats = limiter.wait_stats
+        self.assertEqual(stats["get"]["count"], 2)
+        self.assertEqual(stats["post"]["count"], 2)
+        self.assertGreater(stats["post"]["max"], 0.02)
+
+    def test_priorities(self):
+        limiter = RateLimiter(rate=20, burst=1)
+        limiter.acquire("get")
+        order = []
+
+        def acquire(method):
+            limiter.acquire(method)
+            order.append(method)
+
+        threads = [threading.Thread(target=acquire, args=("get",))]
+        threads.append(threading.Thread(target=acquire, args=("post",)))
+        for thread in threads:
+            thread.start()
+            time.sleep(0.01)
+        for thread in threads:
+            thread.join()
+        self.assertListEqual(order, ["post", "get"])
+
+    def test_registry(self):
+        limiter = RateLimiter(rate=100)
+        set_rate_limiter(f"{DUMMY_URL}/", limiter)
+        self.assertIs(get_rate_limiter(DUMMY_URL), limiter)
+        set_rate_limiter(DUMMY_URL, None)
+        self.assertIsNone(get_rate_limiter(DUMMY_URL))
+
+
+class TestClientRateLimiting(TestCase):
+    def tearDown(self):
+        set_rate_limiter(DUMMY_URL, None)
+
+    @patch("pymatillion.matillion.requests.Session.get")
+    def test_clients_share_host_limiter(self, mock_get):
+        mock_get.return_value.json.return_value = []
+        limiter = RateLimiter(rate=100)
+        set_rate_limiter(DUMMY_URL, limiter)
+        for project_group_name in ["Group_1", "Group_2"]:
+            MatillionClient(
+                DUMMY_URL, DUMMY_USERNAME, DUMMY_PASSWORD, project_group_name
+            ).list_projects()
+        self.assertEqual(limiter.wait_stats["get"]["count"], 2)
+
+    @patch("pymatillion.matillion.requests.Session.get")
+    def test_client_limiter_overrides_host_limiter(self, mock_get):
+        mock_get.return_value.json.return_value = []
+        shared, own = RateLimiter(rate=100), RateLimiter(rate=100)
+        set_rate_limiter(DUMMY_URL, shared)
+        client = MatillionClient(
+            DUMMY_URL,
+            DUMMY_USERNAME,
+            DUMMY_PASSWORD,
+            DUMMY_PROJECT_GROUP_NAME,
+            rate_limiter=own,
+        )
+        client.list_projects()
+        self.assertDictEqual(shared.wait_stats, {})
+        self.assertEqual(own.wait_stats["get"]["count"], 1)
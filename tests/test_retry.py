@@ -0,0 +1,139 @@
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from requests.exceptions import ConnectionError, HTTPError
+
+from pymatillion.backoff import Backoff
+from pymatillion.constants import CIRCUIT_CLOSED, CIRCUIT_HALF_OPEN, CIRCUIT_OPEN
+from pymatillion.exceptions import CircuitOpenError
+from pymatillion.matillion import MatillionClient
+from pymatillion.retry import CircuitBreaker, RetryPolicy, parse_retry_after
+
+DUMMY_URL = "https://fakematillioninstance.com"
+DUMMY_USERNAME = "fake_user"
+DUMMY_PASSWORD = "fake_pass"
+DUMMY_PROJECT_GROUP_NAME = "Sample_Project_Group"
+DUMMY_PROJECT_NAME = "Sample_Project_1"
+DUMMY_JOB_NAME = "Sample_Job_1"
+
+
+def make_response(status_code, json_content=None, headers=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.json.return_value = json_content
+    if status_code >= 400:
+        response.raise_for_status.side_effect = HTTPError(str(status_code))
+    return response
+
+
+class TestRetryPolicy(TestCase):
+    def test_parse_retry_after(self):
+        self.assertEqual(parse_retry_after("3"), 3.0)
+        self.assertEqual(parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT"), 0.0)
+        self.assertIsNone(parse_retry_after(None))
+        self.assertIsNone(parse_retry_after("soon"))
+
+    def test_should_retry(self):
+        policy = RetryPolicy(max_attempts=3)
+        self.assertTrue(policy.should_retry("get", 0, 503))
+        self.assertTrue(policy.should_retry("get", 1))
+        self.assertFalse(policy.should_retry("get", 2, 503))
+        self.assertFalse(policy.should_retry("get", 0, 404))
+        self.assertFalse(policy.should_retry("post", 0, 503))
+        self.assertTrue(RetryPolicy(methods=["POST"]).should_retry("post", 0, 503))
+
+    def test_delay(self):
+        policy = RetryPolicy(backoff=Backoff(initial=1, jitter=0))
+        self.assertEqual(policy.delay(2), 4)
+        self.assertEqual(policy.delay(2, "7"), 7)
+        policy.respect_retry_after = False
+        self.assertEqual(policy.delay(2, "7"), 4)
+
+
+class TestCircuitBreaker(TestCase):
+    @patch("pymatillion.retry.time.monotonic")
+    def test_transitions(self, mock_monotonic):
+        mock_monotonic.return_value = 0
+        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=10)
+        breaker.record_failure()
+        breaker.before_request()
+        breaker.record_failure()
+        self.assertEqual(breaker.state, CIRCUIT_OPEN)
+        with self.assertRaises(CircuitOpenError) as cm:
+            breaker.before_request()
+        self.assertEqual(cm.exception.retry_in, 10)
+
+        mock_monotonic.return_value = 10
+        self.assertEqual(breaker.state, CIRCUIT_HALF_OPEN)
+        breaker.before_request()
+        with self.assertRaises(CircuitOpenError):
+            breaker.before_request()
+        breaker.record_failure()
+        self.assertEqual(breaker.state, CIRCUIT_OPEN)
+
+        mock_monotonic.return_value = 20
+        breaker.before_request()
+        breaker.record_success()
+        self.assertEqual(breaker.state, CIRCUIT_CLOSED)
+        self.assertEqual(breaker.failures, 0)
+
+
+@patch("pymatillion.matillion.time.sleep")
+class TestClientRetries(TestCase):
+    client: MatillionClient
+
+    def setUp(self):
+        self.client = MatillionClient(
+            DUMMY_URL,
+            DUMMY_USERNAME,
+            DUMMY_PASSWORD,
+            DUMMY_PROJECT_GROUP_NAME,
+            DUMMY_PROJECT_NAME,
+            retry=RetryPolicy(max_attempts=3, backoff=Backoff(initial=1, jitter=0)),
+        )
+
+    @patch("pymatillion.matillion.requests.Session.get")
+    def test_get_is_retried(self, mock_get, mock_sleep):
+        mock_get.side_effect = [
+            make_response(503, headers={"Retry-After": "5"}),
+            ConnectionError("Connection reset"),
+            make_response(200, ["Sample_Job_1"]),
+        ]
+        self.assertListEqual(self.client.list_jobs(), ["Sample_Job_1"])
+        self.assertEqual(mock_get.call_count, 3)
+        self.assertListEqual([c.args[0] for c in mock_sleep.call_args_list], [5, 2])
+
+    @patch("pymatillion.matillion.requests.Session.get")
+    def test_get_gives_up(self, mock_get, mock_sleep):
+        mock_get.return_value = make_response(503)
+        with self.assertRaises(HTTPError):
+            self.client.list_jobs()
+        self.assertEqual(mock_get.call_count, 3)
+
+    @patch("pymatillion.matillion.requests.Session.get")
+    def test_client_errors_are_not_retried(self, mock_get, mock_sleep):
+        mock_get.return_value = make_response(404)
+        with self.assertRaises(HTTPError):
+            self.client.list_jobs()
+        self.assertEqual(mock_get.call_count, 1)
+        mock_sleep.assert_not_called()
+
+    @patch("pymatillion.matillion.requests.Session.post")
+    def test_post_is_not_retried(self, mock_post, mock_sleep):
+        mock_post.return_value = make_response(503)
+        with self.assertRaises(HTTPError):
+            self.client.run_job(DUMMY_JOB_NAME)
+        self.assertEqual(mock_post.call_count, 1)
+
+    @patch("pymatillion.matillion.requests.Session.get")
+    def test_circuit_breaker_fails_fast(self, mock_get, mock_sleep):
+        self.client.retry = None
+        self.client.circuit_breaker = CircuitBreaker(failure_threshold=2)
+        mock_get.side_effect = ConnectionError("Connection refused")
+        for _ in range(2):
+            with self.assertRaises(ConnectionError):
+                self.client.list_project_groups()
+        with self.assertRaises(CircuitOpenError):
+            self.client.list_project_groups()
+        self.assertEqual(mock_get.call_count, 2)
@@ -0,0 +1,166 @@
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from pymatillion.matillion import MatillionClient
+from pymatillion.router import (
+    AffinityPolicy,
+    LeastInFlightPolicy,
+    MatillionRouter,
+    RoundRobinPolicy,
+    RoutedTask,
+)
+
+DUMMY_USERNAME = "fake_user"
+DUMMY_PASSWORD = "fake_pass"
+DUMMY_PROJECT_GROUP_NAME = "Sample_Project_Group"
+DUMMY_PROJECT_NAME = "Sample_Project_1"
+DUMMY_JOB_NAME = "Sample_Job_1"
+
+
+def fake_client(first_task_id):
+    client = MagicMock(spec=MatillionClient)
+    task_ids = iter(range(first_task_id, first_task_id + 100))
+    client.run_job.side_effect = lambda *args: {"success": True, "id": next(task_ids)}
+    client.get_task_details.side_effect = lambda task_id, project_name=None: {
+        "id": task_id,
+        "state": "SUCCESS",
+    }
+    return client
+
+
+class TestMatillionRouter(TestCase):
+    def setUp(self):
+        self.instances = {"east": fake_client(1000), "west": fake_client(2000)}
+
+    def test_requires_instances(self):
+        with self.assertRaises(ValueError):
+            MatillionRouter({})
+
+    def test_round_robin(self):
+        router = MatillionRouter(self.instances, policy=RoundRobinPolicy())
+        task_ids = [router.run_job(DUMMY_JOB_NAME)["id"] for _ in range(4)]
+        self.assertEqual(task_ids, [1000, 2000, 1001, 2001])
+
+    def test_least_in_flight(self):
+        router = MatillionRouter(self.instances, policy=LeastInFlightPolicy())
+        router.run_job(DUMMY_JOB_NAME)
+        router.run_job(DUMMY_JOB_NAME)
+        self.assertEqual(router.in_flight, {"east": 1, "west": 1})
+
+        router.get_task_details(1000)
+        self.assertEqual(router.in_flight, {"east": 0, "west": 1})
+        self.assertEqual(router.run_job(DUMMY_JOB_NAME)["id"], 1001)
+
+    def test_affinity(self):
+        router = MatillionRouter(
+            self.instances, policy=AffinityPolicy({DUMMY_PROJECT_NAME: "west"})
+        )
+        self.assertEqual(
+            router.run_job(DUMMY_JOB_NAME, project_name=DUMMY_PROJECT_NAME)["id"], 2000
+        )
+        self.assertEqual(router.run_job(DUMMY_JOB_NAME)["id"], 1000)
+
+    def test_explicit_instance(self):
+        router = MatillionRouter(self.instances)
+        self.assertEqual(router.run_job(DUMMY_JOB_NAME, instance="west")["id"], 2000)
+        with self.assertRaises(ValueError):
+            router.run_job(DUMMY_JOB_NAME, instance="north")
+
+    def test_get_task_details_routes_to_launching_instance(self):
+        router = MatillionRouter(self.instances, policy=RoundRobinPolicy())
+        router.run_job(DUMMY_JOB_NAME)
+        router.run_job(DUMMY_JOB_NAME)
+        self.assertEqual(router.instance_for_task(2000), "west")
+
+        router.get_task_details(2000, project_name=DUMMY_PROJECT_NAME)
+        self.instances["west"].get_task_details.assert_called_once_with(
+            2000, project_name=DUMMY_PROJECT_NAME
+        )
+        self.instances["east"].get_task_details.assert_not_called()
+
+    def test_get_task_details_unknown_task(self):
+        router = MatillionRouter(self.instances)
+        with self.assertRaises(ValueError):
+            router.get_task_details(1)
+
+    def test_running_task_stays_tracked(self):
+        self.instances["east"].get_task_details.side_effect = None
+        self.instances["east"].get_task_details.return_value = {"state": "RUNNING"}
+        router = MatillionRouter(self.instances)
+        router.run_job(DUMMY_JOB_NAME)
+        router.get_task_details(1000)
+        self.assertEqual(router.instance_for_task(1000), "east")
+        self.assertEqual(router.in_flight["east"], 1)
+
+    def test_failed_launch_is_not_counted(self):
+        self.instances["east"].run_job.side_effect = ConnectionError("down")
+        router = MatillionRouter(self.instances)
+        with self.assertRaises(ConnectionError):
+            router.run_job(DUMMY_JOB_NAME)
+        self.assertEqual(router.in_flight, {"east": 0, "west": 0})
+
+    def test_rejected_launch_is_not_counted(self):
+        self.instances["east"].run_job.side_effect = [
+            {"success": False, "msg": "Job not found", "id": -1},
+            {"success": True},
+        ]
+        router = MatillionRouter(self.instances)
+        for _ in range(2):
+            router.run_job(DUMMY_JOB_NAME, instance="east")
+        self.assertEqual(router.in_flight, {"east": 0, "west": 0})
+        with self.assertRaises(ValueError):
+            router.instance_for_task(-1)
+
+    def test_same_task_id_on_two_instances(self):
+        self.instances["west"] = fake_client(1000)
+        self.instances["west"].get_task_details.side_effect = None
+        self.instances["west"].get_task_details.return_value = {"state": "RUNNING"}
+        router = MatillionRouter(self.instances, policy=RoundRobinPolicy())
+        responses = [router.run_job(DUMMY_JOB_NAME) for _ in range(2)]
+        self.assertEqual([response["id"] for response in responses], [1000, 1000])
+        self.assertEqual(
+            [RoutedTask.from_response(response) for response in responses],
+            [RoutedTask("east", 1000), RoutedTask("west", 1000)],
+        )
+        self.assertEqual(router.in_flight, {"east": 1, "west": 1})
+        with self.assertRaises(ValueError):
+            router.get_task_details(1000)
+
+        self.assertEqual(
+            router.get_task_details(RoutedTask("west", 1000))["state"], "RUNNING"
+        )
+        self.instances["east"].get_task_details.assert_not_called()
+        tasks = router.wait_for_tasks([RoutedTask("east", 1000)])
+        self.assertEqual(tasks[RoutedTask("east", 1000)]["state"], "SUCCESS")
+        self.assertEqual(router.in_flight, {"east": 0, "west": 1})
+        self.assertEqual(router.instance_for_task(1000), "west")
+
+    def test_run_jobs_and_wait_for_tasks(self):
+        router = MatillionRouter(self.instances, policy=RoundRobinPolicy())
+        results = list(router.run_jobs([(DUMMY_JOB_NAME,)] * 4, max_concurrency=2))
+        self.assertTrue(all(result.ok for result in results))
+
+        task_ids = [result.response["id"] for result in results]
+        tasks = router.wait_for_tasks(task_ids)
+        self.assertEqual(sorted(tasks), [1000, 1001, 2000, 2001])
+        self.assertEqual(router.in_flight, {"east": 0, "west": 0})
+
+    def test_from_configs(self):
+        router = MatillionRouter.from_configs(
+            {
+                "east": {"base_url": "https://east.example.com"},
+                "west": {"base_url": "https://west.example.com"},
+            },
+            username=DUMMY_USERNAME,
+            password=DUMMY_PASSWORD,
+            project_group_name=DUMMY_PROJECT_GROUP_NAME,
+        )
+        self.assertEqual(router.instance_names, ["east", "west"])
+        self.assertEqual(router.instances["west"].base_url, "https://west.example.com")
+        self.assertEqual(router.instances["east"].username, DUMMY_USERNAME)
+
+    def test_close(self):
+        with MatillionRouter(self.instances):
+            pass
+        for client in self.instances.values():
+            client.close.assert_called_once_with()
@@ -0,0 +1,161 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import IsolatedAsyncioTestCase, TestCase
+from unittest.mock import patch
+
+from requests.exceptions import HTTPError
+
+from pymatillion.matillion import MatillionClient
+from pymatillion.singleflight import AsyncSingleFlight, SingleFlight
+
+DUMMY_URL = "https://fakematillioninstance.com"
+DUMMY_USERNAME = "fake_user"
+DUMMY_PASSWORD = "fake_pass"
+DUMMY_PROJECT_GROUP_NAME = "Sample_Project_Group"
+DUMMY_PROJECT_NAME = "Sample_Project_1"
+DUMMY_TASK_ID = 12345
+
+CALLERS = 8
+
+
+def run_concurrently(fn, callers=CALLERS):
+    with ThreadPoolExecutor(max_workers=callers) as executor:
+        futures = [executor.submit(fn) for _ in range(callers)]
+        return [future.result() for future in futures]
+
+
+class Gate:
+    """Block the first call until every caller has joined the flight."""
+
+    def __init__(self, single_flight, callers=CALLERS):
+        self.single_flight = single_flight
+        self.callers = callers
+        self.calls = 0
+
+    def wait(self):
+        self.calls += 1
+        deadline = time.monotonic() + 5
+        while self.single_flight.shared < self.callers - 1:
+            if time.monotonic() > deadline:
+                raise AssertionError("Callers were not coalesced")
+            time.sleep(0.001)
+
+
+class TestSingleFlight(TestCase):
+    def test_concurrent_calls_are_shared(self):
+        single_flight = SingleFlight()
+        gate = Gate(single_flight)
+
+        def call():
+            gate.wait()
+            return object()
+
+        results = run_concurrently(lambda: single_flight.do("key", call))
+        self.assertEqual(gate.calls, 1)
+        self.assertEqual(len({id(result) for result in results}), 1)
+        self.assertEqual(
+            single_flight.stats, {"calls": 1, "shared": CALLERS - 1, "in_flight": 0}
+        )
+        # Nothing is kept once the call has returned.
+        self.assertIsNot(single_flight.do("key", object), results[0])
+
+    def test_errors_are_shared(self):
+        single_flight = SingleFlight()
+        gate = Gate(single_flight)
+
+        def call():
+            gate.wait()
+            raise HTTPError("Internal Server Error")
+
+        def do():
+            try:
+                single_flight.do("key", call)
+            except HTTPError as e:
+                return e
+
+        errors = run_concurrently(do)
+        self.assertEqual(gate.calls, 1)
+        self.assertTrue(all(isinstance(e, HTTPError) for e in errors))
+        self.assertEqual(single_flight.stats["in_flight"], 0)
+
+
+class TestClientSingleFlight(TestCase):
+    client: MatillionClient
+
+    def setUp(self):
+        self.single_flight = SingleFlight()
+        self.client = MatillionClient(
+            DUMMY_URL,
+            DUMMY_USERNAME,
+            DUMMY_PASSWORD,
+            DUMMY_PROJECT_GROUP_NAME,
+            DUMMY_PROJECT_NAME,
+            single_flight=self.single_flight,
+        )
+
+    @patch("pymatillion.matillion.requests.Session.get")
+    def test_get_requests_are_coalesced(self, mock_get):
+        gate = Gate(self.single_flight)
+
+        def get(url, **kwargs):
+            gate.wait()
+            return mock_get.return_value
+
+        mock_get.side_effect = get
+        mock_get.return_value.json.side_effect = lambda: {"id": DUMMY_TASK_ID}
+        results = run_concurrently(lambda: self.client.get_task_details(DUMMY_TASK_ID))
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertEqual(results, [{"id": DUMMY_TASK_ID}] * CALLERS)
+        # Callers decode the shared response separately.
+        self.assertEqual(len({id(result) for result in results}), CALLERS)
+
+    @patch("pymatillion.matillion.requests.Session.get")
+    def test_different_requests_are_not_coalesced(self, mock_get):
+        mock_get.return_value.json.return_value = {}
+        self.client.get_task_details(1)
+        self.client.get_task_details(2)
+        self.client.username = "other_user"
+        self.client.get_task_details(1)
+        self.assertEqual(mock_get.call_count, 3)
+        self.assertEqual(self.single_flight.stats["shared"], 0)
+
+    @patch("pymatillion.matillion.requests.Session.post")
+    def test_post_requests_are_not_coalesced(self, mock_post):
+        mock_post.return_value.json.return_value = {"success": True}
+        run_concurrently(lambda: self.client.run_job("Sample_Job_1"), callers=4)
+        self.assertEqual(mock_post.call_count, 4)
+        self.assertEqual(self.single_flight.stats["calls"], 0)
+
+
+class TestAsyncSingleFlight(IsolatedAsyncioTestCase):
+    async def test_concurrent_calls_are_shared(self):
+        single_flight = AsyncSingleFlight()
+        calls = []
+
+        async def call():
+            calls.append(None)
+            await asyncio.sleep(0.01)
+            return len(calls)
+
+        results = await asyncio.gather(
+            *(single_flight.do("key", call) for _ in range(CALLERS))
+        )
+        self.assertEqual(results, [1] * CALLERS)
+        self.assertEqual(
+            single_flight.stats, {"calls": 1, "shared": CALLERS - 1, "in_flight": 0}
+        )
+
+    async def test_cancelled_caller_does_not_cancel_others(self):
+        single_flight = AsyncSingleFlight()
+
+        async def call():
+            await asyncio.sleep(0.01)
+            return "done"
+
+        first = asyncio.ensure_future(single_flight.do("key", call))
+        second = asyncio.ensure_future(single_flight.do("key", call))
+        await asyncio.sleep(0)
+        first.cancel()
+        self.assertEqual(await second, "done")
+        self.assertTrue(first.cancelled())
@@ -0,0 +1,128 @@
+import json
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import patch
+
+from pymatillion.matillion import MatillionClient
+from pymatillion.models import ComponentResult
+from pymatillion.streaming import iter_json_array
+
+DUMMY_URL = "https://fakematillioninstance.com"
+DUMMY_USERNAME = "fake_user"
+DUMMY_PASSWORD = "fake_pass"
+DUMMY_PROJECT_GROUP_NAME = "Sample_Project_Group"
+DUMMY_PROJECT_NAME = "Sample_Project_1"
+DUMMY_TASK_ID = 12345
+
+
+PARENT_DIR = Path(__file__).parent
+
+
+def chunked(data: bytes, size: int):
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+class TestIterJsonArray(TestCase):
+    def test_top_level_array(self):
+        document = json.dumps([1, 22, 333, "a,]b", {"c": [1, 2]}, None, 4.5e3])
+        for size in [1, 2, 3, 7, 1000]:
+            self.assertListEqual(
+                list(iter_json_array(chunked(document.encode(), size))),
+                json.loads(document),
+            )
+
+    def test_nested_array(self):
+        document = {
+            "id": 1,
+            "message": 'quoted "tasks": [0]',
+            "other": {"tasks": [0]},
+            "list": [{"tasks": [0]}],
+            "täsks": [0],
+            "tasks": [{"name": "été ☃", "rows": 10}, {"name": "b"}],
+            "jobNames": ["x"],
+        }
+        data = json.dumps(document, ensure_ascii=False).encode()
+        for size in [1, 5, 1000]:
+            self.assertListEqual(
+                list(iter_json_array(chunked(data, size), ("tasks",))),
+                document["tasks"],
+            )
+
+    def test_empty_array(self):
+        self.assertListEqual(list(iter_json_array([b'{"tasks": [ ]}'], ["tasks"])), [])
+
+    def test_array_not_found(self):
+        with self.assertRaises(ValueError):
+            list(iter_json_array([b'{"tasks": {}}', b'{"tasks": []}'], ["tasks"]))
+
+    def test_truncated_document(self):
+        with self.assertRaises(ValueError):
+            list(iter_json_array([b"[1, 2, 3"]))
+        with self.assertRaises(ValueError):
+            list(iter_json_array([b"[1 2]"]))
+
+    def test_large_chunk_is_not_copied_per_item(self):
+        names = [f"Sample_Job_{i}" for i in range(10000)]
+        data = json.dumps(names).encode()
+        buffers = set()
+        raw_decode = json.JSONDecoder().raw_decode
+
+        def record_buffer(buffer, position):
+            buffers.add(id(buffer))
+            return raw_decode(buffer, position)
+
+        with patch("pymatillion.streaming._decoder") as mock_decoder:
+            mock_decoder.raw_decode.side_effect = record_buffer
+            self.assertListEqual(list(iter_json_array([data])), names)
+        self.assertEqual(len(buffers), 1)
+
+    def test_stops_after_array(self):
+        def chunks():
+            yield b'{"tasks": [1, 2], '
+            raise AssertionError("Read past the array")
+
+        self.assertListEqual(list(iter_json_array(chunks(), ["tasks"])), [1, 2])
+
+
+class TestClientStreaming(TestCase):
+    client: MatillionClient
+
+    def setUp(self):
+        self.client = MatillionClient(
+            DUMMY_URL,
+            DUMMY_USERNAME,
+            DUMMY_PASSWORD,
+            DUMMY_PROJECT_GROUP_NAME,
+            DUMMY_PROJECT_NAME,
+        )
+
+    @patch("pymatillion.matillion.requests.Session.get")
+    def test_iter_jobs(self, mock_get):
+        data = PARENT_DIR.joinpath("list_jobs_response.json").read_bytes()
+        mock_get.return_value.iter_content.return_value = chunked(data, 4)
+        jobs = self.client.iter_jobs()
+        self.assertTrue(mock_get.call_args.kwargs["stream"])
+        self.assertListEqual(list(jobs), json.loads(data))
+        mock_get.return_value.close.assert_called_once()
+
+    @patch("pymatillion.matillion.requests.Session.get")
+    def test_iter_task_components(self, mock_get):
+        data = PARENT_DIR.joinpath("task_detail_response.json").read_bytes()
+        mock_get.return_value.iter_content.return_value = chunked(data, 16)
+        components = list(self.client.iter_task_components(DUMMY_TASK_ID))
+        self.assertListEqual(components, json.loads(data)["tasks"])
+
+    @patch("pymatillion.matillion.requests.Session.get")
+    def test_iter_task_components_as_records(self, mock_get):
+        data = PARENT_DIR.joinpath("task_detail_response.json").read_bytes()
+        mock_get.return_value.iter_content.return_value = [data]
+        components = list(
+            self.client.iter_task_components(DUMMY_TASK_ID, as_records=True)
+        )
+        self.assertEqual(len(components), 1)
+        component = components[0]
+        self.assertIsInstance(component, ComponentResult)
+        self.assertEqual(component.component_name, "Start 0")
+        self.assertEqual(component.state, "SUCCESS")
+        self.assertEqual(component.duration, 0.002)
+        self.assertFalse(hasattr(component, "__dict__"))
@@ -0,0 +1,214 @@
+import json
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from pymatillion.constants import (
+    MANIFEST_FILE_NAME,
+    TRANSFER_EXPORTED,
+    TRANSFER_FAILED,
+    TRANSFER_IMPORTED,
+    TRANSFER_UNCHANGED,
+)
+from pymatillion.endpoints import EXPORT_JOB
+from pymatillion.matillion import MatillionClient
+from pymatillion.transfer import file_digest, job_file_name, load_manifest
+
+DUMMY_URL = "https://fakematillioninstance.com"
+DUMMY_USERNAME = "fake_user"
+DUMMY_PASSWORD = "fake_pass"
+DUMMY_PROJECT_GROUP_NAME = "Sample_Project_Group"
+DUMMY_PROJECT_NAME = "Sample_Project_1"
+DUMMY_JOB_NAME = "Sample_Job_1"
+DUMMY_EXPORT = {"objects": [{"info": {"name": DUMMY_JOB_NAME}}], "version": "1.47"}
+
+
+class FakeClient(MatillionClient):
+    """
+    Client serving job exports from a dictionary instead of a Matillion instance.
+    """
+
+    def __init__(self, exports):
+        super().__init__(
+            DUMMY_URL,
+            DUMMY_USERNAME,
+            DUMMY_PASSWORD,
+            DUMMY_PROJECT_GROUP_NAME,
+            DUMMY_PROJECT_NAME,
+        )
+        self.exports = exports
+        self.imported = []
+
+    def iter_jobs(self, project_name=None, version="default"):
+        return iter(self.exports)
+
+    def _api_request(self, route, *args, path=None, stream=False, **kwargs):
+        response = MagicMock()
+        if route is EXPORT_JOB:
+            content = self.exports[path["job"]]
+            if isinstance(content, Exception):
+                raise content
+            response.iter_content.return_value = [content[:5], content[5:]]
+        else:
+            self.imported.append(kwargs["data"].read())
+            response.json.return_value = {"success": True}
+        return response
+
+
+class TestTransfer(TestCase):
+    def setUp(self):
+        temporary_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+        self.directory = Path(temporary_directory.name)
+        self.exports = {"Job_A": b'{"job": "A"}', "Job_B": b'{"job": "B"}'}
+        self.client = FakeClient(self.exports)
+
+    def test_export_jobs(self):
+        results = self.client.export_jobs(self.directory)
+        self.assertEqual([result.status for result in results], [TRANSFER_EXPORTED] * 2)
+        self.assertEqual((self.directory / "Job_A.json").read_bytes(), b'{"job": "A"}')
+        manifest = load_manifest(self.directory / MANIFEST_FILE_NAME)
+        self.assertEqual(manifest["Job_B"], file_digest(self.directory / "Job_B.json"))
+        self.assertEqual(list(self.directory.glob("*.part")), [])
+
+    def test_export_skips_unchanged_jobs(self):
+        self.client.export_jobs(self.directory)
+        self.exports["Job_B"] = b'{"job": "B2"}'
+        statuses = {
+            result.job_name: result.status
+            for result in self.client.export_jobs(self.directory)
+        }
+        self.assertEqual(
+            statuses, {"Job_A": TRANSFER_UNCHANGED, "Job_B": TRANSFER_EXPORTED}
+        )
+        self.assertEqual((self.directory / "Job_B.json").read_bytes(), b'{"job": "B2"}')
+
+    def test_export_failure_is_reported(self):
+        self.client.export_jobs(self.directory)
+        self.exports["Job_A"] = ConnectionError("down")
+        results = self.client.export_jobs(self.directory)
+        self.assertEqual(results[0].status, TRANSFER_FAILED)
+        self.assertIsInstance(results[0].error, ConnectionError)
+        self.assertTrue(results[1].ok)
+        # The previous export of the failed job is kept.
+        self.assertIn("Job_A", load_manifest(self.directory / MANIFEST_FILE_NAME))
+        self.assertTrue((self.directory / "Job_A.json").exists())
+
+    def test_export_selected_jobs_keeps_manifest(self):
+        self.client.export_jobs(self.directory)
+        self.client.export_jobs(self.directory, job_names=["Job_A"])
+        manifest = load_manifest(self.directory / MANIFEST_FILE_NAME)
+        self.assertEqual(sorted(manifest), ["Job_A", "Job_B"])
+
+    def test_import_jobs(self):
+        self.client.export_jobs(self.directory)
+        results = self.client.import_jobs(self.directory, max_concurrency=1)
+        self.assertEqual([result.status for result in results], [TRANSFER_IMPORTED] * 2)
+        self.assertEqual(
+            sorted(self.client.imported), [b'{"job": "A"}', b'{"job": "B"}']
+        )
+
+    def test_import_skips_already_imported_jobs(self):
+        state_file = self.directory / "imported.json"
+        self.client.export_jobs(self.directory)
+        self.client.import_jobs(self.directory, state_file=state_file)
+
+        self.exports["Job_A"] = b'{"job": "A2"}'
+        self.client.export_jobs(self.directory)
+        self.client.imported.clear()
+        statuses = {
+            result.job_name: result.status
+            for result in self.client.import_jobs(self.directory, state_file=state_file)
+        }
+        self.assertEqual(
+            statuses, {"Job_A": TRANSFER_IMPORTED, "Job_B": TRANSFER_UNCHANGED}
+        )
+        self.assertEqual(self.client.imported, [b'{"job": "A2"}'])
+
+    def test_hostile_job_names_stay_in_directory(self):
+        self.exports.clear()
+        self.exports.update(
+            {
+                "../Escaped": b'{"job": "up"}',
+                "Folder/Job": b'{"job": "slash"}',
+                "manifest": b'{"job": "manifest"}',
+                "%2F": b'{"job": "percent"}',
+            }
+        )
+        export_directory = self.directory / "export"
+        results = self.client.export_jobs(export_directory)
+        self.assertTrue(all(result.ok for result in results))
+        self.assertEqual(
+            sorted(path.name for path in self.directory.iterdir()), ["export"]
+        )
+        self.assertEqual(
+            sorted(path.name for path in export_directory.iterdir()),
+            [
+                "%252F.json",
+                "%6Danifest.json",
+                "..%2FEscaped.json",
+                "Folder%2FJob.json",
+                MANIFEST_FILE_NAME,
+            ],
+        )
+
+        results = self.client.import_jobs(export_directory, max_concurrency=1)
+        self.assertEqual([result.status for result in results], [TRANSFER_IMPORTED] * 4)
+        self.assertEqual(sorted(self.client.imported), sorted(self.exports.values()))
+
+    def test_job_file_name(self):
+        self.assertEqual(job_file_name(DUMMY_JOB_NAME), f"{DUMMY_JOB_NAME}.json")
+        self.assertEqual(job_file_name("a\\b"), "a%5Cb.json")
+
+
+class TestClientTransfer(TestCase):
+    def setUp(self):
+        self.client = MatillionClient(
+            DUMMY_URL,
+            DUMMY_USERNAME,
+            DUMMY_PASSWORD,
+            DUMMY_PROJECT_GROUP_NAME,
+            DUMMY_PROJECT_NAME,
+        )
+        temporary_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+        self.directory = Path(temporary_directory.name)
+
+    @patch("pymatillion.matillion.requests.Session.get")
+    def test_export_job(self, mock_get):
+        mock_get.return_value.json.return_value = DUMMY_EXPORT
+        self.assertEqual(self.client.export_job(DUMMY_JOB_NAME), DUMMY_EXPORT)
+        self.assertTrue(
+            mock_get.call_args.args[0].endswith(
+                f"/version/name/default/job/name/{DUMMY_JOB_NAME}/export"
+            )
+        )
+
+    @patch("pymatillion.matillion.requests.Session.get")
+    def test_export_job_to_file(self, mock_get):
+        content = json.dumps(DUMMY_EXPORT).encode()
+        mock_get.return_value.iter_content.return_value = [content]
+        path = self.directory / "job.json"
+        digest = self.client.export_job_to_file(DUMMY_JOB_NAME, path)
+        self.assertEqual(path.read_bytes(), content)
+        self.assertEqual(digest, file_digest(path))
+        self.assertTrue(mock_get.call_args.kwargs["stream"])
+        mock_get.return_value.close.assert_called_once_with()
+
+    @patch("pymatillion.matillion.requests.Session.post")
+    def test_import_job_from_file(self, mock_post):
+        mock_post.return_value.json.return_value = {"success": True}
+        path = self.directory / "job.json"
+        path.write_text(json.dumps(DUMMY_EXPORT))
+        self.assertEqual(self.client.import_job(path), {"success": True})
+        kwargs = mock_post.call_args.kwargs
+        self.assertTrue(mock_post.call_args.args[0].endswith("/job/import"))
+        self.assertEqual(kwargs["headers"], {"Content-Type": "application/json"})
+        self.assertEqual(kwargs["data"].name, str(path))
+
+    @patch("pymatillion.matillion.requests.Session.post")
+    def test_import_job_from_dict(self, mock_post):
+        mock_post.return_value.json.return_value = {"success": True}
+        self.client.import_job(DUMMY_EXPORT)
+        self.assertEqual(mock_post.call_args.kwargs["json"], DUMMY_EXPORT)
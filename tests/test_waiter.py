@@ -0,0 +1,162 @@
+import queue
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from requests.exceptions import ConnectionError, HTTPError
+
+from pymatillion.backoff import Backoff
+from pymatillion.exceptions import TaskWaitTimeout
+from pymatillion.matillion import MatillionClient
+from pymatillion.waiter import is_terminal, iter_finished_tasks
+from tests.helpers import FakeClock, task_states
+
+DUMMY_URL = "https://fakematillioninstance.com"
+DUMMY_USERNAME = "fake_user"
+DUMMY_PASSWORD = "fake_pass"
+DUMMY_PROJECT_GROUP_NAME = "Sample_Project_Group"
+DUMMY_PROJECT_NAME = "Sample_Project_1"
+
+FAST_BACKOFF = Backoff(initial=0.001, maximum=0.005, jitter=0)
+
+
+class TestBackoff(TestCase):
+    def test_delay(self):
+        backoff = Backoff(initial=1, maximum=10, multiplier=2, jitter=0)
+        self.assertListEqual(
+            [backoff.delay(attempt) for attempt in range(6)], [1, 2, 4, 8, 10, 10]
+        )
+
+    def test_delay_with_jitter(self):
+        backoff = Backoff(initial=4, maximum=4, jitter=0.5)
+        for _ in range(100):
+            self.assertTrue(2 <= backoff.delay(3) <= 4)
+
+    def test_invalid_jitter(self):
+        with self.assertRaises(ValueError):
+            Backoff(jitter=2)
+
+
+class TestWaitForTasks(TestCase):
+    client: MatillionClient
+
+    def setUp(self):
+        self.client = MatillionClient(
+            DUMMY_URL,
+            DUMMY_USERNAME,
+            DUMMY_PASSWORD,
+            DUMMY_PROJECT_GROUP_NAME,
+            DUMMY_PROJECT_NAME,
+        )
+
+    def test_is_terminal(self):
+        self.assertTrue(is_terminal({"state": "SUCCESS"}))
+        self.assertTrue(is_terminal({"state": "FAILED"}))
+        self.assertFalse(is_terminal({"state": "RUNNING"}))
+        self.assertFalse(is_terminal({}))
+
+    @patch("pymatillion.matillion.MatillionClient.get_task_details")
+    def test_wait_for_task(self, mock_get_task_details):
+        mock_get_task_details.side_effect = task_states(
+            {1: ["QUEUED", "RUNNING", "RUNNING", "SUCCESS"]}
+        )
+        task = self.client.wait_for_task(1, backoff=FAST_BACKOFF)
+        self.assertEqual(task["state"], "SUCCESS")
+        self.assertEqual(mock_get_task_details.call_count, 4)
+
+    @patch("pymatillion.matillion.MatillionClient.get_task_details")
+    def test_wait_for_tasks(self, mock_get_task_details):
+        mock_get_task_details.side_effect = task_states(
+            {
+                1: ["RUNNING", "SUCCESS"],
+                2: ["RUNNING", "RUNNING", "RUNNING", "FAILED"],
+                3: ["CANCELLED"],
+            }
+        )
+        tasks = self.client.wait_for_tasks([1, 2, 3, 2], backoff=FAST_BACKOFF)
+        self.assertListEqual(list(tasks), [1, 2, 3])
+        self.assertEqual(tasks[1]["state"], "SUCCESS")
+        self.assertEqual(tasks[2]["state"], "FAILED")
+        self.assertEqual(tasks[3]["state"], "CANCELLED")
+        self.assertEqual(mock_get_task_details.call_count, 7)
+
+    @patch("pymatillion.matillion.MatillionClient.get_task_details")
+    def test_wait_for_tasks_timeout(self, mock_get_task_details):
+        mock_get_task_details.side_effect = task_states(
+            {1: ["SUCCESS"], 2: ["RUNNING"]}
+        )
+        with self.assertRaises(TaskWaitTimeout) as cm:
+            self.client.wait_for_tasks([1, 2], timeout=0.05, backoff=FAST_BACKOFF)
+        self.assertListEqual(cm.exception.pending, [2])
+        self.assertListEqual(list(cm.exception.completed), [1])
+
+    @patch("pymatillion.matillion.MatillionClient.get_task_details")
+    def test_transient_errors_are_retried(self, mock_get_task_details):
+        states = task_states({1: ["RUNNING", "SUCCESS"], 2: ["SUCCESS"]})
+        errors = [ConnectionError("Connection reset"), HTTPError(response=MagicMock())]
+        errors[1].response.status_code = 503
+
+        def get_task_details(task_id, project_name=None):
+            if task_id == 1 and errors:
+                raise errors.pop(0)
+            return states(task_id, project_name)
+
+        mock_get_task_details.side_effect = get_task_details
+        with self.assertLogs("pymatillion.waiter", "WARNING"):
+            tasks = self.client.wait_for_tasks([1, 2], backoff=FAST_BACKOFF)
+        self.assertEqual(tasks[1]["state"], "SUCCESS")
+        self.assertEqual(tasks[2]["state"], "SUCCESS")
+        self.assertEqual(mock_get_task_details.call_count, 5)
+
+    @patch("pymatillion.matillion.MatillionClient.get_task_details")
+    def test_client_errors_are_raised(self, mock_get_task_details):
+        error = HTTPError(response=MagicMock(status_code=404))
+        mock_get_task_details.side_effect = error
+        with self.assertRaises(HTTPError):
+            self.client.wait_for_task(1, backoff=FAST_BACKOFF)
+        self.assertEqual(mock_get_task_details.call_count, 1)
+
+    @patch("pymatillion.matillion.MatillionClient.get_task_details")
+    def test_timeout_after_errors_keeps_completed_tasks(self, mock_get_task_details):
+        states = task_states({1: ["SUCCESS"]})
+
+        def get_task_details(task_id, project_name=None):
+            if task_id == 2:
+                raise ConnectionError("Connection refused")
+            return states(task_id, project_name)
+
+        mock_get_task_details.side_effect = get_task_details
+        finished = []
+        with self.assertLogs("pymatillion.waiter", "WARNING"):
+            with self.assertRaises(TaskWaitTimeout) as cm:
+                for task_id, task in iter_finished_tasks(
+                    self.client, [1, 2], timeout=0.05, backoff=FAST_BACKOFF
+                ):
+                    finished.append(task_id)
+        self.assertListEqual(finished, [1])
+        self.assertListEqual(cm.exception.pending, [2])
+        self.assertListEqual(list(cm.exception.completed), [1])
+
+    @patch("pymatillion.waiter.time", new_callable=FakeClock)
+    @patch("pymatillion.matillion.MatillionClient.get_task_details")
+    def test_backoff_resets_on_state_change(self, mock_get_task_details, clock):
+        mock_get_task_details.side_effect = task_states(
+            {1: ["QUEUED", "QUEUED", "QUEUED", "RUNNING", "SUCCESS"]}
+        )
+        backoff = Backoff(initial=1, maximum=100, multiplier=10, jitter=0)
+        self.client.wait_for_task(1, backoff=backoff)
+        self.assertListEqual(clock.sleeps, [1, 10, 100, 1])
+
+    @patch("pymatillion.matillion.MatillionClient.get_task_details")
+    def test_new_tasks(self, mock_get_task_details):
+        mock_get_task_details.side_effect = task_states(
+            {1: ["RUNNING", "SUCCESS"], 2: ["SUCCESS"]}
+        )
+        new_tasks = queue.Queue()
+        new_tasks.put(2)
+        finished = iter_finished_tasks(
+            self.client, [1], backoff=FAST_BACKOFF, new_tasks=new_tasks
+        )
+        self.assertEqual([task_id for task_id, _ in [next(finished)]], [2])
+        new_tasks.put(1)
+        new_tasks.put(None)
+        self.assertEqual([task_id for task_id, _ in finished], [1])
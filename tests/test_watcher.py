@@ -0,0 +1,282 @@
+import asyncio
+import json
+from unittest import IsolatedAsyncioTestCase, TestCase
+from unittest.mock import MagicMock, patch
+
+from requests.exceptions import ConnectionError, HTTPError
+
+from pymatillion.backoff import Backoff
+from pymatillion.matillion import MatillionClient
+from pymatillion.watcher import TaskWatcher
+from tests.helpers import FakeClock, task_states
+
+DUMMY_URL = "https://fakematillioninstance.com"
+DUMMY_USERNAME = "fake_user"
+DUMMY_PASSWORD = "fake_pass"
+DUMMY_PROJECT_GROUP_NAME = "Sample_Project_Group"
+DUMMY_PROJECT_NAME = "Sample_Project_1"
+
+NO_BACKOFF = Backoff(initial=0, maximum=0, jitter=0)
+
+
+def running_tasks(rounds):
+    """Build a list_running_tasks side effect returning the given IDs per round."""
+    remaining = list(rounds)
+
+    def list_running_tasks(project_name=None):
+        task_ids = remaining.pop(0) if len(remaining) > 1 else remaining[0]
+        return [{"id": task_id, "state": "RUNNING"} for task_id in task_ids]
+
+    return list_running_tasks
+
+
+def transitions(events):
+    return [(e.task_id, e.previous_state, e.state) for e in events]
+
+
+class TestWatchTasks(TestCase):
+    client: MatillionClient
+
+    def setUp(self):
+        self.client = MatillionClient(
+            DUMMY_URL,
+            DUMMY_USERNAME,
+            DUMMY_PASSWORD,
+            DUMMY_PROJECT_GROUP_NAME,
+            DUMMY_PROJECT_NAME,
+        )
+
+    @patch("pymatillion.matillion.MatillionClient.get_task_details")
+    def test_watch_task_ids(self, mock_get_task_details):
+        mock_get_task_details.side_effect = task_states(
+            {
+                1: ["QUEUED", "RUNNING", "RUNNING", "SUCCESS"],
+                2: ["RUNNING", "RUNNING", "FAILED"],
+            }
+        )
+        events = list(self.client.watch_tasks([1, 2, 1], backoff=NO_BACKOFF))
+        self.assertEqual(
+            transitions(events),
+            [
+                (1, None, "QUEUED"),
+                (2, None, "RUNNING"),
+                (1, "QUEUED", "RUNNING"),
+                (2, "RUNNING", "FAILED"),
+                (1, "RUNNING", "SUCCESS"),
+            ],
+        )
+        self.assertTrue(events[-1].is_finished)
+        # Finished tasks are no longer polled.
+        self.assertEqual(mock_get_task_details.call_count, 7)
+
+    @patch("pymatillion.watcher.time", new_callable=FakeClock)
+    @patch("pymatillion.matillion.MatillionClient.get_task_details")
+    def test_backoff_restarts_after_events(self, mock_get_task_details, clock):
+        mock_get_task_details.side_effect = task_states(
+            {1: ["RUNNING", "RUNNING", "RUNNING", "CANCELLED"]}
+        )
+        backoff = Backoff(initial=1, maximum=8, jitter=0)
+        list(self.client.watch_tasks([1], backoff=backoff))
+        self.assertEqual(clock.sleeps, [1, 2, 4])
+
+    @patch("pymatillion.watcher.time", new_callable=FakeClock)
+    @patch("pymatillion.matillion.MatillionClient.get_task_details")
+    def test_timeout(self, mock_get_task_details, clock):
+        mock_get_task_details.side_effect = task_states({1: ["RUNNING"]})
+        backoff = Backoff(initial=1, maximum=1, jitter=0)
+        events = list(self.client.watch_tasks([1], backoff=backoff, timeout=2.5))
+        self.assertEqual(transitions(events), [(1, None, "RUNNING")])
+        self.assertEqual(clock.sleeps, [1, 1, 0.5])
+
+    @patch("pymatillion.matillion.MatillionClient.get_task_details")
+    def test_resume_from_cursor(self, mock_get_task_details):
+        mock_get_task_details.side_effect = task_states(
+            {1: ["RUNNING", "SUCCESS"], 2: ["RUNNING", "RUNNING", "SUCCESS"]}
+        )
+        watcher = self.client.watch_tasks([1, 2], backoff=NO_BACKOFF)
+        events = iter(watcher)
+        self.assertEqual(transitions([next(events)]), [(1, None, "RUNNING")])
+        # The cursor only covers events handed out so far.
+        cursor = json.loads(json.dumps(watcher.cursor))
+        self.assertEqual(cursor, {"states": {"1": "RUNNING"}})
+        events.close()
+
+        resumed = self.client.watch_tasks([1, 2], cursor=cursor, backoff=NO_BACKOFF)
+        self.assertEqual(
+            transitions(resumed),
+            [
+                (1, "RUNNING", "SUCCESS"),
+                (2, None, "RUNNING"),
+                (2, "RUNNING", "SUCCESS"),
+            ],
+        )
+
+    @patch("pymatillion.matillion.MatillionClient.get_task_details")
+    def test_resume_skips_finished_tasks(self, mock_get_task_details):
+        watcher = self.client.watch_tasks(
+            [1], cursor={"states": {"1": "SUCCESS"}}, backoff=NO_BACKOFF
+        )
+        self.assertEqual(list(watcher), [])
+        mock_get_task_details.assert_not_called()
+
+    @patch("pymatillion.matillion.MatillionClient.get_task_details")
+    @patch("pymatillion.matillion.MatillionClient.list_running_tasks")
+    def test_watch_project(self, mock_list_running_tasks, mock_get_task_details):
+        mock_list_running_tasks.side_effect = running_tasks([[1], [1, 2], [2], []])
+        mock_get_task_details.side_effect = task_states({1: ["SUCCESS"], 2: ["FAILED"]})
+        watcher = self.client.watch_tasks(backoff=NO_BACKOFF)
+        events = []
+        for event in watcher:
+            events.append(event)
+            if len(events) == 4:
+                break
+        self.assertEqual(
+            transitions(events),
+            [
+                (1, None, "RUNNING"),
+                (2, None, "RUNNING"),
+                (1, "RUNNING", "SUCCESS"),
+                (2, "RUNNING", "FAILED"),
+            ],
+        )
+        # Only tasks that stopped running are fetched individually.
+        self.assertEqual(
+            [call.args[0] for call in mock_get_task_details.call_args_list], [1, 2]
+        )
+        self.assertEqual(watcher.cursor, {"states": {}})
+
+    @patch("pymatillion.matillion.MatillionClient.get_task_details")
+    def test_transient_errors_are_retried(self, mock_get_task_details):
+        states = task_states({1: ["RUNNING", "SUCCESS"], 2: ["SUCCESS"]})
+        errors = [ConnectionError("Connection reset"), HTTPError(response=MagicMock())]
+        errors[1].response.status_code = 503
+
+        def get_task_details(task_id, project_name=None):
+            if task_id == 1 and errors:
+                raise errors.pop(0)
+            return states(task_id, project_name)
+
+        mock_get_task_details.side_effect = get_task_details
+        with self.assertLogs("pymatillion.watcher", "WARNING"):
+            events = list(self.client.watch_tasks([1, 2], backoff=NO_BACKOFF))
+        self.assertEqual(
+            transitions(events),
+            [(2, None, "SUCCESS"), (1, None, "RUNNING"), (1, "RUNNING", "SUCCESS")],
+        )
+
+    @patch("pymatillion.matillion.MatillionClient.get_task_details")
+    def test_client_errors_are_raised(self, mock_get_task_details):
+        mock_get_task_details.side_effect = HTTPError(
+            response=MagicMock(status_code=404)
+        )
+        with self.assertRaises(HTTPError):
+            list(self.client.watch_tasks([1], backoff=NO_BACKOFF))
+
+    @patch("pymatillion.matillion.MatillionClient.get_task_details")
+    @patch("pymatillion.matillion.MatillionClient.list_running_tasks")
+    def test_failed_listing_is_retried(
+        self, mock_list_running_tasks, mock_get_task_details
+    ):
+        listing = running_tasks([[1], [1], []])
+        failures = [None, ConnectionError("Connection reset"), None, None]
+
+        def list_running_tasks(project_name=None):
+            failure = failures.pop(0)
+            if failure is not None:
+                raise failure
+            return listing(project_name)
+
+        mock_list_running_tasks.side_effect = list_running_tasks
+        mock_get_task_details.side_effect = task_states({1: ["SUCCESS"]})
+        events = []
+        with self.assertLogs("pymatillion.watcher", "WARNING"):
+            for event in self.client.watch_tasks(backoff=NO_BACKOFF):
+                events.append(event)
+                if event.is_finished:
+                    break
+        self.assertEqual(
+            transitions(events), [(1, None, "RUNNING"), (1, "RUNNING", "SUCCESS")]
+        )
+        self.assertEqual(mock_get_task_details.call_count, 1)
+
+    @patch("pymatillion.matillion.requests.Session.get")
+    def test_list_running_tasks(self, mock_get):
+        mock_get.return_value.json.return_value = [{"id": 1, "state": "RUNNING"}]
+        self.assertEqual(
+            self.client.list_running_tasks(), [{"id": 1, "state": "RUNNING"}]
+        )
+        self.assertTrue(
+            mock_get.call_args.args[0].endswith(
+                f"/project/name/{DUMMY_PROJECT_NAME}/task/running"
+            )
+        )
+
+
+class FakeAsyncClient:
+    def __init__(self, states, running=None):
+        self._get_task_details = task_states(states)
+        self._list_running_tasks = running_tasks(running or [[]])
+
+    async def get_task_details(self, task_id, project_name=None):
+        return self._get_task_details(task_id, project_name)
+
+    async def list_running_tasks(self, project_name=None):
+        return self._list_running_tasks(project_name)
+
+
+class TestAsyncWatchTasks(IsolatedAsyncioTestCase):
+    async def test_watch_task_ids(self):
+        client = FakeAsyncClient({1: ["RUNNING", "SUCCESS"], 2: ["FAILED"]})
+        watcher = TaskWatcher(client, [1, 2], backoff=NO_BACKOFF)
+        events = [event async for event in watcher]
+        self.assertEqual(
+            transitions(events),
+            [(1, None, "RUNNING"), (2, None, "FAILED"), (1, "RUNNING", "SUCCESS")],
+        )
+
+    async def test_watch_project(self):
+        client = FakeAsyncClient({1: ["SUCCESS"]}, running=[[1], []])
+        events = []
+        async for event in TaskWatcher(client, backoff=NO_BACKOFF):
+            events.append(event)
+            if event.is_finished:
+                break
+        self.assertEqual(
+            transitions(events), [(1, None, "RUNNING"), (1, "RUNNING", "SUCCESS")]
+        )
+
+    async def test_max_concurrency(self):
+        client = FakeAsyncClient({task_id: ["SUCCESS"] for task_id in range(10)})
+        in_flight = peak = 0
+        get_task_details = client.get_task_details
+
+        async def counted(task_id, project_name=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return await get_task_details(task_id, project_name)
+
+        client.get_task_details = counted
+        watcher = TaskWatcher(client, range(10), backoff=NO_BACKOFF, max_concurrency=3)
+        events = [event async for event in watcher]
+        self.assertEqual(len(events), 10)
+        self.assertEqual(peak, 3)
+
+    async def test_transient_errors_are_retried(self):
+        client = FakeAsyncClient({1: ["SUCCESS"]})
+        errors = [asyncio.TimeoutError()]
+        get_task_details = client.get_task_details
+
+        async def flaky(task_id, project_name=None):
+            if errors:
+                raise errors.pop()
+            return await get_task_details(task_id, project_name)
+
+        client.get_task_details = flaky
+        with self.assertLogs("pymatillion.watcher", "WARNING"):
+            events = [
+                event async for event in TaskWatcher(client, [1], backoff=NO_BACKOFF)
+            ]
+        self.assertEqual(transitions(events), [(1, None, "SUCCESS")])